@@ -1,572 +1,93 @@
-from pathlib import Path
+import os
+import asyncio
 import logging
-from typing import List, Tuple, Dict, Optional
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Optional
 
 import discord
 from discord import app_commands
 from discord import ui
 from discord import Interaction, SelectOption
 from discord.ext import commands
-from discord.utils import get
+from discord.utils import get, utcnow
 
-import pandas as pd
-import spacy
-from spacy.tokens import Doc, Token
-from text_to_num import text2num
-import requests
-from bs4 import BeautifulSoup
+from lynkr.admission import AdmissionQueue, JobCancelled, QueueFull, RateLimited
+from lynkr.client import LynkrClient, LynkrServiceError, SynonymableToken
 
-# Chemin vers le dossier principal du projet
-MAIN_FOLDER = Path(__file__).parent.parent.resolve()
 
-# Dictionnaire de traduction Commun -> Lynkr
-LYNKR_SERIES = {"GRAMNUM": pd.read_csv(MAIN_FOLDER / "assets/texts/csv/lynkr/adj-noun-propn.csv").astype(
-    pd.StringDtype("pyarrow")).set_index("lemma").squeeze(),
-                "GRAMCONJ": pd.read_csv(MAIN_FOLDER / "assets/texts/csv/lynkr/verb-aux.csv").astype(
-                    pd.StringDtype("pyarrow")).set_index("lemma").squeeze(),
-                "X": pd.read_csv(MAIN_FOLDER / "assets/texts/csv/lynkr/other.csv").astype(
-                    pd.StringDtype("pyarrow")).set_index("lemma").squeeze()}
-# Faire la chasse aux adjectifs possessifs (màj : wtf, pourquoi j'ai écrit ça ???)
+# Durée de validité du jeton d'une interaction Discord
+INTERACTION_LIFETIME = timedelta(minutes=15)
+# Longueur maximale d'un texte court, prioritaire dans la file de traduction
+SHORT_TEXT_LENGTH = 200
+# Longueur maximale d'un message Discord
+MESSAGE_LENGTH = 2000
+# Nombre de réponses du salon de traduction automatique mémorisées, pour les modifier en place
+AUTO_REPLIES_SIZE = 1000
 
-# Chemin vers le fichier de mémoire
-MEMORY_PATH = MAIN_FOLDER / "assets/texts/csv/lynkr/memory.csv"
+# Configuration du logger de la cog
+logger = logging.getLogger("cogs.lynkr")
 
-# Modèle de langage pré-entrainé Spacy pour le français
-NLP = spacy.load("fr_core_news_lg")
 
-# Configuration du logger pour Spacy
-logger = logging.getLogger("spacy")
-logger.setLevel(logging.ERROR)
+# Sous-fonction des classes `SynonymSelect`, `SynonymButton` et de la cog `Lynkr`
+def format_synonym(lemma: str, synonym: str, confidence: Optional[float] = None) -> str:
+    """Fonction pour formater une paire (mot, synonyme) dans le champ "Synonymes" d'une intégration.
 
-
-# Getter de la propriété personnalisée `lynkr_tag` pour les tokens Spacy
-def lynkr_tag_getter(token: Token) -> str:
-    """Fonction pour obtenir le tag Lynkr d'un token donné.
-
-    :param token: Le token Spacy pour lequel le tag Lynkr doit être obtenu.
-    :return: Le tag Lynkr pour le token donné.
-    """
-    # Si le token est un adjectif, un nom ou un nom propre, attribuer le tag Lynkr "GRAMNUM" (accord en nombre)
-    if token.pos_ in ("ADJ", "NOUN", "PROPN"):
-        return "GRAMNUM"
-    # Si le token est un auxiliaire ou un verbe, attribuer le tag Lynkr "GRAMCONJ" (conjugaison en temps)
-    elif token.pos_ in ("AUX", "VERB"):
-        return "GRAMCONJ"
-    # Si le token est un numéral, attribuer le tag Lynkr "NUM"
-    # Si le token est une ponctuation, attribuer le tag Lynkr "PUNCT"
-    elif token.pos_ in ("NUM", "PUNCT"):
-        return token.pos_
-    # Si le token est une particule de négation "ne" ou "pas", oattribuer le tag Lynkr "PART"
-    elif token.pos_ == "ADV" and token.lemma_ in ("ne", "pas"):
-        return "PART"
-    # Sinon, attribuer le tag Lynkr "X"
-    else:
-        return "X"
-
-
-# Application de la propriété `lynkr_tag` aux tokens Spacy
-Token.set_extension("lynkr_tag", getter=lynkr_tag_getter)
-
-
-# Getter de la propriété personnalisée `lynkr_compatible_synonyms` pour les tokens Spacy
-def lynkr_compatible_synonyms_getter(token: Token) -> Tuple[str] | Tuple:
-    """Fonction pour obtenir les synonymes traduisibles en Lynkr d'un token donné.
-
-    :param token: Le token Spacy pour lequel les synonymes traduisibles en Lynkr doivent être obtenus.
-    :return: Un tuple contenant les synonymes traduisibles en Lynkr pour le token donné.
-    """
-    # Si le token est un nom propre, une ponctuation ou un symbole, il n'a pas de synonymes traduisibles Lynkr
-    if token.pos_ in ("PROPN", "PUNCT", "SYM"):
-        return ()
-
-    # Si le token est un adjectif, rechercher dans le répertoire "adjectif"
-    elif token.pos_ == "ADJ":
-        directory = "adjectif"
-    # Si le token est un nom, rechercher dans le répertoire "substantif"
-    elif token.pos_ == "NOUN":
-        directory = "substantif"
-    # Si le token est un auxiliaire ou un verbe, rechercher dans le répertoire "verbe"
-    elif token.pos_ in ("AUX", "VERB"):
-        directory = "verbe"
-    # Si le token est un adverbe, rechercher dans le répertoire "adverbe"
-    elif token.pos_ == "ADV":
-        directory = "adverbe"
-    # Si le token est une interjection, rechercher dans le répertoire "interjection"
-    elif token.pos_ == "INTJ":
-        directory = "interjection"
-    # Sinon, rechercher dans tous les répertoires
-    else:
-        directory = ""
-
-    # Récupération de la page de synonymes sur le site du CNRTL
-    response = requests.get(f"https://www.cnrtl.fr/synonymie/{token.lemma_}/{directory}")
-    soup = BeautifulSoup(response.content, "html.parser")
-
-    # Extraction des synonymes de la page
-    synonyms = map(lambda x: x.a.text, soup.find_all("td", attrs={"class": "syno_format"}))
-
-    # Filtrage des synonymes pour ne conserver que ceux traduisibles en Lynkr
-    translatable = frozenset(LYNKR_SERIES[
-                                 token._.lynkr_tag].index.to_list())  # Je peux peut-être passer directement d'un
-    # index à un frozenset, sans passer par la méthode `to_list`.
-    synonyms = filter(lambda x: x in translatable, synonyms)
-
-    return tuple(synonyms)
-
-
-# Application de la propriété `lynkr_compatible_synonyms` aux tokens Spacy
-Token.set_extension("lynkr_compatible_synonyms", getter=lynkr_compatible_synonyms_getter)
-# Application de l'attribut `lynkr_applied_synonym` aux tokens Spacy
-Token.set_extension("lynkr_applied_synonym", default=None)
-
-
-# Sous-fonction de la fonction `lynkr_lemma_translation_getter`
-def lynkr_lemma_translation_default(token: Token) -> Optional[str]:
-    """Fonction pour obtenir la traduction du lemme en Lynkr d'un token avec le tag Lynkr `GRAMNUM`, `GRAMCONJ` ou `X`.
-
-    :param token: Le token Spacy pour lequel la traduction du lemme en Lynkr doit être obtenue.
-    :return: La traduction du lemme en Lynkr pour le token donné.
-    """
-    # Sélection de la série correspondant au tag Lynkr du token
-    series = LYNKR_SERIES[token._.lynkr_tag]
-
-    # Récupération des termes traduisibles Lynkr
-    translatable = frozenset(series.index.to_list())
-    # Si le lemme du token est traduisible, renvoyer sa traduction correspondante
-    if token.lemma_ in translatable:
-        return series[token.lemma_]
-
-
-# Sous-fonction de la fonction `lynkr_lemma_translation_getter`
-def lynkr_lemma_translation_num(token: Token) -> Optional[str]:
-    """Fonction pour obtenir la traduction en Lynkr d'un token avec le tag Lynkr `NUM`.
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être obtenue.
-    :return: La traduction en Lynkr pour le token donné.
-    """
-    # Si le token est écrit en chiffres, renvoyer son texte tel quel
-    if "d" in token.shape_:
-        return token.text
-
-    # Sinon, essayer de convertir l'écriture du token en chiffres
-    else:
-        try:
-            text_as_num = text2num(token.text, lang="fr", relaxed=True)
-        except ValueError:
-            pass
-        else:
-            return str(text_as_num)  # Implémenter une fonction num2text, pour retrouver une écriture en lettres
-
-
-# Sous-fonction de la fonction `lynkr_lemma_translation_getter`
-def lynkr_lemma_translation_punct(token: Token) -> str:
-    """Fonction pour obtenir la traduction en Lynkr d'un token avec le tag Lynkr `PUNCT`.
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être obtenue.
-    :return: La traduction en Lynkr pour le token donné.
-    """
-    return token.text
-
-
-# Sous-fonction de la fonction `lynkr_lemma_translation_getter`
-def lynkr_lemma_translation_part() -> str:
-    """Fonction pour obtenir la traduction en Lynkr d'un token avec le tag Lynkr `PART`.
-
-    :return: La traduction en Lynkr d'un token avec le tag Lynkr `PART`.
-    """
-    return ""
-
-
-# Getter de la propriété personnalisée `lynkr_lemma_translation` pour les tokens Spacy
-def lynkr_lemma_translation_getter(token: Token) -> Optional[str]:
-    """Fonction pour obtenir la traduction du lemme en Lynkr d'un token donné.
-
-    :param token: Le token Spacy pour lequel la traduction du lemme en Lynkr doit être obtenue.
-    :return: La traduction du lemme en Lynkr pour le token donné.
-    """
-    # Si le tag Lynkr du token est parmi "GRAMNUM", "GRAMCONJ" ou "X", obtenir la traduction par défaut
-    if token._.lynkr_tag in ("GRAMNUM", "GRAMCONJ", "X"):
-        return lynkr_lemma_translation_default(token)
-    # Si le tag Lynkr du token est "NUM", obtenir la traduction numérale
-    elif token._.lynkr_tag == "NUM":
-        return lynkr_lemma_translation_num(token)
-    # Si le tag Lynkr du token est "PUNCT", obtenir la traduction de ponctuation
-    elif token._.lynkr_tag == "PUNCT":
-        return lynkr_lemma_translation_punct(token)
-    # Si le tag Lynkr du token est "PART", obtenir la traduction de particule
-    elif token._.lynkr_tag == "PART":
-        return lynkr_lemma_translation_part()
-
-
-# Application de la propriété `lynkr_lemma_translation` aux tokens Spacy
-Token.set_extension("lynkr_lemma_translation", getter=lynkr_lemma_translation_getter)
-
-
-# Sous-fonction de la fonction `lynkr_translation_method`
-def complete_lynkr_translation_gramnum(token: Token, lynkr: Optional[str] = None) -> Optional[str]:
-    """Fonction pour compléter la traduction en Lynkr d'un token avec le tag Lynkr `GRAMNUM`.
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être complétée.
-    :param lynkr: La traduction actuelle du token en Lynkr.
-    :return: La traduction complétée du token en Lynkr.
-    """
-    # Si aucune traduction n'est fournie, utiliser la traduction du lemme du token
-    if lynkr is None:
-        translation = token._.lynkr_lemma_translation
-    else:
-        translation = lynkr
-
-    # Si une traduction est disponible :
-    if translation is not None:
-        # Vérifier si le token est au pluriel et, si sa traduction ne se termine pas déjà par un "s", en ajouter un
-        number = token.morph.to_dict()["Number"]
-        if (number == "Plur") and (translation[-1] != "s"):
-            return f"{translation}s"
-        else:
-            return translation
-
-
-# Sous-fonction de la fonction `lynkr_translation_method`
-def complete_lynkr_translation_gramconj(token: Token, lynkr: Optional[str] = None) -> Optional[str]:
-    """Fonction pour compléter la traduction en Lynkr d'un token avec le tag Lynkr `GRAMCONJ`.
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être complétée.
-    :param lynkr: La traduction actuelle du token en Lynkr.
-    :return: La traduction complétée du token en Lynkr.
-    """
-    # Si aucune traduction n'est fournie, utiliser la traduction du lemme du token
-    if lynkr is None:
-        translation = token._.lynkr_lemma_translation
-    else:
-        translation = lynkr
-
-    # Si une traduction est disponible :
-    if translation is not None:
-
-        # Déterminer la polarité du verbe en examinant les deux tokens précédents
-        polarity = ""
-        for i in range(-1, -3, -1):
-            try:
-                prev_token = token.nbor(i)
-            except IndexError:
-                break
-            else:
-                if prev_token.lemma_ == "ne":
-                    polarity = "fran-"
-                    break
-
-        # Si le verbe n'est ni "mourir" ni "vivre" :
-        if token.lemma_ not in ("mourir", "vivre"):
-
-            # Déterminer le temps du verbe et le conjuguer en conséquence
-            tense = token.morph.to_dict()["Tense"]
-            if tense == "Pres":
-                return f"{polarity}{translation[:-1]}"
-            elif tense == "Past":
-                return f"{polarity}{translation[:-1]}p"
-            elif tense == "Fut":
-                return f"{polarity}{translation[:-1]}f"
-
-        return f"{polarity}{translation}"
-
-
-# Sous-fonction de la fonction `lynkr_translation_method`
-def complete_lynkr_translation_x(token: Token, lynkr: Optional[str] = None) -> Optional[str]:
-    """Fonction pour compléter la traduction en Lynkr d'un token avec le tag Lynkr `X`.
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être complétée.
-    :param lynkr: La traduction actuelle du token en Lynkr.
-    :return: La traduction complétée du token en Lynkr.
-    """
-    # Si aucune traduction n'est fournie, utiliser la traduction du lemme du token
-    if lynkr is None:
-        translation = token._.lynkr_lemma_translation
-    else:
-        translation = lynkr
-
-    # Si une traduction est disponible, la renvoyer
-    if translation is not None:
-        return translation
-
-
-# Méthode personnalisée `lynkr_translation` pour les tokens Spacy
-def lynkr_translation_method(token: Token, synonym: Optional[str] = None) -> Optional[str]:
-    """Fonction pour obtenir la traduction en Lynkr d'un token Spacy.
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être obtenue.
-    :param synonym: Le synonyme à utiliser pour la traduction Lynkr, si nécessaire.
-    """
-    # Obtenir la traduction du lemme en Lynkr du token
-    translation = token._.lynkr_lemma_translation
-
-    # Si le tag Lynkr du token est parmi "GRAMNUM", "GRAMCONJ" ou "X" :
-    if token._.lynkr_tag in ("GRAMNUM", "GRAMCONJ", "X"):
-        series = LYNKR_SERIES[token._.lynkr_tag]
-
-        # Si aucune traduction n'est disponible pour le token :
-        if translation is None:
-
-            # Si un synonyme est fourni et qu'il est traduisible en Lynkr, utiliser sa traduction
-            if synonym is not None:
-                if synonym in token._.lynkr_compatible_synonyms:
-                    translation = series[synonym]
-                    token._.lynkr_applied_synonym = synonym
-
-            # Si aucun synonyme n'est fourni, utiliser le meilleur synonyme traduisible en Lynkr, contextuellement
-            else:
-                if len(token._.lynkr_compatible_synonyms) > 0:
-                    best_synonym = max(NLP.pipe(token._.lynkr_compatible_synonyms),
-                                       key=lambda x: x.similarity(token.sent.as_doc())).text
-                    translation = series[best_synonym]
-                    token._.lynkr_applied_synonym = best_synonym
-
-        # Si une traduction est disponible :
-        if translation is not None:
-            # Compléter la traduction selon le tag Lynkr du token
-            if token._.lynkr_tag == "GRAMNUM":
-                translation = complete_lynkr_translation_gramnum(token, translation)
-            elif token._.lynkr_tag == "GRAMCONJ":
-                translation = complete_lynkr_translation_gramconj(token, translation)
-            elif token._.lynkr_tag == "X":
-                translation = complete_lynkr_translation_x(token, translation)
-
-    return translation
-
-
-# Application de la méthode `get_lynkr_translation` aux tokens Spacy
-Token.set_extension("get_lynkr_translation", method=lynkr_translation_method)
-
-
-# Sous-fonction des fonctions `translation_commun_to_lynkr_synonym`, `translation_commun_to_lynkr_peut_etre`,
-# `translation_commun_to_lynkr_au_revoir` et `translation_commun_to_lynkr_default`
-def apply_case_to_lynkr(token: Token, lynkr: str) -> str:
-    """Fonction pour appliquer la casse à une traduction en Lynkr d'un token Spacy.
-
-    :param token: Le token Spacy duquel la casse est extraite.
-    :param lynkr: La traduction en Lynkr à formater.
-    :return: La traduction en Lynkr avec la casse appropriée.
-    """
-    if token.shape_.islower():
-        return lynkr.lower()
-    elif token.shape_.istitle():
-        return lynkr.title()
-    elif token.shape_.isupper():
-        return lynkr.upper()
-    else:
-        return lynkr.capitalize()
-
-
-# Sous-fonction des fonctions `complete_translation_commun_to_lynkr` et `fast_translation_commun_to_lynkr`
-def translation_commun_to_lynkr_synonym(token: Token, synonym: str) -> str:
-    """Fonction pour obtenir la traduction en Lynkr formatée d'un token Spacy, à partir d'un synonyme spécifié.
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr formatée doit être obtenue.
-    :param synonym: Le synonyme à utiliser pour la traduction en Lynkr.
-    :return: La traduction en Lynkr formatée du token.
-    """
-    return apply_case_to_lynkr(token, token._.get_lynkr_translation(synonym))
-
-
-# Sous-fonction des fonctions `complete_translation_commun_to_lynkr` et `fast_translation_commun_to_lynkr`
-def translation_commun_to_lynkr_none(token: Token) -> str:
-    """Fonction pour obtenir la traduction en Lynkr formatée d'un token Spacy, s'il n'est pas traduisible.
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr formatée doit être obtenue.
-    :return: La traduction en Lynkr formatée du token.
-    """
-    return f"`{token.text}`"
-
-
-# Sous-fonction des fonctions `complete_translation_commun_to_lynkr` et `fast_translation_commun_to_lynkr`
-def translation_commun_to_lynkr_empty() -> str:
-    """Fonction pour obtenir la traduction en Lynkr formatée d'un token Spacy, si elle est vide.
-
-    :return: La traduction en Lynkr formatée du token.
+    :param lemma: Le lemme du mot remplacé.
+    :param synonym: Le synonyme appliqué.
+    :param confidence: La confiance dans le synonyme, s'il est un voisin vectoriel.
+    :return: La paire (mot, synonyme) formatée, suivie de la confiance si elle est connue.
     """
-    return ""
+    if confidence is None:
+        return f"{lemma} → {synonym}"
+    return f"{lemma} → {synonym} ({confidence:.0%})"
 
 
-# Sous-fonction des fonctions `complete_translation_commun_to_lynkr` et `fast_translation_commun_to_lynkr`
-def translation_commun_to_lynkr_peut_etre(token: Token) -> str:
-    """Fonction pour obtenir la traduction en Lynkr formatée de l'expression "peut-être".
+# Sous-fonction de la classe `SynonymButton` et de la cog `Lynkr`
+def add_approximate_field(embed: discord.Embed, approximate: Tuple[str, ...]) -> None:
+    """Fonction pour signaler dans une intégration les mots dont la traduction est approximative.
 
-    :param token: Le token Spacy source.
-    :return: La traduction en Lynkr formatée de l'expression "peut-être".
+    :param embed: L'intégration à compléter.
+    :param approximate: Les lemmes dont les synonymes n'ont pas pu être recherchés à temps par le service.
     """
-    return apply_case_to_lynkr(token.nbor(-2), "pyeséa")
-
-
-# Sous-fonction des fonctions `complete_translation_commun_to_lynkr` et `fast_translation_commun_to_lynkr`
-def translation_commun_to_lynkr_au_revoir(token: Token) -> Tuple[str, str]:
-    """Fonction pour obtenir la traduction en Lynkr formatée de l'expression "au revoir".
-
-    :param token: Le token Spacy source.
-    :return: La traduction en Lynkr formatée de l'expression "au revoir".
-    """
-    return apply_case_to_lynkr(token.nbor(-1), "paers"), apply_case_to_lynkr(token, "esperita")  # Ajouter
-    # la réponse variante "paers amars"
-
-
-# Sous-fonction des fonctions `complete_translation_commun_to_lynkr` et `fast_translation_commun_to_lynkr`
-def translation_commun_to_lynkr_default(token: Token) -> str:
-    """
-
-    :param token: Le token Spacy pour lequel la traduction en Lynkr formatée doit être obtenue.
-    :return: La traduction en Lynkr formatée du token.
-    """
-    return apply_case_to_lynkr(token, token._.get_lynkr_translation())
-
-
-# Sous-fonction des fonctions `complete_translation_commun_to_lynkr` et `fast_translation_commun_to_lynkr`
-def translation_to_text(translation: List[str]) -> str:
-    """Fonction pour récupérer la traduction complète en Lynkr sous forme de texte.
-
-    :param translation: La traduction complète en Lynkr à convertir en texte.
-    :return: Le texte correspondant à la traduction complète en Lynkr.
-    """
-    text = [translation[0]]
-
-    # Parcourir chaque mot dans la traduction :
-    if len(translation) > 1:
-        for word in translation[1:]:
-
-            # Ajouter un espace, s'il n'y a pas de caractère spécial ouvrant avant
-            if (word not in ('"', ")", ",", "-", ".", "]", "}")) and (text[-1] not in ('"', "(", "-", "]", "}")):
-                text.append(" ")
-
-            # Ajouter un espace, si c'est un guillemet ouvrant
-            elif word == '"' and text.count('"') % 2 == 0:
-                text.append(" ")
-
-            # Ajouter un espace, s'il y a un guillemet fermant avant
-            elif (word not in (")", ",", "-", ".", "]", "}")) and (text[-1] == '"') and (text.count('"') % 2 == 0):
-                text.append(" ")
-
-            # Ajouter le mot
-            text.append(word)
-
-    return "".join(text)
-
-
-def pretranslation_commun_to_lynkr(text: str) -> Tuple[Doc, Tuple[int, ...] | Tuple]:
-    """Fonction pour préparer le texte à la traduction en Lynkr en identifiant les tokens nécessitant un synonyme.
-
-    :param text: Le texte source à traduire en Lynkr.
-    :return: Un tuple contenant le doc Spacy du texte et les indices des tokens nécessitant un synonyme.
-    """
-    doc = NLP(text)
-    synonymable = []
-
-    # Parcourir chaque token dans le document Spacy :
-    for i, token in enumerate(doc):
-        # Si le token n'a pas de traduction en Lynkr mais a des synonymes compatibles avec Lynkr, récupérer son indice
-        if token._.lynkr_lemma_translation is None and len(token._.lynkr_compatible_synonyms) > 0:
-            synonymable.append(i)
-
-    return doc, tuple(synonymable)
+    if len(approximate) > 0:
+        embed.add_field(name="Approximations",
+                        value=f"Traduction approximative, synonymes non vérifiés à temps : "
+                              f"{', '.join(approximate)}",
+                        inline=False)
 
 
-def complete_translation_commun_to_lynkr(doc: Doc, synonyms: Optional[Dict[int, str]] = None) ->\
-        Tuple[str, Tuple[Token, ...], Tuple[Tuple[str, str], ...]]:
-    """Fonction pour achever la traduction en Lynkr du texte en utilisant les synonymes spécifiés.
+# Sous-fonction de la classe `SynonymButton` et de la cog `Lynkr`
+def add_corrections_field(embed: discord.Embed, corrected: Tuple[Tuple[str, str, float], ...]) -> None:
+    """Fonction pour signaler dans une intégration les fautes de frappe corrigées avant la traduction.
 
-    :param doc: Le doc Spacy du texte source.
-    :param synonyms: Un dictionnaire contenant les indices des tokens nécessitant un synonyme et leur synonyme associé.
-    :return: Un tuple contenant la traduction complète en Lynkr, les tokens non traduits et les paires (mot, synonyme)
-        utilisées.
+    :param embed: L'intégration à compléter.
+    :param corrected: Les triplets (mot, lemme corrigé, confiance) des fautes de frappe corrigées par le service.
     """
-    if synonyms is not None:
-        synonyms_keys = frozenset(synonyms.keys())
-    else:
-        synonyms_keys = frozenset()
-    translation, untranslated, synonymed = [], [], []
-
-    # Parcourir chaque token et son indice dans le doc Spacy :
-    for i, token in enumerate(doc):
-
-        # Si le token a un synonyme spécifié pour la traduction :
-        if i in synonyms_keys:
-            # Traduire le synonyme et récupérer la traduction
-            translation.append(translation_commun_to_lynkr_synonym(token, synonyms[i]))
-            # Récupérer la paire (mot, synonyme)
-            synonymed.append((token.lemma_, token._.lynkr_applied_synonym))
-
-        # Si le token n'a pas de traduction en Lynkr :
-        elif token._.lynkr_lemma_translation is None:
-            # Récupérer le token tel quel pour la traduction
-            translation.append(translation_commun_to_lynkr_none(token))
-            # Récupérer le token non traduit
-            untranslated.append(token)
-
-        # Si le lemme du token a une traduction vide en Lynkr, récupérer la traduction vide
-        elif token._.lynkr_lemma_translation == "":
-            translation.append(translation_commun_to_lynkr_empty())
-
-        # Si l'expression est "peut-être", modifier la traduction en conséquence
-        elif i > 2 and token.lower_ == "être" and token.nbor(-1).text == "-" and token.nbor(-2).lower_ == "peut":
-            translation.pop()
-            translation.pop()
-            translation.append(translation_commun_to_lynkr_peut_etre(token))
-
-        # Si l'expression est "au revoir", modifier la traduction en conséquence
-        elif i > 1 and token.lower_ == "revoir" and token.nbor(-1).lower_ == "au":
-            translation.pop()
-            translation.extend(translation_commun_to_lynkr_au_revoir(token))
-
-        # Sinon, utiliser la traduction par défaut
-        else:
-            translation.append(translation_commun_to_lynkr_default(token))
-
-    return translation_to_text(translation), tuple(untranslated), tuple(synonymed)
+    if len(corrected) > 0:
+        embed.add_field(name="Corrections",
+                        value="\n".join([format_synonym(*correction) for correction in corrected]),
+                        inline=False)
 
 
-def fast_translation_commun_to_lynkr(text: str) -> Tuple[str, Tuple[Token, ...], Tuple[Tuple[str, str], ...]]:
-    """Fonction pour traduire le texte en Lynkr directement, en utilisant les meilleurs synonymes contextuels.
+# Sous-fonction des classes `SynonymSelect` et `SynonymButton`
+def synonym_options(token: SynonymableToken) -> List[SelectOption]:
+    """Fonction pour construire les options du menu déroulant de synonymes d'un token.
 
-    :param text: Le texte source à traduire en Lynkr.
-    :return: Un tuple contenant la traduction complète en Lynkr, les tokens non traduits et les paires (mot, synonyme)
-        utilisées.
+    :param token: Le token nécessitant un synonyme.
+    :return: Les options de synonymes, le plus choisi par les utilisateurs étant présélectionné, suivies de l'option
+        sans synonyme.
     """
-    doc = NLP(text)
-    translation, untranslated, synonymed = [], [], []
-
-    # Parcourir chaque token et son indice dans le doc Spacy :
-    for i, token in enumerate(doc):
-
-        # Si le token n'a pas de traduction en Lynkr mais a des synonymes traduisibles :
-        if token._.lynkr_lemma_translation is None and len(token._.lynkr_compatible_synonyms) > 0:
-            # Traduire le synonyme et récupérer la traduction
-            translation.append(translation_commun_to_lynkr_default(token))
-            # Récupérer la paire (mot, synonyme)
-            synonymed.append((token.lemma_, token._.lynkr_applied_synonym))
-
-        # Si le token n'a pas de traduction en Lynkr :
-        elif token._.lynkr_lemma_translation is None:
-            translation.append(translation_commun_to_lynkr_none(token))
-            # Récupérer le token tel quel pour la traduction
-            untranslated.append(token)
-            # Récupérer le token non traduit
-
-        # Si le lemme du token a une traduction vide en Lynkr, récupérer la traduction vide
-        elif token._.lynkr_lemma_translation == "":
-            translation.append(translation_commun_to_lynkr_empty())
-
-        # Si l'expression est "peut-être", modifier la traduction en conséquence
-        elif i > 2 and token.lower_ == "être" and token.nbor(-1).text == "-" and token.nbor(-2).lower_ == "peut":
-            translation.pop()
-            translation.pop()
-            translation.append(translation_commun_to_lynkr_peut_etre(token))
-
-        # Si l'expression est "au revoir", modifier la traduction en conséquence
-        elif i > 1 and token.lower_ == "revoir" and token.nbor(-1).lower_ == "au":
-            translation.pop()
-            translation.extend(translation_commun_to_lynkr_au_revoir(token))
-
-        # Sinon, utiliser la traduction par défaut
-        else:
-            translation.append(translation_commun_to_lynkr_default(token))
-
-    return translation_to_text(translation), tuple(untranslated), tuple(synonymed)
+    # Options de synonymes
+    options = [SelectOption(label=f'"{synonym}"' if synonym not in token.confidence else
+                            f'"{synonym}" ({token.confidence[synonym]:.0%})', value=synonym,
+                            default=synonym == token.preferred)
+               for synonym in token.synonyms]
+    # Option sans synonyme
+    options.append(SelectOption(label="Aucun synonyme",
+                                value="None",
+                                description=f'Attention : "{token.lemma}" ne sera pas traduit !'))
+    return options
 
 
 # Sous-classe pour la classe `SynonymView`
@@ -576,49 +97,51 @@ class SynonymSelect(ui.Select):
     Ce composant permet à l'utilisateur de choisir parmi une liste de synonymes pour un mot spécifique dans le texte à
     traduire.
 
-    :param index: Indice du mot dans le doc Spacy pour lequel le synonyme doit être choisi actuellement.
+    :param index: Indice du token nécessitant un synonyme pour lequel le synonyme doit être choisi actuellement.
     :type index: int
-    :param doc: Le doc Spacy contenant le texte à traduire.
-    :type doc: Doc
-    :param synonymable: Un tuple contenant les indices des mots dans le doc Spacy pour lesquels des synonymes doivent
-        être choisis.
-    :type synonymable: Tuple[int, ...]
+    :param text: Le texte à traduire.
+    :type text: str
+    :param synonymable: Un tuple contenant les tokens du texte pour lesquels des synonymes doivent être choisis.
+    :type synonymable: Tuple[SynonymableToken, ...]
     :param selected_synonyms: Liste des synonymes choisis actuellement.
     :type selected_synonyms: List[str]
+    :param applied: Les tokens dont le synonyme fait consensus, appliqué sans passer par le menu.
+    :type applied: Tuple[SynonymableToken, ...]
+    :param chosen: Le synonyme choisi dans le menu pour le token actuel, à défaut duquel le synonyme présélectionné est
+        retenu.
+    :type chosen: Optional[str]
+    :param learned: Les indices des tokens dont l'utilisateur a lui-même choisi le synonyme dans le menu, seuls
+        enregistrés dans la mémoire des choix.
+    :type learned: List[int]
     """
 
-    def __init__(self, doc: Doc, synonymable: Tuple[int, ...]) -> None:
+    def __init__(self, text: str, synonymable: Tuple[SynonymableToken, ...],
+                 applied: Tuple[SynonymableToken, ...] = ()) -> None:
         """Initialise un nouveau sélecteur de synonymes.
 
-        :param doc: Le doc Spacy contenant le texte à traduire.
-        :param synonymable: Un tuple contenant les indices des mots dans le doc Spacy pour lesquels des synonymes
-            doivent être choisis.
+        :param text: Le texte à traduire.
+        :param synonymable: Un tuple contenant les tokens du texte pour lesquels des synonymes doivent être choisis.
+        :param applied: Les tokens dont le synonyme fait consensus, appliqué sans passer par le menu.
         """
-        # Placeholder du menu déroulant
-        placeholder = f'Choisissez un synonyme pour "{doc[synonymable[0]].text}" !'
-
-        # Options du menu déroulant
-        options = []
-        for synonym in doc[synonymable[0]]._.lynkr_compatible_synonyms:
-            # Options de synonymes
-            options.append(SelectOption(label=f'"{synonym}"',
-                                        value=synonym))
-        # Option sans synonyme
-        options.append(SelectOption(label="Aucun synonyme",
-                                    value="None",
-                                    description=f'Attention : "{doc[synonymable[0]].lemma_}" ne sera pas traduit !'))
+        # Placeholder et options du menu déroulant
+        placeholder = f'Choisissez un synonyme pour "{synonymable[0].text}" !'
+        options = synonym_options(synonymable[0])
 
         super().__init__(placeholder=placeholder, options=options)
         self.index = 0
-        self.doc = doc
+        self.text = text
         self.synonymable = synonymable
         self.selected_synonyms = []
+        self.applied = applied
+        self.chosen: Optional[str] = None
+        self.learned: List[int] = []
 
     async def callback(self, interaction: Interaction) -> None:
         """Méthode de rappel exécutée lorsqu'une interaction avec le menu déroulant se produit.
 
         :param interaction: L'interaction avec le menu déroulant.
         """
+        self.chosen = self.values[0]
         await interaction.response.defer()
 
 
@@ -628,44 +151,48 @@ class SynonymButton(ui.Button):
 
     :param select: Le sélecteur de synonymes associé au bouton.
     :type select: SynonymSelect
+    :param cog: La cog Lynkr, dont la file de traduction exécute la traduction finale.
+    :type cog: Lynkr
     :param translation: La traduction du texte.
     :type translation: str
     """
 
-    def __init__(self, select: SynonymSelect) -> None:
+    def __init__(self, select: SynonymSelect, cog: "Lynkr") -> None:
         """Initialise une instance de SynonymButton.
 
         :param select: Le sélecteur de synonymes associé au bouton.
+        :param cog: La cog Lynkr, dont la file de traduction exécute la traduction finale.
         """
         super().__init__(label="Valider", style=discord.ButtonStyle.blurple)
         self.select = select
+        self.cog = cog
         self.translation = ""
+        self.approximate: Tuple[str, ...] = ()
+        self.corrected: Tuple[Tuple[str, str, float], ...] = ()
 
     async def callback(self, interaction: Interaction) -> None:
         """Méthode de rappel exécutée lorsqu'une interaction avec le bouton se produit.
 
         :param interaction: L'interaction avec le bouton.
         """
-        # Sauvegarder le synonyme sélectionné et passer au suivant
+        # Sauvegarder le synonyme sélectionné, à défaut le synonyme présélectionné, et passer au suivant ; seul un
+        # synonyme sélectionné est appris, pour que la présélection ne se renforce pas d'elle-même
+        token = self.select.synonymable[self.select.index]
+        if self.select.chosen is None:
+            self.select.chosen = token.preferred if token.preferred is not None else "None"
+        else:
+            self.select.learned.append(token.index)
         self.select.index += 1
-        self.select.selected_synonyms.append(self.select.values[0])
+        self.select.selected_synonyms.append(self.select.chosen)
+        self.select.chosen = None
 
         # Si le synonyme suivant existe :
         if self.select.index < len(self.select.synonymable):
 
-            # Appliquer un nouveau placeholder au menu déroulant
-            placeholder = f'Choisissez un synonyme pour "{self.select.doc[self.select.synonymable[self.select.index]].text}" !'
-            self.select.placeholder = placeholder
-
-            # Appliquer de nouvelles options au menu déroulant
-            options = []
-            for synonym in self.select.doc[self.select.synonymable[self.select.index]]._.lynkr_compatible_synonyms:
-                options.append(SelectOption(label=f'"{synonym}"',
-                                            value=synonym))
-            options.append(SelectOption(label="Aucun synonyme",
-                                        value="None",
-                                        description=f'Attention : "{self.select.doc[self.select.synonymable[self.select.index]].lemma_}" ne sera pas traduit !'))
-            self.select.options = options
+            # Appliquer un nouveau placeholder et de nouvelles options au menu déroulant
+            token = self.select.synonymable[self.select.index]
+            self.select.placeholder = f'Choisissez un synonyme pour "{token.text}" !'
+            self.select.options = synonym_options(token)
 
         # Sinon :
         else:
@@ -673,38 +200,47 @@ class SynonymButton(ui.Button):
             self.select.disabled = True
             self.disabled = True
 
-            # Générer la traduction et le tuple des tokens intraduisibles
-            translation, untranslated, _ = complete_translation_commun_to_lynkr(self.select.doc, dict(
-                zip(self.select.synonymable, self.select.selected_synonyms)))
-
-            # Appliquer la nouvelle traduction au bouton
-            self.translation = translation
-
-            # Décomposer les tokens intraduisibles et les sauvegarder dans le csv mémoire
-            text, lemma, pos, morph = [], [], [], []
-            for token in untranslated:
-                text.append(token.text)
-                lemma.append(token.lemma_)
-                pos.append(token.pos_)
-                morph.append(token.morph)
-            df = pd.DataFrame({"text": text, "lemma": lemma, "pos": pos, "morph": morph})
-            df.to_csv(MEMORY_PATH, header=False, index=False, mode="a")
+            # Générer la traduction auprès du service, qui sauvegarde aussi les tokens intraduisibles et les choix de
+            # l'utilisateur, sans les synonymes consensuels appliqués d'office ; la commande ayant déjà été admise,
+            # la traduction passe en tête de la file sans consommer de jeton, la réponse étant différée d'ici là
+            synonyms = {token.index: token.preferred for token in self.select.applied}
+            synonyms.update({token.index: (None if synonym == "None" else synonym)
+                             for token, synonym in zip(self.select.synonymable, self.select.selected_synonyms)})
+            await interaction.response.defer()
+            try:
+                translation = await self.cog.admit(interaction, self.select.text, False,
+                                                   lambda: self.cog.client.translate(self.select.text, synonyms,
+                                                                                     self.select.learned),
+                                                   admitted=True)
+                if translation is None:
+                    return
+                self.translation, self.approximate, self.corrected = (translation.translation, translation.approximate,
+                                                                      translation.corrected)
+            except LynkrServiceError:
+                self.translation = ":warning: Le service de traduction est indisponible."
 
         # Intégrer le texte original, la traduction et les paires (mot, synonyme) à chaque étape
         embed = discord.Embed(title="TRADUCTION : Commun → Lynkr",
                               url="https://www.herobrine.fr/index.php?p=codex",
-                              description=self.select.doc.text,
+                              description=self.select.text,
                               color=discord.Color.dark_gold())
         embed.add_field(name="Traduction",
                         value=self.translation,
                         inline=False)
+        pairs = [(token, token.preferred) for token in self.select.applied]
+        pairs.extend(zip(self.select.synonymable, self.select.selected_synonyms))
         embed.add_field(name="Synonymes",
-                        value="\n".join([f"{self.select.doc[j].lemma_} → {self.select.selected_synonyms[i]}" for i, j in
-                                         enumerate(self.select.synonymable[:len(self.select.selected_synonyms)])]),
+                        value="\n".join([format_synonym(token.lemma, synonym, token.confidence.get(synonym))
+                                         for token, synonym in pairs]),
                         inline=False)
+        add_corrections_field(embed, self.corrected)
+        add_approximate_field(embed, self.approximate)
 
-        # Envoyer l'intégration
-        await interaction.response.edit_message(embed=embed, view=self.view)
+        # Envoyer l'intégration, en modifiant le message du menu
+        if interaction.response.is_done():
+            await interaction.edit_original_response(embed=embed, view=self.view)
+        else:
+            await interaction.response.edit_message(embed=embed, view=self.view)
 
 
 class SynonymView(ui.View):
@@ -712,18 +248,20 @@ class SynonymView(ui.View):
     synonymes.
     """
 
-    def __init__(self, doc: Doc, synonymable: Tuple[int, ...]) -> None:
+    def __init__(self, text: str, synonymable: Tuple[SynonymableToken, ...], cog: "Lynkr",
+                 applied: Tuple[SynonymableToken, ...] = ()) -> None:
         """Initialise une instance de SynonymView.
 
-        :param doc: Le doc Spacy contenant le texte à traduire.
-        :param synonymable: Un tuple contenant les indices des mots dans le doc Spacy pour lesquels des synonymes
-            doivent être choisis.
+        :param text: Le texte à traduire.
+        :param synonymable: Un tuple contenant les tokens du texte pour lesquels des synonymes doivent être choisis.
+        :param cog: La cog Lynkr, dont la file de traduction exécute la traduction finale.
+        :param applied: Les tokens dont le synonyme fait consensus, appliqué sans passer par le menu.
         """
         super().__init__(timeout=None)
 
         # Créer une instance de SynonymSelect et de SynonymButton
-        select = SynonymSelect(doc, synonymable)
-        button = SynonymButton(select)
+        select = SynonymSelect(text, synonymable, applied)
+        button = SynonymButton(select, cog)
 
         # Ajouter le menu déroulant et le bouton à la vue
         self.add_item(select)
@@ -734,8 +272,21 @@ class SynonymView(ui.View):
 class Lynkr(commands.Cog):
     """Une cog Discord.py pour traduire des textes de la langue Commun en Lynkr sur Discord.
 
+    La traduction est déléguée au service de traduction Lynkr (`python -m lynkr.service`), partagé par tous les
+    processus du bot.
+
     :param bot: Le bot Discord associé à cette cog.
     :type bot: commands.Bot
+    :param client: Le client du service de traduction.
+    :type client: LynkrClient
+    :param queue: La file de traduction, avec ses limites de débit par utilisateur et par serveur.
+    :type queue: AdmissionQueue
+    :param auto_channels: Les identifiants des salons dont chaque message est traduit automatiquement.
+    :type auto_channels: Set[int]
+    :param auto_pending: Les messages en attente de traduction automatique, par identifiant.
+    :type auto_pending: Dict[int, discord.Message]
+    :param auto_replies: Les réponses du bot aux messages traduits automatiquement, par identifiant du message.
+    :type auto_replies: OrderedDict[int, discord.Message]
     """
 
     def __init__(self, bot: commands.Bot) -> None:
@@ -744,12 +295,175 @@ class Lynkr(commands.Cog):
         :param bot: Le bot Discord associé à cette cog.
         """
         self.bot = bot
+        self.client = LynkrClient(url=os.getenv("LYNKR_SERVICE_URL", "http://127.0.0.1:8765"),
+                                  socket=os.getenv("LYNKR_SERVICE_SOCKET"),
+                                  timeout=float(os.getenv("LYNKR_SERVICE_TIMEOUT", "60")))
+        self.queue = AdmissionQueue(maxsize=int(os.getenv("LYNKR_QUEUE_SIZE", "100")),
+                                    workers=int(os.getenv("LYNKR_QUEUE_WORKERS", "4")),
+                                    user_burst=float(os.getenv("LYNKR_USER_BURST", "3")),
+                                    user_rate=float(os.getenv("LYNKR_USER_RATE", "0.05")),
+                                    guild_burst=float(os.getenv("LYNKR_GUILD_BURST", "20")),
+                                    guild_rate=float(os.getenv("LYNKR_GUILD_RATE", "0.5")))
+
+        # Salons de traduction automatique, dont les messages sont regroupés sur une courte fenêtre
+        self.auto_channels = {int(channel) for channel in os.getenv("LYNKR_AUTO_CHANNELS", "").split(",")
+                              if channel.strip()}
+        self.auto_debounce = float(os.getenv("LYNKR_AUTO_DEBOUNCE", "1.5"))
+        self.auto_pending: Dict[int, discord.Message] = {}
+        self.auto_replies: "OrderedDict[int, discord.Message]" = OrderedDict()
+        self.auto_task: Optional[asyncio.Task] = None
+
+    async def cog_load(self) -> None:
+        """Ouvre la session du client du service de traduction et démarre la file de traduction au chargement de la
+        cog."""
+        await self.client.start()
+        await self.queue.start()
+
+    async def cog_unload(self) -> None:
+        """Arrête la file de traduction et ferme la session du client du service de traduction au déchargement de la
+        cog."""
+        if self.auto_task is not None:
+            self.auto_task.cancel()
+        await self.queue.stop()
+        await self.client.close()
+
+    async def admit(self, interaction: discord.Interaction, texte: str, fast: bool,
+                    run: Callable[[], Awaitable[Any]], admitted: bool = False) -> Any:
+        """Fait passer une traduction par la file de traduction et attend son résultat.
+
+        Les traductions poursuivant une commande déjà admise passent en premier, puis les traductions rapides et les
+        textes courts. L'utilisateur est prévenu s'il dépasse sa limite de débit, si la file est pleine, ou de sa
+        position s'il doit attendre une nouvelle traduction.
+
+        :param interaction: L'interaction Discord de la commande.
+        :param texte: Le texte à traduire en Lynkr.
+        :param fast: Si la traduction est une traduction rapide.
+        :param run: La fonction lançant la traduction auprès du service.
+        :param admitted: Si la traduction poursuit une commande déjà admise par la file, sans consommer de jeton.
+        :return: Le résultat de la traduction, ou `None` si elle a été refusée ou abandonnée.
+        """
+        member = interaction.user
+
+        # La traduction n'est plus attendue si l'interaction a expiré ou si l'utilisateur a quitté le serveur
+        def is_alive() -> bool:
+            return (utcnow() - interaction.created_at < INTERACTION_LIFETIME
+                    and interaction.guild.get_member(member.id) is not None)
+
+        priority = (-1 if admitted else 0 if fast or len(texte) <= SHORT_TEXT_LENGTH else 1, len(texte))
+        try:
+            future, position = self.queue.submit(member.id, member.guild.id, priority, run, is_alive, admitted)
+        except RateLimited as error:
+            await interaction.followup.send(f":hourglass: Tu as demandé trop de traductions, réessaie dans "
+                                            f"{error.retry_after:.0f} secondes.", ephemeral=True)
+            return None
+        except QueueFull as error:
+            await interaction.followup.send(f":hourglass: Le bot est occupé, {error.pending} traductions sont déjà "
+                                            f"en attente. Réessaie dans quelques instants.", ephemeral=True)
+            return None
+
+        # Si d'autres traductions passent avant, indiquer la position dans la file ; ce premier message de suivi
+        # remplace la réponse différée, les suivants devant donc être explicitement éphémères
+        if position > 0 and not admitted:
+            await interaction.followup.send(f":hourglass: Le bot est occupé, ta traduction est en position "
+                                            f"{position + 1} dans la file d'attente.", ephemeral=True)
+        try:
+            return await future
+        except JobCancelled:
+            return None
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         """Un écouteur d'événements qui est déclenché lorsque le bot est prêt."""
         print("Lynkr cog loaded")
 
+    def may_auto_translate(self, message: discord.Message) -> bool:
+        """Vérifie qu'un message d'un salon de traduction automatique peut être traduit.
+
+        Comme pour les commandes, l'auteur doit avoir le rôle `Codex`, et chaque message ou modification consomme un
+        jeton de l'auteur et de son serveur.
+
+        :param message: Le message reçu ou modifié.
+        :return: Si le message peut être traduit.
+        """
+        if message.guild is None:
+            return False
+        role = get(message.guild.roles, name="Codex")
+        if role is None or message.author not in role.members:
+            return False
+        try:
+            self.queue.take(message.author.id, message.guild.id)
+        except RateLimited as error:
+            logger.info("Traduction automatique du message %d ignorée : %s", message.id, error)
+            return False
+        return True
+
+    def schedule_auto_translation(self, message: discord.Message) -> None:
+        """Met un message en attente de traduction automatique, sa dernière version remplaçant les précédentes.
+
+        :param message: Le message à traduire.
+        """
+        self.auto_pending[message.id] = message
+        if self.auto_task is None or self.auto_task.done():
+            self.auto_task = asyncio.create_task(self.flush_auto_translations())
+
+    async def flush_auto_translations(self) -> None:
+        """Traduit en un seul lot les messages reçus ou modifiés pendant la fenêtre de regroupement, puis y répond ou
+        modifie en place les réponses existantes."""
+        while self.auto_pending:
+            await asyncio.sleep(self.auto_debounce)
+            messages = list(self.auto_pending.values())
+            self.auto_pending.clear()
+
+            # Le service ne retraduit que les phrases absentes de son cache, soit celles modifiées
+            try:
+                translations = await self.client.batch_translate([message.content for message in messages])
+            except LynkrServiceError as error:
+                logger.warning("Traduction automatique de %d messages impossible : %r", len(messages), error)
+                continue
+
+            for message, translation in zip(messages, translations):
+                content = translation.translation[:MESSAGE_LENGTH]
+                reply = self.auto_replies.get(message.id)
+                try:
+                    # Modifier la réponse existante si la traduction a changé
+                    if reply is not None:
+                        if reply.content != content:
+                            self.auto_replies[message.id] = await reply.edit(content=content)
+                    elif content.strip():
+                        self.auto_replies[message.id] = await message.reply(content, mention_author=False)
+                except discord.HTTPException:
+                    # Le message ou la réponse a été supprimé entre-temps
+                    self.auto_replies.pop(message.id, None)
+                    continue
+
+                # Oublier les réponses les plus anciennes
+                if len(self.auto_replies) > AUTO_REPLIES_SIZE:
+                    self.auto_replies.popitem(last=False)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        """Un écouteur d'événements qui traduit automatiquement les messages des salons de traduction automatique.
+
+        :param message: Le message reçu.
+        """
+        if message.channel.id in self.auto_channels and not message.author.bot and message.content \
+                and self.may_auto_translate(message):
+            self.schedule_auto_translation(message)
+
+    @commands.Cog.listener()
+    async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
+        """Un écouteur d'événements qui met à jour la traduction d'un message modifié d'un salon de traduction
+        automatique.
+
+        :param before: Le message avant sa modification.
+        :param after: Le message après sa modification.
+        """
+        # Ignorer les modifications sans changement du texte (intégrations) et les messages jamais traduits
+        if before.content == after.content or after.channel.id not in self.auto_channels or after.author.bot:
+            return
+        if (after.id in self.auto_replies or after.id in self.auto_pending) and self.may_auto_translate(after):
+            self.schedule_auto_translation(after)
+
     @app_commands.command(name="lynkr", description="Traduit en Lynkr, un texte écrit en Commun")
     @app_commands.guild_only()
     async def lynkr_slash(self, interaction: discord.Interaction, texte: str) -> None:
@@ -765,56 +479,74 @@ class Lynkr(commands.Cog):
         # Si l'utilisateur a le rôle `Codex` :
         if member in role.members:
 
-            # Générer le doc Spacy du texte et les indices des tokens nécessitant un synonyme.
-            doc, synonymable = pretranslation_commun_to_lynkr(texte)
-
             # Intégrer le texte original
             embed = discord.Embed(title="TRADUCTION : Commun → Lynkr",
                                   url="https://www.herobrine.fr/index.php?p=codex",
                                   description=texte,
                                   color=discord.Color.dark_gold())
 
-            # S'il y a des paires (mot, synonyme) :
-            if len(synonymable) > 0:
-
-                # Intégrer la traduction vide et les paires (mot, synonyme) vides
-                embed.add_field(name="Traduction",
-                                value="",
-                                inline=False)
-                embed.add_field(name="Synonymes",
-                                value="",
-                                inline=False)
-
-                # Envoyer l'intégration
-                await interaction.followup.send(embed=embed, view=SynonymView(doc, synonymable))
-
-            # Sinon :
-            else:
-
-                # Générer la traduction et le tuple des tokens intraduisibles
-                translation, untranslated, _ = complete_translation_commun_to_lynkr(doc)
-
-                # Intégrer la traduction
-                embed.add_field(name="Traduction",
-                                value=translation,
-                                inline=False)
-
-                # Envoyer l'intégration
-                await interaction.followup.send(embed=embed)
-
-                # Décomposer les tokens intraduisibles et les sauvegarder dans le csv mémoire
-                text, lemma, pos, morph = [], [], [], []
-                for token in untranslated:
-                    text.append(token.text)
-                    lemma.append(token.lemma_)
-                    pos.append(token.pos_)
-                    morph.append(token.morph)
-                df = pd.DataFrame({"text": text, "lemma": lemma, "pos": pos, "morph": morph})
-                df.to_csv(MEMORY_PATH, header=False, index=False, mode="a")
+            try:
+                # Identifier les tokens nécessitant un synonyme, en passant par la file de traduction
+                synonymable = await self.admit(interaction, texte, False, lambda: self.client.pretranslate(texte))
+                if synonymable is None:
+                    return
+
+                # Appliquer d'office les synonymes sur lesquels les utilisateurs s'accordent
+                applied = tuple(token for token in synonymable if token.consensus)
+                synonymable = tuple(token for token in synonymable if not token.consensus)
+
+                # S'il reste des paires (mot, synonyme) à choisir :
+                if len(synonymable) > 0:
+
+                    # Intégrer la traduction vide et les paires (mot, synonyme) vides
+                    embed.add_field(name="Traduction",
+                                    value="",
+                                    inline=False)
+                    embed.add_field(name="Synonymes",
+                                    value="",
+                                    inline=False)
+
+                    # Envoyer l'intégration
+                    await interaction.followup.send(embed=embed,
+                                                    view=SynonymView(texte, synonymable, self, applied),
+                                                    ephemeral=True)
+
+                # Sinon :
+                else:
+
+                    # Générer la traduction, le service sauvegardant les tokens intraduisibles, en tête de la file
+                    # puisque la commande a déjà été admise
+                    translation = await self.admit(interaction, texte, False,
+                                                   lambda: self.client.translate(texte, {token.index: token.preferred
+                                                                                         for token in applied}),
+                                                   admitted=True)
+                    if translation is None:
+                        return
+
+                    # Intégrer la traduction et les synonymes consensuels appliqués
+                    embed.add_field(name="Traduction",
+                                    value=translation.translation,
+                                    inline=False)
+                    if len(applied) > 0:
+                        embed.add_field(name="Synonymes",
+                                        value="\n".join([format_synonym(token.lemma, token.preferred,
+                                                                        token.confidence.get(token.preferred))
+                                                         for token in applied]),
+                                        inline=False)
+                    add_corrections_field(embed, translation.corrected)
+                    add_approximate_field(embed, translation.approximate)
+
+                    # Envoyer l'intégration
+                    await interaction.followup.send(embed=embed, ephemeral=True)
+
+            # Si le service de traduction ne répond pas :
+            except LynkrServiceError:
+                await interaction.followup.send(":warning: Le service de traduction est indisponible.", ephemeral=True)
 
         # Sinon :
         else:
-            await interaction.followup.send(f"Il te faut le rôle {role.mention} pour utiliser cette commande.")
+            await interaction.followup.send(f"Il te faut le rôle {role.mention} pour utiliser cette commande.",
+                                            ephemeral=True)
 
     @app_commands.command(name="fastlynkr", description="Traduit en Lynkr, un texte écrit en Commun")
     @app_commands.guild_only()
@@ -831,8 +563,16 @@ class Lynkr(commands.Cog):
         # Si l'utilisateur a le rôle `Codex` :
         if member in role.members:
 
-            # Générer la traduction, le tuple des tokens intraduisibles et les paires (mot, synonyme) utilisées
-            translation, untranslated, synonymed = fast_translation_commun_to_lynkr(texte)
+            # Générer la traduction et les paires (mot, synonyme) utilisées, le service sauvegardant les tokens
+            # intraduisibles
+            try:
+                result = await self.admit(interaction, texte, True, lambda: self.client.fast_translate(texte))
+            except LynkrServiceError:
+                await interaction.followup.send(":warning: Le service de traduction est indisponible.", ephemeral=True)
+                return
+            if result is None:
+                return
+            translation, synonymed, approximate, corrected = result
 
             # Intégrer le texte original et la traduction
             embed = discord.Embed(title="TRADUCTION : Commun → Lynkr",
@@ -846,25 +586,18 @@ class Lynkr(commands.Cog):
             # S'il y a des paires (mot, synonyme), les intégrer
             if len(synonymed) > 0:
                 embed.add_field(name="Synonymes",
-                                value="\n".join([f"{synonym[0]} → {synonym[1]}" for synonym in synonymed]),
+                                value="\n".join([format_synonym(*synonym) for synonym in synonymed]),
                                 inline=False)
+            add_corrections_field(embed, corrected)
+            add_approximate_field(embed, approximate)
 
             # Envoyer l'intégration
-            await interaction.followup.send(embed=embed)
-
-            # Décomposer les tokens intraduisibles et les sauvegarder dans le csv mémoire
-            text, lemma, pos, morph = [], [], [], []
-            for token in untranslated:
-                text.append(token.text)
-                lemma.append(token.lemma_)
-                pos.append(token.pos_)
-                morph.append(token.morph)
-            df = pd.DataFrame({"text": text, "lemma": lemma, "pos": pos, "morph": morph})
-            df.to_csv(MEMORY_PATH, header=False, index=False, mode="a")
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
         # Sinon :
         else:
-            await interaction.followup.send(f"Il te faut le rôle {role.mention} pour utiliser cette commande.")
+            await interaction.followup.send(f"Il te faut le rôle {role.mention} pour utiliser cette commande.",
+                                            ephemeral=True)
 
 
 # Configuration de la cog
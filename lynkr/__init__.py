@@ -0,0 +1 @@
+"""Traduction Commun -> Lynkr : moteur de traduction, service partagé et client du service."""
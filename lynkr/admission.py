@@ -0,0 +1,200 @@
+import time
+import asyncio
+import itertools
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class RateLimited(Exception):
+    """Erreur levée lorsqu'un utilisateur ou un serveur a épuisé ses jetons de traduction.
+
+    :param retry_after: Le délai avant qu'un jeton soit de nouveau disponible, en secondes.
+    :type retry_after: float
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Rate limited, retry after {retry_after:.1f} s")
+        self.retry_after = retry_after
+
+
+class QueueFull(Exception):
+    """Erreur levée lorsque la file de traduction est pleine.
+
+    :param pending: Le nombre de traductions en attente.
+    :type pending: int
+    """
+
+    def __init__(self, pending: int) -> None:
+        super().__init__(f"Translation queue is full ({pending} pending jobs)")
+        self.pending = pending
+
+
+class JobCancelled(Exception):
+    """Erreur levée lorsqu'une traduction en attente est abandonnée (interaction expirée, utilisateur parti)."""
+
+
+class TokenBucket:
+    """Seau à jetons limitant le débit de traductions d'un utilisateur ou d'un serveur.
+
+    :param capacity: Le nombre maximal de jetons, soit la rafale autorisée.
+    :type capacity: float
+    :param rate: Le nombre de jetons regagnés par seconde.
+    :type rate: float
+    """
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self) -> None:
+        """Ajoute les jetons regagnés depuis la dernière mise à jour."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def retry_after(self) -> float:
+        """Renvoie le délai avant qu'un jeton soit disponible, en secondes."""
+        self.refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        """Consomme un jeton, qui doit être disponible."""
+        self.refill()
+        self.tokens -= 1
+
+
+class AdmissionQueue:
+    """File de traduction bornée et priorisée, précédée de limites de débit par utilisateur et par serveur.
+
+    Les traductions sont exécutées par un nombre fixe de tâches, par ordre de priorité puis d'arrivée ; celles dont
+    l'interaction a expiré ou dont l'utilisateur est parti entre-temps sont abandonnées sans être exécutées.
+
+    :param maxsize: Le nombre maximal de traductions en attente.
+    :type maxsize: int
+    :param workers: Le nombre de traductions exécutées en parallèle.
+    :type workers: int
+    """
+
+    def __init__(self, maxsize: int = 100, workers: int = 4, user_burst: float = 3, user_rate: float = 0.05,
+                 guild_burst: float = 20, guild_rate: float = 0.5) -> None:
+        """Initialise la file de traduction.
+
+        :param maxsize: Le nombre maximal de traductions en attente.
+        :param workers: Le nombre de traductions exécutées en parallèle.
+        :param user_burst: Le nombre de traductions qu'un utilisateur peut enchaîner.
+        :param user_rate: Le nombre de traductions regagnées par seconde par un utilisateur.
+        :param guild_burst: Le nombre de traductions qu'un serveur peut enchaîner.
+        :param guild_rate: Le nombre de traductions regagnées par seconde par un serveur.
+        """
+        self.maxsize = maxsize
+        self.workers = workers
+        self.user_limits = (user_burst, user_rate)
+        self.guild_limits = (guild_burst, guild_rate)
+        self.buckets: Dict[Tuple[str, Hashable], TokenBucket] = {}
+        self.queue: Optional[asyncio.PriorityQueue] = None
+        self.pending = set()
+        self.tasks: List[asyncio.Task] = []
+        self.counter = itertools.count()
+
+    async def start(self) -> None:
+        """Démarre les tâches exécutant les traductions."""
+        if self.queue is None:
+            self.queue = asyncio.PriorityQueue()
+        while len(self.tasks) < self.workers:
+            self.tasks.append(asyncio.create_task(self.work()))
+
+    async def stop(self) -> None:
+        """Arrête les tâches exécutant les traductions et abandonne les traductions en attente."""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks.clear()
+        while self.queue is not None and not self.queue.empty():
+            *_, future, _, _ = self.queue.get_nowait()
+            if not future.done():
+                future.set_exception(JobCancelled("Translation queue stopped"))
+        self.pending.clear()
+
+    def bucket(self, scope: str, key: Hashable) -> TokenBucket:
+        """Renvoie le seau à jetons d'un utilisateur ou d'un serveur, en le créant si besoin."""
+        if (scope, key) not in self.buckets:
+            # Oublier les seaux pleins, identiques à des seaux neufs, pour borner la mémoire
+            if len(self.buckets) >= 10000:
+                for known, bucket in list(self.buckets.items()):
+                    bucket.refill()
+                    if bucket.tokens >= bucket.capacity:
+                        del self.buckets[known]
+            capacity, rate = self.user_limits if scope == "user" else self.guild_limits
+            self.buckets[(scope, key)] = TokenBucket(capacity, rate)
+        return self.buckets[(scope, key)]
+
+    def check(self, user_id: Hashable, guild_id: Hashable) -> Tuple[TokenBucket, TokenBucket]:
+        """Vérifie qu'un utilisateur et son serveur disposent chacun d'un jeton.
+
+        :param user_id: L'identifiant de l'utilisateur.
+        :param guild_id: L'identifiant du serveur de l'utilisateur.
+        :return: Les seaux à jetons de l'utilisateur et du serveur.
+        :raises RateLimited: Si l'utilisateur ou le serveur a épuisé ses jetons.
+        """
+        user_bucket, guild_bucket = self.bucket("user", user_id), self.bucket("guild", guild_id)
+        retry_after = max(user_bucket.retry_after(), guild_bucket.retry_after())
+        if retry_after > 0:
+            raise RateLimited(retry_after)
+        return user_bucket, guild_bucket
+
+    def take(self, user_id: Hashable, guild_id: Hashable) -> None:
+        """Consomme un jeton d'un utilisateur et de son serveur, pour une traduction qui ne passe pas par la file.
+
+        :param user_id: L'identifiant de l'utilisateur.
+        :param guild_id: L'identifiant du serveur de l'utilisateur.
+        :raises RateLimited: Si l'utilisateur ou le serveur a épuisé ses jetons.
+        """
+        for bucket in self.check(user_id, guild_id):
+            bucket.take()
+
+    def submit(self, user_id: Hashable, guild_id: Hashable, priority: Any, run: Callable[[], Awaitable[Any]],
+               is_alive: Callable[[], bool], admitted: bool = False) -> Tuple[asyncio.Future, int]:
+        """Ajoute une traduction à la file, si les limites de débit et la taille de la file le permettent.
+
+        :param user_id: L'identifiant de l'utilisateur demandant la traduction.
+        :param guild_id: L'identifiant du serveur de l'utilisateur.
+        :param priority: La priorité de la traduction, les plus petites étant exécutées en premier.
+        :param run: La fonction lançant la traduction.
+        :param is_alive: La fonction indiquant, au moment de l'exécution, si la traduction est encore attendue.
+        :param admitted: Si la traduction poursuit une commande déjà admise (validation d'un menu de synonymes) : elle
+            ne consomme alors aucun jeton et n'est jamais refusée, même lorsque la file est pleine.
+        :return: Le futur du résultat de la traduction et le nombre de traductions à exécuter avant elle.
+        """
+        if not admitted:
+            buckets = self.check(user_id, guild_id)
+            if len(self.pending) >= self.maxsize:
+                raise QueueFull(len(self.pending))
+            for bucket in buckets:
+                bucket.take()
+
+        key = (priority, next(self.counter))
+        position = sum(1 for other in self.pending if other < key)
+        future = asyncio.get_running_loop().create_future()
+        self.pending.add(key)
+        self.queue.put_nowait((*key, future, run, is_alive))
+        return future, position
+
+    async def work(self) -> None:
+        """Exécute les traductions de la file, les unes après les autres."""
+        while True:
+            priority, order, future, run, is_alive = await self.queue.get()
+            self.pending.discard((priority, order))
+            if future.done():
+                continue
+            if not is_alive():
+                future.set_exception(JobCancelled("Interaction expired or user left"))
+                continue
+            try:
+                future.set_result(await run())
+            except asyncio.CancelledError:
+                future.set_exception(JobCancelled("Translation queue stopped"))
+                raise
+            except Exception as error:
+                future.set_exception(error)
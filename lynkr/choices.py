@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# Chemin vers le dossier principal du projet
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Chemin vers la mémoire des synonymes choisis par les utilisateurs
+CHOICES_PATH = MAIN_FOLDER / "assets/cache/lynkr/choices.sqlite3"
+# Nombre minimal de choix d'un lemme et part minimale du synonyme le plus choisi pour former un consensus
+CONSENSUS_MIN_COUNT = 5
+CONSENSUS_SHARE = 0.8
+# Nombre de lemmes dont les choix sont conservés en cache
+CHOICES_CACHE_SIZE = 4096
+
+# Synonyme enregistré lorsque l'utilisateur choisit de ne pas traduire un mot
+NO_SYNONYM = ""
+
+
+class ChoiceMemory:
+    """Mémoire de traduction des synonymes choisis par les utilisateurs, avec le nombre de fois où chacun l'a été.
+
+    Les choix sont indexés par (lemme, catégorie grammaticale) dans une base SQLite, ouverte à la première
+    utilisation et partagée par les threads du service.
+
+    :param path: Le chemin de la base SQLite.
+    :type path: Path
+    :param min_count: Le nombre minimal de choix d'un lemme pour former un consensus.
+    :type min_count: int
+    :param share: La part minimale des choix du synonyme le plus choisi pour former un consensus.
+    :type share: float
+    :param generation: Le nombre d'enregistrements de choix, pour reconnaître les résultats calculés avec des choix
+        dépassés.
+    :type generation: int
+    """
+
+    def __init__(self, path: Path = CHOICES_PATH, min_count: int = CONSENSUS_MIN_COUNT,
+                 share: float = CONSENSUS_SHARE) -> None:
+        """Initialise la mémoire de traduction.
+
+        :param path: Le chemin de la base SQLite.
+        :param min_count: Le nombre minimal de choix d'un lemme pour former un consensus.
+        :param share: La part minimale des choix du synonyme le plus choisi pour former un consensus.
+        """
+        self.path = path
+        self.min_count = min_count
+        self.share = share
+        self.connection: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+        self.cache: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self.generation = 0
+
+    def connect(self) -> sqlite3.Connection:
+        """Ouvre la base SQLite et crée sa table si besoin, à la première utilisation."""
+        if self.connection is None:
+            import sqlite3
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS choices (lemma TEXT NOT NULL, pos TEXT NOT NULL, "
+                               "synonym TEXT NOT NULL, count INTEGER NOT NULL, "
+                               "PRIMARY KEY (lemma, pos, synonym)) WITHOUT ROWID")
+            self.connection = connection
+        return self.connection
+
+    def record(self, choices: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """Enregistre des choix de synonymes.
+
+        :param choices: Les triplets (lemme, catégorie grammaticale, synonyme choisi), le synonyme valant `None` si
+            l'utilisateur a choisi de ne pas traduire le mot.
+        """
+        rows = [(lemma, pos, NO_SYNONYM if synonym is None else synonym) for lemma, pos, synonym in choices]
+        if len(rows) == 0:
+            return
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                connection.executemany("INSERT INTO choices VALUES (?, ?, ?, 1) ON CONFLICT (lemma, pos, synonym) "
+                                       "DO UPDATE SET count = count + 1", rows)
+            for lemma, pos, _ in rows:
+                self.cache.pop((lemma, pos), None)
+            self.generation += 1
+
+    def counts(self, lemma: str, pos: str) -> Dict[str, int]:
+        """Renvoie le nombre de fois où chaque synonyme a été choisi pour un lemme.
+
+        :param lemma: Le lemme du mot.
+        :param pos: La catégorie grammaticale du mot.
+        :return: Le nombre de choix de chaque synonyme, du plus au moins choisi.
+        """
+        key = (lemma, pos)
+        with self.lock:
+            if key not in self.cache:
+                if len(self.cache) >= CHOICES_CACHE_SIZE:
+                    self.cache.clear()
+                rows = self.connect().execute("SELECT synonym, count FROM choices WHERE lemma = ? AND pos = ? "
+                                              "ORDER BY count DESC", key)
+                self.cache[key] = dict(rows.fetchall())
+            return self.cache[key]
+
+    def rank(self, lemma: str, pos: str, synonyms: Sequence[str]) -> Tuple[str, ...]:
+        """Trie des synonymes du plus au moins choisi, les synonymes jamais choisis gardant leur ordre.
+
+        :param lemma: Le lemme du mot.
+        :param pos: La catégorie grammaticale du mot.
+        :param synonyms: Les synonymes à trier.
+        :return: Les synonymes triés.
+        """
+        counts = self.counts(lemma, pos)
+        return tuple(sorted(synonyms, key=lambda synonym: -counts.get(synonym, 0)))
+
+    def consensus(self, lemma: str, pos: str) -> Optional[str]:
+        """Renvoie le synonyme sur lequel les utilisateurs s'accordent clairement pour un lemme, s'il y en a un.
+
+        :param lemma: Le lemme du mot.
+        :param pos: La catégorie grammaticale du mot.
+        :return: Le synonyme consensuel, ou `None`.
+        """
+        counts = self.counts(lemma, pos)
+        total = sum(counts.values())
+        if total < self.min_count:
+            return None
+        synonym, count = next(iter(counts.items()))
+        if synonym == NO_SYNONYM or count < self.share * total:
+            return None
+        return synonym
@@ -0,0 +1,140 @@
+import asyncio
+from typing import Collection, Dict, List, Optional, Tuple, NamedTuple
+
+import aiohttp
+
+
+class LynkrServiceError(Exception):
+    """Erreur levée lorsque le service de traduction ne peut pas répondre à une requête."""
+
+
+class SynonymableToken(NamedTuple):
+    """Token du texte source nécessitant le choix d'un synonyme traduisible en Lynkr."""
+    index: int
+    text: str
+    lemma: str
+    synonyms: Tuple[str, ...]
+    confidence: Dict[str, float]
+    preferred: Optional[str]
+    consensus: bool
+
+
+class Translation(NamedTuple):
+    """Résultat d'une traduction en Lynkr renvoyé par le service."""
+    translation: str
+    synonymed: Tuple[Tuple[str, str, Optional[float]], ...]
+    # Lemmes dont la traduction est approximative, le service n'ayant pas pu rechercher leurs synonymes à temps
+    approximate: Tuple[str, ...] = ()
+    # Triplets (mot, lemme corrigé, confiance) des fautes de frappe corrigées par le service
+    corrected: Tuple[Tuple[str, str, float], ...] = ()
+
+
+class LynkrClient:
+    """Client du service de traduction Lynkr, réutilisant ses connexions d'une requête à l'autre.
+
+    :param url: L'adresse HTTP du service de traduction.
+    :type url: str
+    :param socket: Le chemin du socket Unix du service, prioritaire sur l'adresse TCP si défini.
+    :type socket: Optional[str]
+    :param timeout: Le délai maximal d'une requête au service, en secondes.
+    :type timeout: float
+    """
+
+    def __init__(self, url: str = "http://127.0.0.1:8765", socket: Optional[str] = None,
+                 timeout: float = 60.0) -> None:
+        """Initialise le client du service de traduction.
+
+        :param url: L'adresse HTTP du service de traduction.
+        :param socket: Le chemin du socket Unix du service, prioritaire sur l'adresse TCP si défini.
+        :param timeout: Le délai maximal d'une requête au service, en secondes.
+        """
+        # Avec un socket Unix, l'hôte de l'adresse est ignoré mais reste nécessaire à aiohttp
+        self.url = "http://localhost" if socket else url.rstrip("/")
+        self.socket = socket
+        self.timeout = timeout
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> None:
+        """Ouvre la session HTTP partagée par toutes les requêtes au service."""
+        if self.session is None or self.session.closed:
+            if self.socket:
+                connector = aiohttp.UnixConnector(path=self.socket)
+            else:
+                connector = aiohttp.TCPConnector(limit=32)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+    async def close(self) -> None:
+        """Ferme la session HTTP du client."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _post(self, route: str, payload: dict) -> dict:
+        """Envoie une requête au service de traduction et renvoie sa réponse.
+
+        :param route: La route du service à appeler.
+        :param payload: Le corps JSON de la requête.
+        :return: Le corps JSON de la réponse.
+        """
+        await self.start()
+        try:
+            async with self.session.post(f"{self.url}{route}", json=payload) as response:
+                if response.status != 200:
+                    raise LynkrServiceError(f"{route} answered {response.status}: {await response.text()}")
+                return await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            raise LynkrServiceError(f"{route} is unreachable: {error!r}") from error
+
+    async def pretranslate(self, text: str) -> Tuple[SynonymableToken, ...]:
+        """Identifie les tokens d'un texte nécessitant un synonyme.
+
+        :param text: Le texte source à traduire en Lynkr.
+        :return: Les tokens nécessitant un synonyme, avec leurs synonymes traduisibles.
+        """
+        data = await self._post("/pretranslate", {"text": text})
+        return tuple(SynonymableToken(token["index"], token["text"], token["lemma"], tuple(token["synonyms"]),
+                                      token["confidence"], token["preferred"], token["consensus"])
+                     for token in data["tokens"])
+
+    async def translate(self, text: str, synonyms: Optional[Dict[int, Optional[str]]] = None,
+                        learn: Collection[int] = ()) -> Translation:
+        """Traduit un texte en Lynkr avec les synonymes choisis par l'utilisateur.
+
+        :param text: Le texte source à traduire en Lynkr.
+        :param synonyms: Un dictionnaire contenant les indices des tokens nécessitant un synonyme et leur synonyme
+            choisi, ou `None` pour ne pas les traduire.
+        :param learn: Les indices des tokens dont le synonyme a été choisi par l'utilisateur, que le service
+            enregistre dans sa mémoire des choix.
+        :return: La traduction en Lynkr, les triplets (mot, synonyme, confiance) utilisés, les lemmes approximés et
+            les corrections.
+        """
+        data = await self._post("/translate", {"text": text, "synonyms": synonyms or {}, "learn": list(learn)})
+        return Translation(data["translation"], tuple(tuple(triple) for triple in data["synonymed"]),
+                           tuple(data.get("approximate", ())),
+                           tuple(tuple(triple) for triple in data.get("corrected", ())))
+
+    async def fast_translate(self, text: str) -> Translation:
+        """Traduit un texte en Lynkr directement, avec les meilleurs synonymes contextuels.
+
+        :param text: Le texte source à traduire en Lynkr.
+        :return: La traduction en Lynkr, les triplets (mot, synonyme, confiance) utilisés, les lemmes approximés et
+            les corrections.
+        """
+        data = await self._post("/fast", {"text": text})
+        return Translation(data["translation"], tuple(tuple(triple) for triple in data["synonymed"]),
+                           tuple(data.get("approximate", ())),
+                           tuple(tuple(triple) for triple in data.get("corrected", ())))
+
+    async def batch_translate(self, texts: List[str]) -> Tuple[Translation, ...]:
+        """Traduit rapidement un lot de textes en Lynkr, le service ne retraduisant que les phrases nouvelles.
+
+        :param texts: Les textes sources à traduire en Lynkr.
+        :return: Pour chaque texte, la traduction en Lynkr, les triplets (mot, synonyme, confiance) utilisés, les
+            lemmes approximés et les corrections.
+        """
+        data = await self._post("/batch", {"texts": texts})
+        return tuple(Translation(result["translation"], tuple(tuple(triple) for triple in result["synonymed"]),
+                                 tuple(result.get("approximate", ())),
+                                 tuple(tuple(triple) for triple in result.get("corrected", ())))
+                     for result in data["translations"])
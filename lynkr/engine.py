@@ -0,0 +1,1377 @@
+from __future__ import annotations
+
+import os
+import re
+import csv
+import hashlib
+from pathlib import Path
+import time
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, Set, Tuple, Dict, Optional
+
+from lynkr.choices import ChoiceMemory
+from lynkr.express import SurfaceForm, express_analysis, load_surface_forms, plural_form
+from lynkr.fuzzy import Correction, FuzzyIndex
+from lynkr.lean import LEAN_MODEL_PATH
+from lynkr.lexicon import UNINFLECTED_VERBS, Lexicon, lexicon_lemmas_hash, load_lexicons
+from lynkr.numerals import numeral_spans, number_to_words
+from lynkr.thesaurus import load_thesaurus
+
+# Spacy, NumPy, requests et BeautifulSoup ne sont importés qu'à la première utilisation
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc, Token
+    from lynkr.vectors import VectorIndex
+
+# Chemin vers le dossier principal du projet
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Mode économe en mémoire : modèle aux vecteurs élagués
+MEMORY_LEAN = os.getenv("LYNKR_MEMORY_LEAN", "0") == "1"
+
+# Dictionnaire de traduction Commun -> Lynkr, projeté en mémoire depuis le lexique compilé s'il est à jour, chargé
+# à la première utilisation par `get_lexicons`
+LYNKR_SERIES: Optional[Dict[str, Lexicon]] = None
+# Faire la chasse aux adjectifs possessifs (màj : wtf, pourquoi j'ai écrit ça ???)
+
+# Chemin vers le fichier de mémoire
+MEMORY_PATH = MAIN_FOLDER / "assets/texts/csv/lynkr/memory.csv"
+# Verrou protégeant les écritures concurrentes dans le fichier de mémoire
+MEMORY_LOCK = threading.Lock()
+
+# Adresse des pages de synonymes du CNRTL
+CNRTL_URL = "https://www.cnrtl.fr/synonymie"
+# Nombre de pages de synonymes du CNRTL conservées en cache
+CNRTL_CACHE_SIZE = 4096
+# Recours au CNRTL pour les lemmes absents du thésaurus inversé, qui sinon n'ont pas de synonymes traduisibles
+CNRTL_FALLBACK = False
+# Délai maximal d'une requête au CNRTL, en secondes, du début de la connexion à la fin de la réception de la page
+CNRTL_TIMEOUT = 5.0
+# Taille des morceaux de la page du CNRTL lus entre deux vérifications du délai, en octets
+CNRTL_CHUNK_SIZE = 16384
+
+# Échéance de la requête en cours du service (horloge `time.monotonic`), définie par `request_budget`
+DEADLINE: ContextVar[Optional[float]] = ContextVar("lynkr_deadline", default=None)
+# Approximations faites faute de temps pendant la requête en cours du service, définies par `request_budget`
+APPROXIMATIONS: ContextVar[Optional[Approximations]] = ContextVar("lynkr_approximations", default=None)
+# Recherches de synonymes abandonnées faute de temps, en cours d'achèvement en arrière-plan
+PENDING_LOOKUPS: Set[Tuple[str, str]] = set()
+PENDING_LOOKUPS_LOCK = threading.Lock()
+
+# Mémoire des synonymes choisis par les utilisateurs, classant les synonymes proposés
+CHOICES = ChoiceMemory()
+
+# Thésaurus inversé (lemme, répertoire du CNRTL) -> lemmes traduisibles en Lynkr, construit hors ligne, chargé à la
+# première utilisation par `get_thesaurus`
+THESAURUS: Optional[Dict[Tuple[str, str], Tuple[str, ...]]] = None
+
+# Index vectoriels des lemmes traduisibles en Lynkr par tag Lynkr, construits hors ligne, chargés à la première
+# utilisation par `get_vector_indexes`
+VECTOR_INDEXES: Optional[Dict[str, VectorIndex]] = None
+# Similarité cosinus minimale d'un lemme du lexique proposé comme plus proche voisin vectoriel
+VECTOR_THRESHOLD = 0.5
+# Nombre maximal de plus proches voisins vectoriels proposés par token
+VECTOR_TOP_K = 3
+
+# Écriture des nombres dans les traductions : "digits" (en chiffres) ou "words" (en toutes lettres)
+NUMERAL_OUTPUT = "digits"
+
+# Séparateurs des phrases d'un message, traduites et mises en cache indépendamment
+SENTENCE_SEPARATOR = re.compile(r"((?<=[.!?…])\s+|\n+)")
+# Nombre de traductions rapides de phrases conservées en cache, par empreinte de la phrase et génération de la mémoire
+# des choix
+SENTENCE_CACHE_SIZE = 8192
+SENTENCE_CACHE: OrderedDict[str, Tuple[str, Tuple[Tuple[str, str, Optional[float]], ...],
+                                       Tuple[Tuple[str, str, float], ...]]] = OrderedDict()
+SENTENCE_CACHE_LOCK = threading.Lock()
+
+# Confiance minimale d'une correction de faute de frappe, supérieure à 1 pour ne jamais corriger
+CORRECTION_THRESHOLD = 0.75
+# Longueur minimale d'un mot corrigé, les mots courts ayant trop de voisins
+CORRECTION_MIN_LENGTH = 4
+# Similarité cosinus minimale entre un mot connu du modèle et sa correction, écartant les vrais mots absents du lexique
+CORRECTION_VECTOR_THRESHOLD = 0.4
+# Index de suppressions des formes des lemmes du lexique, construit à la première utilisation par `get_fuzzy_index`
+FUZZY_INDEX: Optional[FuzzyIndex] = None
+
+# Chemin express sans Spacy, pour les textes dont tous les mots sont des formes de surface connues et non ambiguës
+EXPRESS = True
+# Table des formes de surface du chemin express, construite hors ligne, chargée à la première utilisation par
+# `get_surface_forms`
+SURFACE_FORMS: Optional[Dict[str, SurfaceForm]] = None
+
+# Modèle de langage pré-entrainé Spacy pour le français, aux vecteurs élagués en mode économe en mémoire, chargé à la
+# première utilisation par `get_nlp`
+NLP: Optional[Language] = None
+
+# Verrou protégeant le chargement des ressources, partagées par tous les threads du service
+RESOURCES_LOCK = threading.RLock()
+
+# Configuration du logger du moteur de traduction
+logger = logging.getLogger("lynkr.engine")
+
+
+def get_lexicons() -> Dict[str, Lexicon]:
+    """Fonction pour obtenir le dictionnaire de traduction Commun -> Lynkr, en le chargeant à la première utilisation.
+
+    :return: Le lexique de chaque tag Lynkr.
+    """
+    global LYNKR_SERIES
+    if LYNKR_SERIES is None:
+        with RESOURCES_LOCK:
+            if LYNKR_SERIES is None:
+                LYNKR_SERIES = load_lexicons()
+    return LYNKR_SERIES
+
+
+def get_thesaurus() -> Dict[Tuple[str, str], Tuple[str, ...]]:
+    """Fonction pour obtenir le thésaurus inversé, en le chargeant à la première utilisation.
+
+    Un thésaurus construit à partir d'un autre lexique est ignoré.
+
+    :return: Le thésaurus inversé (lemme, répertoire du CNRTL) -> lemmes traduisibles en Lynkr.
+    """
+    global THESAURUS
+    if THESAURUS is None:
+        with RESOURCES_LOCK:
+            if THESAURUS is None:
+                thesaurus = load_thesaurus(lexicon_hash=lexicon_lemmas_hash(get_lexicons()))
+                if len(thesaurus) == 0 and not CNRTL_FALLBACK:
+                    logger.warning("Thésaurus inversé absent et recours au CNRTL désactivé : aucun synonyme ne sera "
+                                   "proposé")
+                THESAURUS = thesaurus
+    return THESAURUS
+
+
+def get_vector_indexes() -> Dict[str, VectorIndex]:
+    """Fonction pour obtenir les index vectoriels du lexique, en les chargeant (avec NumPy) à la première utilisation.
+
+    Les index construits à partir d'un autre lexique sont ignorés.
+
+    :return: L'index vectoriel de chaque tag Lynkr.
+    """
+    global VECTOR_INDEXES
+    if VECTOR_INDEXES is None:
+        with RESOURCES_LOCK:
+            if VECTOR_INDEXES is None:
+                from lynkr.vectors import VECTORS_FOLDER, load_vector_indexes
+                VECTOR_INDEXES = load_vector_indexes(VECTORS_FOLDER, lexicon_lemmas_hash(get_lexicons()))
+    return VECTOR_INDEXES
+
+
+def get_surface_forms() -> Dict[str, SurfaceForm]:
+    """Fonction pour obtenir la table des formes de surface du chemin express, en la chargeant à la première
+    utilisation.
+
+    :return: L'analyse de chaque forme de surface, en minuscules.
+    """
+    global SURFACE_FORMS
+    if SURFACE_FORMS is None:
+        with RESOURCES_LOCK:
+            if SURFACE_FORMS is None:
+                SURFACE_FORMS = load_surface_forms()
+    return SURFACE_FORMS
+
+
+def get_fuzzy_index() -> FuzzyIndex:
+    """Fonction pour obtenir l'index des fautes de frappe, en le construisant à la première utilisation.
+
+    L'index couvre les lemmes du lexique, leur pluriel régulier et les formes fléchies de la table des formes de
+    surface.
+
+    :return: L'index des formes des lemmes du lexique.
+    """
+    global FUZZY_INDEX
+    if FUZZY_INDEX is None:
+        with RESOURCES_LOCK:
+            if FUZZY_INDEX is None:
+                lexicons = get_lexicons()
+                forms = [(lemma, lemma, tag) for tag, series in lexicons.items() for lemma in series]
+                forms.extend((plural_form(lemma), lemma, "GRAMNUM") for lemma in lexicons["GRAMNUM"]
+                             if " " not in lemma)
+                forms.extend((text, form.lemma, form.tag) for text, form in get_surface_forms().items()
+                             if form.tag in lexicons and form.lemma in lexicons[form.tag])
+                FUZZY_INDEX = FuzzyIndex(forms)
+    return FUZZY_INDEX
+
+
+def get_nlp() -> Language:
+    """Fonction pour obtenir le modèle de langage Spacy, en le chargeant à la première utilisation.
+
+    Le premier appel importe Spacy, applique les propriétés personnalisées aux tokens et ajoute le composant
+    `lynkr_numerals` au modèle.
+
+    :return: Le modèle de langage Spacy, prêt à analyser les textes à traduire.
+    """
+    global NLP
+    if NLP is None:
+        with RESOURCES_LOCK:
+            if NLP is None:
+                import spacy
+                from spacy.language import Language
+
+                # Configuration du logger pour Spacy
+                logging.getLogger("spacy").setLevel(logging.ERROR)
+
+                register_extensions()
+                Language.component("lynkr_numerals", func=lynkr_numerals_component)
+                if MEMORY_LEAN and not LEAN_MODEL_PATH.is_dir():
+                    logger.warning("Mode économe en mémoire demandé mais modèle élagué introuvable (%s), chargement "
+                                   "de fr_core_news_lg : construire le modèle avec `python -m lynkr.lean`",
+                                   LEAN_MODEL_PATH)
+                nlp = spacy.load(LEAN_MODEL_PATH if MEMORY_LEAN and LEAN_MODEL_PATH.is_dir() else "fr_core_news_lg")
+                nlp.add_pipe("lynkr_numerals", last=True)
+                NLP = nlp
+    return NLP
+
+
+def load() -> None:
+    """Fonction pour charger d'avance toutes les ressources du moteur, au démarrage d'un service."""
+    get_lexicons()
+    get_thesaurus()
+    get_vector_indexes()
+    get_surface_forms()
+    get_fuzzy_index()
+    get_nlp()
+
+
+class DeadlineExceeded(Exception):
+    """Erreur levée lorsqu'une recherche de synonymes dépasserait l'échéance de la requête en cours."""
+
+
+class Approximations(NamedTuple):
+    """Approximations faites faute de temps pendant une requête du service."""
+    # Paires (lemme, répertoire du CNRTL) dont les synonymes n'ont pas pu être récupérés à temps
+    lookups: Set[Tuple[str, str]]
+    # Lemmes traduits par le synonyme le plus choisi plutôt que par le meilleur synonyme contextuel
+    rankings: Set[str]
+
+
+@contextmanager
+def request_budget(seconds: Optional[float]) -> Iterator[Approximations]:
+    """Gestionnaire de contexte limitant la durée des recherches de synonymes d'une requête du service.
+
+    Les recherches de synonymes sur le site du CNRTL et le classement contextuel des synonymes qui ne peuvent aboutir
+    avant l'échéance sont abandonnés au profit du cache, de la mémoire des choix ou d'une traduction partielle, et
+    recensés dans les approximations renvoyées.
+
+    :param seconds: La durée allouée à la requête, en secondes, ou `None` pour ne pas la limiter.
+    :return: Les approximations faites pendant la requête, remplies au fil de la traduction.
+    """
+    approximations = Approximations(set(), set())
+    deadline = DEADLINE.set(None if seconds is None else time.monotonic() + seconds)
+    context = APPROXIMATIONS.set(approximations)
+    try:
+        yield approximations
+    finally:
+        DEADLINE.reset(deadline)
+        APPROXIMATIONS.reset(context)
+
+
+def remaining_time() -> Optional[float]:
+    """Fonction pour obtenir le temps restant avant l'échéance de la requête en cours.
+
+    :return: Le temps restant, en secondes, ou `None` si la requête n'a pas d'échéance.
+    """
+    deadline = DEADLINE.get()
+    if deadline is not None:
+        return deadline - time.monotonic()
+
+
+def approximated_lemmas(untranslated: Iterable[TranslatedToken],
+                        synonymed: Iterable[Tuple[str, str, Optional[float]]]) -> Tuple[str, ...]:
+    """Fonction pour obtenir les lemmes d'une traduction approximés faute de temps pendant la requête en cours.
+
+    :param untranslated: Les enregistrements des tokens non traduits de la traduction.
+    :param synonymed: Les triplets (mot, synonyme, confiance) utilisés par la traduction.
+    :return: Les lemmes, non traduits ou traduits par un synonyme, dont la traduction est approximative.
+    """
+    approximations = APPROXIMATIONS.get()
+    if approximations is None:
+        return ()
+    lookups = {lemma for lemma, _ in approximations.lookups}
+    lemmas = {record.lemma for record in untranslated if record.lemma in lookups}
+    lemmas.update(lemma for lemma, _, _ in synonymed if lemma in lookups or lemma in approximations.rankings)
+    return tuple(sorted(lemmas))
+
+
+def complete_lookups(lookups: Iterable[Tuple[str, str]]) -> None:
+    """Fonction pour achever en arrière-plan les recherches de synonymes abandonnées faute de temps, afin qu'elles
+    soient en cache pour les requêtes suivantes.
+
+    :param lookups: Les paires (lemme, répertoire du CNRTL) à rechercher.
+    """
+    with PENDING_LOOKUPS_LOCK:
+        lookups = set(lookups) - PENDING_LOOKUPS
+        PENDING_LOOKUPS.update(lookups)
+    try:
+        for lemma, directory in lookups:
+            try:
+                cnrtl_synonyms(lemma, directory)
+            except Exception as error:
+                logger.warning("Recherche des synonymes de \"%s\" impossible : %r", lemma, error)
+    finally:
+        with PENDING_LOOKUPS_LOCK:
+            PENDING_LOOKUPS.difference_update(lookups)
+
+
+# Getter de la propriété personnalisée `lynkr_tag` pour les tokens Spacy
+def lynkr_tag_getter(token: Token) -> str:
+    """Fonction pour obtenir le tag Lynkr d'un token donné.
+
+    :param token: Le token Spacy pour lequel le tag Lynkr doit être obtenu.
+    :return: Le tag Lynkr pour le token donné.
+    """
+    # Si le token fait partie d'un nombre, attribuer le tag Lynkr "NUM"
+    if token._.lynkr_numeral is not None:
+        return "NUM"
+    # Si le token est un adjectif, un nom ou un nom propre, attribuer le tag Lynkr "GRAMNUM" (accord en nombre)
+    elif token.pos_ in ("ADJ", "NOUN", "PROPN"):
+        return "GRAMNUM"
+    # Si le token est un auxiliaire ou un verbe, attribuer le tag Lynkr "GRAMCONJ" (conjugaison en temps)
+    elif token.pos_ in ("AUX", "VERB"):
+        return "GRAMCONJ"
+    # Si le token est un numéral, attribuer le tag Lynkr "NUM"
+    # Si le token est une ponctuation, attribuer le tag Lynkr "PUNCT"
+    elif token.pos_ in ("NUM", "PUNCT"):
+        return token.pos_
+    # Si le token est une particule de négation "ne" ou "pas", oattribuer le tag Lynkr "PART"
+    elif token.pos_ == "ADV" and token.lemma_ in ("ne", "pas"):
+        return "PART"
+    # Sinon, attribuer le tag Lynkr "X"
+    else:
+        return "X"
+
+
+def format_numeral(number: int, digits: Optional[str] = None) -> str:
+    """Fonction pour écrire un nombre dans une traduction en Lynkr, selon le mode d'écriture des nombres.
+
+    :param number: Le nombre à écrire.
+    :param digits: L'écriture en chiffres du nombre dans le texte source, recopiée telle quelle en mode chiffres
+        (zéros de tête de "007" compris), ou `None` s'il est écrit en toutes lettres.
+    :return: Le nombre écrit en chiffres, ou en toutes lettres traduites en Lynkr lorsque le lexique le permet.
+    """
+    if NUMERAL_OUTPUT == "words":
+        series = get_lexicons()["X"]
+        return " ".join(series[word] if word in series else word for word in number_to_words(number).split())
+    return digits if digits is not None else str(number)
+
+
+# Composant Spacy regroupant les nombres écrits sur plusieurs tokens
+def lynkr_numerals_component(doc: Doc) -> Doc:
+    """Composant Spacy pour reconnaître les nombres d'un doc et les convertir en une seule passe par nombre.
+
+    :param doc: Le doc Spacy à analyser.
+    :return: Le doc Spacy, dont les tokens des nombres ont reçu leur traduction.
+    """
+    for start, end, number in numeral_spans([token.text for token in doc], [token.pos_ == "NUM" for token in doc]):
+        text = doc[start].text
+        doc[start]._.lynkr_numeral = format_numeral(number, text if text.isdecimal() else None)
+        for token in doc[start + 1:end]:
+            token._.lynkr_numeral = ""
+    return doc
+
+
+# Sous-fonction de la fonction `lynkr_compatible_synonyms_getter`
+@lru_cache(maxsize=CNRTL_CACHE_SIZE)
+def cnrtl_synonyms(lemma: str, directory: str) -> Tuple[str, ...]:
+    """Fonction pour obtenir les synonymes d'un lemme sur le site du CNRTL, mis en cache pour tous les utilisateurs.
+
+    La requête est limitée par `CNRTL_TIMEOUT` et par le temps restant avant l'échéance de la requête en cours. Ce
+    délai borne chaque attente de `requests` (connexion, réception d'un morceau) et la durée totale, vérifiée entre
+    deux morceaux de la page : une page reçue au compte-gouttes ne peut donc dépasser le délai que d'une attente.
+    Les échecs ne sont pas mis en cache.
+
+    :param lemma: Le lemme dont les synonymes doivent être obtenus.
+    :param directory: Le répertoire grammatical du CNRTL dans lequel rechercher.
+    :return: Un tuple contenant les synonymes du lemme.
+    """
+    import requests
+    from bs4 import BeautifulSoup
+
+    # Ne pas lancer de requête si l'échéance de la requête en cours est dépassée
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded(f"No time left to look up \"{lemma}\"")
+
+    # Récupération de la page de synonymes sur le site du CNRTL, par morceaux pour en borner la durée totale
+    timeout = CNRTL_TIMEOUT if remaining is None else min(CNRTL_TIMEOUT, remaining)
+    deadline = time.monotonic() + timeout
+    chunks = []
+    with requests.get(f"{CNRTL_URL}/{lemma}/{directory}", timeout=timeout, stream=True) as response:
+        for chunk in response.iter_content(chunk_size=CNRTL_CHUNK_SIZE):
+            chunks.append(chunk)
+            if time.monotonic() > deadline:
+                raise DeadlineExceeded(f"CNRTL page of \"{lemma}\" took more than {timeout:.1f} s")
+    soup = BeautifulSoup(b"".join(chunks), "html.parser")
+
+    # Extraction des synonymes de la page
+    return tuple(map(lambda x: x.a.text, soup.find_all("td", attrs={"class": "syno_format"})))
+
+
+# Sous-fonction de la fonction `lynkr_compatible_synonyms_getter`
+def cnrtl_synonyms_within_budget(lemma: str, directory: str) -> Tuple[str, ...]:
+    """Fonction pour obtenir les synonymes d'un lemme sur le site du CNRTL avant l'échéance de la requête en cours.
+
+    :param lemma: Le lemme dont les synonymes doivent être obtenus.
+    :param directory: Le répertoire grammatical du CNRTL dans lequel rechercher.
+    :return: Un tuple contenant les synonymes du lemme, vide si la recherche n'a pas abouti à temps.
+    """
+    approximations = APPROXIMATIONS.get()
+    # Hors d'une requête du service, les échecs sont remontés tels quels
+    if approximations is None:
+        return cnrtl_synonyms(lemma, directory)
+    # Ne pas relancer une recherche déjà abandonnée pendant la requête en cours
+    if (lemma, directory) in approximations.lookups:
+        return ()
+
+    # Les erreurs de `requests` dérivent de `OSError`, comme les erreurs réseau
+    try:
+        return cnrtl_synonyms(lemma, directory)
+    except (DeadlineExceeded, OSError):
+        approximations.lookups.add((lemma, directory))
+        return ()
+
+
+# Sous-fonction de la fonction `lynkr_compatible_synonyms_getter`
+def cnrtl_directory(pos: str) -> Optional[str]:
+    """Fonction pour obtenir le répertoire grammatical du CNRTL correspondant à une catégorie grammaticale Spacy.
+
+    :param pos: La catégorie grammaticale Spacy.
+    :return: Le répertoire du CNRTL, ou `None` si la catégorie n'a pas de synonymes traduisibles en Lynkr.
+    """
+    # Si le token est un nom propre, une ponctuation ou un symbole, il n'a pas de synonymes traduisibles Lynkr
+    if pos in ("PROPN", "PUNCT", "SYM"):
+        return None
+    # Si le token est un adjectif, rechercher dans le répertoire "adjectif"
+    elif pos == "ADJ":
+        return "adjectif"
+    # Si le token est un nom, rechercher dans le répertoire "substantif"
+    elif pos == "NOUN":
+        return "substantif"
+    # Si le token est un auxiliaire ou un verbe, rechercher dans le répertoire "verbe"
+    elif pos in ("AUX", "VERB"):
+        return "verbe"
+    # Si le token est un adverbe, rechercher dans le répertoire "adverbe"
+    elif pos == "ADV":
+        return "adverbe"
+    # Si le token est une interjection, rechercher dans le répertoire "interjection"
+    elif pos == "INTJ":
+        return "interjection"
+    # Sinon, rechercher dans tous les répertoires
+    else:
+        return ""
+
+
+# Getter de la propriété personnalisée `lynkr_compatible_synonyms` pour les tokens Spacy
+def lynkr_compatible_synonyms_getter(token: Token) -> Tuple[str] | Tuple:
+    """Fonction pour obtenir les synonymes traduisibles en Lynkr d'un token donné.
+
+    Les synonymes sont cherchés dans le thésaurus inversé construit hors ligne, puis sur le site du CNRTL si le lemme
+    en est absent, que le recours au CNRTL est autorisé et que les utilisateurs ne s'accordent pas déjà sur un
+    synonyme. Ils sont triés du plus au moins choisi par les utilisateurs.
+
+    :param token: Le token Spacy pour lequel les synonymes traduisibles en Lynkr doivent être obtenus.
+    :return: Un tuple contenant les synonymes traduisibles en Lynkr pour le token donné.
+    """
+    directory = cnrtl_directory(token.pos_)
+    if directory is None:
+        return ()
+
+    # Recherche des synonymes dans le thésaurus inversé
+    synonyms = get_thesaurus().get((token.lemma_, directory))
+
+    # À défaut, se contenter des synonymes déjà choisis s'ils font consensus, sinon les récupérer sur le site du CNRTL
+    if synonyms is None:
+        if CHOICES.consensus(token.lemma_, token.pos_) is not None:
+            synonyms = tuple(CHOICES.counts(token.lemma_, token.pos_))
+        elif CNRTL_FALLBACK:
+            synonyms = cnrtl_synonyms_within_budget(token.lemma_, directory)
+        else:
+            synonyms = ()
+
+    # Filtrage des synonymes pour ne conserver que ceux traduisibles en Lynkr, du plus au moins choisi
+    series = get_lexicons()[token._.lynkr_tag]
+    synonyms = CHOICES.rank(token.lemma_, token.pos_, [synonym for synonym in synonyms if synonym in series])
+
+    # À défaut, proposer les plus proches voisins vectoriels du token dans le lexique
+    if len(synonyms) == 0 and token._.lynkr_vector_synonyms is not None:
+        return CHOICES.rank(token.lemma_, token.pos_, tuple(token._.lynkr_vector_synonyms))
+    return synonyms
+
+
+# Getter de la propriété personnalisée `lynkr_preferred_synonym` pour les tokens Spacy
+def lynkr_preferred_synonym_getter(token: Token) -> Optional[str]:
+    """Fonction pour obtenir le synonyme traduisible le plus choisi par les utilisateurs pour un token donné.
+
+    :param token: Le token Spacy pour lequel le synonyme préféré doit être obtenu.
+    :return: Le synonyme traduisible le plus choisi, ou `None` si aucun ne l'a jamais été.
+    """
+    synonyms = token._.lynkr_compatible_synonyms
+    if len(synonyms) > 0 and CHOICES.counts(token.lemma_, token.pos_).get(synonyms[0], 0) > 0:
+        return synonyms[0]
+
+
+# Getter de la propriété personnalisée `lynkr_consensus_synonym` pour les tokens Spacy
+def lynkr_consensus_synonym_getter(token: Token) -> Optional[str]:
+    """Fonction pour obtenir le synonyme traduisible sur lequel les utilisateurs s'accordent pour un token donné.
+
+    :param token: Le token Spacy pour lequel le synonyme consensuel doit être obtenu.
+    :return: Le synonyme consensuel, s'il est traduisible, ou `None`.
+    """
+    consensus = CHOICES.consensus(token.lemma_, token.pos_)
+    if consensus is not None and consensus in token._.lynkr_compatible_synonyms:
+        return consensus
+
+
+# Getter de la propriété personnalisée `lynkr_synonym_confidence` pour les tokens Spacy
+def lynkr_synonym_confidence_getter(token: Token) -> Optional[float]:
+    """Fonction pour obtenir la confiance dans le synonyme appliqué à un token, s'il est un voisin vectoriel.
+
+    :param token: Le token Spacy pour lequel la confiance doit être obtenue.
+    :return: La similarité cosinus du synonyme appliqué, ou `None` s'il provient du CNRTL.
+    """
+    if token._.lynkr_vector_synonyms is not None:
+        return token._.lynkr_vector_synonyms.get(token._.lynkr_applied_synonym)
+
+
+def assign_vector_synonyms(doc: Doc) -> None:
+    """Fonction pour assigner aux tokens sans traduction ni synonyme leurs plus proches voisins vectoriels du lexique.
+
+    Les tokens d'un même tag Lynkr sont recherchés ensemble, en un seul calcul matriciel par tag.
+
+    :param doc: Le doc Spacy dont les tokens doivent recevoir leurs voisins vectoriels.
+    """
+    import numpy as np
+
+    vector_indexes, vocab = get_vector_indexes(), get_nlp().vocab
+
+    # Regrouper par tag Lynkr les tokens sans traduction ni synonyme traduisible
+    pending = defaultdict(list)
+    for token in doc:
+        if (token._.lynkr_tag in vector_indexes and token.has_vector and token._.lynkr_lemma_translation is None
+                and len(token._.lynkr_compatible_synonyms) == 0):
+            pending[token._.lynkr_tag].append(token)
+
+    # Rechercher les plus proches voisins des vecteurs des lemmes, à défaut de ceux des tokens, en ne gardant que
+    # ceux encore présents dans le lexique
+    for tag, tokens in pending.items():
+        series = get_lexicons()[tag]
+        queries = np.vstack([vocab[token.lemma_].vector if vocab[token.lemma_].has_vector else token.vector
+                             for token in tokens])
+        for token, neighbours in zip(tokens, vector_indexes[tag].nearest(queries, VECTOR_TOP_K, VECTOR_THRESHOLD)):
+            neighbours = [(lemma, similarity) for lemma, similarity in neighbours if lemma in series]
+            if len(neighbours) > 0:
+                token._.lynkr_vector_synonyms = dict(neighbours)
+
+
+def assign_corrections(doc: Doc) -> None:
+    """Fonction pour corriger les fautes de frappe des tokens absents du lexique, avant toute recherche de synonymes.
+
+    Un token est corrigé par la forme du lexique la plus proche de même tag Lynkr, sans tenir compte des accents, si
+    la confiance de la correction atteint `CORRECTION_THRESHOLD` et, lorsque le modèle connaît le mot, si les deux
+    sont proches dans l'espace vectoriel. Les noms propres et les mots du thésaurus inversé ne sont pas corrigés.
+
+    :param doc: Le doc Spacy dont les tokens doivent recevoir leur correction.
+    """
+    if CORRECTION_THRESHOLD > 1:
+        return
+    for token in doc:
+        if token._.lynkr_tag not in ("GRAMNUM", "GRAMCONJ", "X") or token.pos_ == "PROPN" or not token.is_alpha \
+                or len(token.text) < CORRECTION_MIN_LENGTH or token._.lynkr_lemma_translation is not None:
+            continue
+        # Un lemme du thésaurus inversé est un vrai mot, dont les synonymes sont connus
+        directory = cnrtl_directory(token.pos_)
+        if directory is not None and (token.lemma_, directory) in get_thesaurus():
+            continue
+
+        correction = get_fuzzy_index().correct(token.lower_, token._.lynkr_tag)
+        if correction is None or correction.confidence < CORRECTION_THRESHOLD:
+            continue
+        lexeme = token.vocab[correction.lemma]
+        if token.has_vector and lexeme.has_vector and token.similarity(lexeme) < CORRECTION_VECTOR_THRESHOLD:
+            continue
+        token._.lynkr_correction = correction
+
+
+def parse(text: str) -> Doc:
+    """Fonction pour analyser un texte à traduire en Lynkr.
+
+    :param text: Le texte source à traduire en Lynkr.
+    :return: Le doc Spacy du texte, dont les fautes de frappe ont été corrigées et dont les tokens sans synonyme ont
+        reçu leurs voisins vectoriels.
+    """
+    doc = get_nlp()(text)
+    assign_corrections(doc)
+    assign_vector_synonyms(doc)
+    return doc
+
+
+# Sous-fonction de la fonction `lynkr_lemma_translation_getter`
+def lynkr_lemma_translation_default(token: Token) -> Optional[str]:
+    """Fonction pour obtenir la traduction du lemme en Lynkr d'un token avec le tag Lynkr `GRAMNUM`, `GRAMCONJ` ou `X`.
+
+    :param token: Le token Spacy pour lequel la traduction du lemme en Lynkr doit être obtenue.
+    :return: La traduction du lemme en Lynkr pour le token donné.
+    """
+    # Sélection de la série correspondant au tag Lynkr du token
+    series = get_lexicons()[token._.lynkr_tag]
+
+    # Si le lemme du token est traduisible, renvoyer sa traduction correspondante
+    if token.lemma_ in series:
+        return series[token.lemma_]
+
+    # Sinon, si le token est une faute de frappe corrigée, renvoyer la traduction du lemme corrigé
+    elif token._.lynkr_correction is not None:
+        return series[token._.lynkr_correction.lemma]
+
+
+# Sous-fonction de la fonction `lynkr_lemma_translation_getter`
+def lynkr_lemma_translation_num(token: Token) -> Optional[str]:
+    """Fonction pour obtenir la traduction en Lynkr d'un token avec le tag Lynkr `NUM`.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être obtenue.
+    :return: La traduction en Lynkr pour le token donné.
+    """
+    # Si le token fait partie d'un nombre reconnu, renvoyer la traduction du nombre
+    if token._.lynkr_numeral is not None:
+        return token._.lynkr_numeral
+
+    # Sinon, si le token est écrit en chiffres, renvoyer son texte tel quel
+    elif "d" in token.shape_:
+        return token.text
+
+
+# Sous-fonction de la fonction `lynkr_lemma_translation_getter`
+def lynkr_lemma_translation_punct(token: Token) -> str:
+    """Fonction pour obtenir la traduction en Lynkr d'un token avec le tag Lynkr `PUNCT`.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être obtenue.
+    :return: La traduction en Lynkr pour le token donné.
+    """
+    return token.text
+
+
+# Sous-fonction de la fonction `lynkr_lemma_translation_getter`
+def lynkr_lemma_translation_part() -> str:
+    """Fonction pour obtenir la traduction en Lynkr d'un token avec le tag Lynkr `PART`.
+
+    :return: La traduction en Lynkr d'un token avec le tag Lynkr `PART`.
+    """
+    return ""
+
+
+# Getter de la propriété personnalisée `lynkr_lemma_translation` pour les tokens Spacy
+def lynkr_lemma_translation_getter(token: Token) -> Optional[str]:
+    """Fonction pour obtenir la traduction du lemme en Lynkr d'un token donné.
+
+    :param token: Le token Spacy pour lequel la traduction du lemme en Lynkr doit être obtenue.
+    :return: La traduction du lemme en Lynkr pour le token donné.
+    """
+    # Si le tag Lynkr du token est parmi "GRAMNUM", "GRAMCONJ" ou "X", obtenir la traduction par défaut
+    if token._.lynkr_tag in ("GRAMNUM", "GRAMCONJ", "X"):
+        return lynkr_lemma_translation_default(token)
+    # Si le tag Lynkr du token est "NUM", obtenir la traduction numérale
+    elif token._.lynkr_tag == "NUM":
+        return lynkr_lemma_translation_num(token)
+    # Si le tag Lynkr du token est "PUNCT", obtenir la traduction de ponctuation
+    elif token._.lynkr_tag == "PUNCT":
+        return lynkr_lemma_translation_punct(token)
+    # Si le tag Lynkr du token est "PART", obtenir la traduction de particule
+    elif token._.lynkr_tag == "PART":
+        return lynkr_lemma_translation_part()
+
+
+# Sous-fonction de la fonction `lynkr_translation_method`
+def complete_lynkr_translation_gramnum(token: Token, lynkr: Optional[str] = None) -> Optional[str]:
+    """Fonction pour compléter la traduction en Lynkr d'un token avec le tag Lynkr `GRAMNUM`.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être complétée.
+    :param lynkr: La traduction actuelle du token en Lynkr.
+    :return: La traduction complétée du token en Lynkr.
+    """
+    # Si aucune traduction n'est fournie, utiliser la traduction du lemme du token
+    if lynkr is None:
+        translation = token._.lynkr_lemma_translation
+    else:
+        translation = lynkr
+
+    # Si une traduction est disponible, l'accorder en nombre
+    if translation is not None:
+        return inflect_number(translation, token.morph.to_dict()["Number"])
+
+
+# Sous-fonction des fonctions `complete_lynkr_translation_gramnum` et `express_translation`
+def inflect_number(translation: str, number: str) -> str:
+    """Fonction pour accorder en nombre la traduction en Lynkr d'un nom ou d'un adjectif.
+
+    :param translation: La traduction du lemme en Lynkr.
+    :param number: Le nombre du mot (trait morphologique `Number`).
+    :return: La traduction accordée.
+    """
+    # Si le mot est au pluriel et que sa traduction ne se termine pas déjà par un "s", en ajouter un
+    if (number == "Plur") and (translation[-1] != "s"):
+        return f"{translation}s"
+    else:
+        return translation
+
+
+# Sous-fonction de la fonction `lynkr_translation_method`
+def complete_lynkr_translation_gramconj(token: Token, lynkr: Optional[str] = None) -> Optional[str]:
+    """Fonction pour compléter la traduction en Lynkr d'un token avec le tag Lynkr `GRAMCONJ`.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être complétée.
+    :param lynkr: La traduction actuelle du token en Lynkr.
+    :return: La traduction complétée du token en Lynkr.
+    """
+    # Si aucune traduction n'est fournie, utiliser la traduction du lemme du token
+    if lynkr is None:
+        translation = token._.lynkr_lemma_translation
+    else:
+        translation = lynkr
+
+    # Si une traduction est disponible :
+    if translation is not None:
+
+        # Déterminer la polarité du verbe en examinant les deux tokens précédents
+        polarity = ""
+        for i in range(-1, -3, -1):
+            try:
+                prev_token = token.nbor(i)
+            except IndexError:
+                break
+            else:
+                if prev_token.lemma_ == "ne":
+                    polarity = "fran-"
+                    break
+
+        # Si le verbe n'est ni "mourir" ni "vivre", le conjuguer selon son temps
+        tense = token.morph.to_dict()["Tense"] if token.lemma_ not in UNINFLECTED_VERBS else ""
+        return inflect_tense(translation, tense, polarity)
+
+
+# Sous-fonction des fonctions `complete_lynkr_translation_gramconj` et `express_translation`
+def inflect_tense(translation: str, tense: str, polarity: str) -> str:
+    """Fonction pour conjuguer la traduction en Lynkr d'un verbe.
+
+    :param translation: La traduction du lemme en Lynkr.
+    :param tense: Le temps du verbe (trait morphologique `Tense`), vide pour ne pas le conjuguer.
+    :param polarity: Le préfixe de la forme négative, vide à la forme affirmative.
+    :return: La traduction conjuguée.
+    """
+    if tense == "Pres":
+        return f"{polarity}{translation[:-1]}"
+    elif tense == "Past":
+        return f"{polarity}{translation[:-1]}p"
+    elif tense == "Fut":
+        return f"{polarity}{translation[:-1]}f"
+    return f"{polarity}{translation}"
+
+
+# Sous-fonction de la fonction `lynkr_translation_method`
+def complete_lynkr_translation_x(token: Token, lynkr: Optional[str] = None) -> Optional[str]:
+    """Fonction pour compléter la traduction en Lynkr d'un token avec le tag Lynkr `X`.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être complétée.
+    :param lynkr: La traduction actuelle du token en Lynkr.
+    :return: La traduction complétée du token en Lynkr.
+    """
+    # Si aucune traduction n'est fournie, utiliser la traduction du lemme du token
+    if lynkr is None:
+        translation = token._.lynkr_lemma_translation
+    else:
+        translation = lynkr
+
+    # Si une traduction est disponible, la renvoyer
+    if translation is not None:
+        return translation
+
+
+# Méthode personnalisée `lynkr_translation` pour les tokens Spacy
+def lynkr_translation_method(token: Token, synonym: Optional[str] = None) -> Optional[str]:
+    """Fonction pour obtenir la traduction en Lynkr d'un token Spacy.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr doit être obtenue.
+    :param synonym: Le synonyme à utiliser pour la traduction Lynkr, si nécessaire.
+    """
+    # Obtenir la traduction du lemme en Lynkr du token
+    translation = token._.lynkr_lemma_translation
+
+    # Si le tag Lynkr du token est parmi "GRAMNUM", "GRAMCONJ" ou "X" :
+    if token._.lynkr_tag in ("GRAMNUM", "GRAMCONJ", "X"):
+        series = get_lexicons()[token._.lynkr_tag]
+
+        # Si aucune traduction n'est disponible pour le token :
+        if translation is None:
+
+            # Si un synonyme est fourni et qu'il est traduisible en Lynkr, utiliser sa traduction
+            if synonym is not None:
+                if synonym in token._.lynkr_compatible_synonyms:
+                    translation = series[synonym]
+                    token._.lynkr_applied_synonym = synonym
+
+            # Si aucun synonyme n'est fourni, utiliser le synonyme le plus choisi par les utilisateurs
+            elif token._.lynkr_preferred_synonym is not None:
+                translation = series[token._.lynkr_preferred_synonym]
+                token._.lynkr_applied_synonym = token._.lynkr_preferred_synonym
+
+            # Sinon, si les synonymes sont des voisins vectoriels, utiliser le plus proche
+            elif token._.lynkr_vector_synonyms is not None:
+                best_synonym = next(iter(token._.lynkr_vector_synonyms))
+                translation = series[best_synonym]
+                token._.lynkr_applied_synonym = best_synonym
+
+            # Sinon, utiliser le meilleur synonyme traduisible en Lynkr, contextuellement
+            else:
+                if len(token._.lynkr_compatible_synonyms) > 0:
+                    # Faute de temps, se contenter du synonyme le plus choisi par les utilisateurs
+                    remaining = remaining_time()
+                    if remaining is not None and remaining <= 0:
+                        best_synonym = token._.lynkr_compatible_synonyms[0]
+                        APPROXIMATIONS.get().rankings.add(token.lemma_)
+                    else:
+                        best_synonym = max(get_nlp().pipe(token._.lynkr_compatible_synonyms),
+                                           key=lambda x: x.similarity(token.sent.as_doc())).text
+                    translation = series[best_synonym]
+                    token._.lynkr_applied_synonym = best_synonym
+
+        # Si une traduction est disponible :
+        if translation is not None:
+            # Compléter la traduction selon le tag Lynkr du token
+            if token._.lynkr_tag == "GRAMNUM":
+                translation = complete_lynkr_translation_gramnum(token, translation)
+            elif token._.lynkr_tag == "GRAMCONJ":
+                translation = complete_lynkr_translation_gramconj(token, translation)
+            elif token._.lynkr_tag == "X":
+                translation = complete_lynkr_translation_x(token, translation)
+
+    return translation
+
+
+# Sous-fonction de la fonction `get_nlp`
+def register_extensions() -> None:
+    """Fonction pour appliquer les propriétés, attributs et méthodes personnalisés aux tokens Spacy."""
+    from spacy.tokens import Token
+
+    # Application de la propriété `lynkr_tag` aux tokens Spacy
+    Token.set_extension("lynkr_tag", getter=lynkr_tag_getter)
+    # Application de l'attribut `lynkr_numeral` aux tokens Spacy : traduction du nombre commençant au token, ou chaîne
+    # vide pour les tokens suivants du même nombre, assignée par le composant `lynkr_numerals`
+    Token.set_extension("lynkr_numeral", default=None)
+    # Application de la propriété `lynkr_compatible_synonyms` aux tokens Spacy
+    Token.set_extension("lynkr_compatible_synonyms", getter=lynkr_compatible_synonyms_getter)
+    # Application des propriétés `lynkr_preferred_synonym` et `lynkr_consensus_synonym` aux tokens Spacy
+    Token.set_extension("lynkr_preferred_synonym", getter=lynkr_preferred_synonym_getter)
+    Token.set_extension("lynkr_consensus_synonym", getter=lynkr_consensus_synonym_getter)
+    # Application de l'attribut `lynkr_applied_synonym` aux tokens Spacy
+    Token.set_extension("lynkr_applied_synonym", default=None)
+    # Application de l'attribut `lynkr_vector_synonyms` aux tokens Spacy : plus proches voisins vectoriels du token dans
+    # le lexique et leur similarité, assignés par la fonction `assign_vector_synonyms`
+    Token.set_extension("lynkr_vector_synonyms", default=None)
+    # Application de l'attribut `lynkr_correction` aux tokens Spacy : correction de la faute de frappe du token par
+    # une forme du lexique, assignée par la fonction `assign_corrections`
+    Token.set_extension("lynkr_correction", default=None)
+    # Application de la propriété `lynkr_synonym_confidence` aux tokens Spacy
+    Token.set_extension("lynkr_synonym_confidence", getter=lynkr_synonym_confidence_getter)
+    # Application de la propriété `lynkr_lemma_translation` aux tokens Spacy
+    Token.set_extension("lynkr_lemma_translation", getter=lynkr_lemma_translation_getter)
+    # Application de la méthode `get_lynkr_translation` aux tokens Spacy
+    Token.set_extension("get_lynkr_translation", method=lynkr_translation_method)
+
+
+# Sous-fonction des fonctions `translation_commun_to_lynkr_synonym`, `translation_commun_to_lynkr_peut_etre`,
+# `translation_commun_to_lynkr_au_revoir` et `translation_commun_to_lynkr_default`
+def apply_case_to_lynkr(token: Token, lynkr: str) -> str:
+    """Fonction pour appliquer la casse à une traduction en Lynkr d'un token Spacy.
+
+    :param token: Le token Spacy duquel la casse est extraite.
+    :param lynkr: La traduction en Lynkr à formater.
+    :return: La traduction en Lynkr avec la casse appropriée.
+    """
+    return apply_case(token.shape_, lynkr)
+
+
+# Sous-fonction des fonctions `apply_case_to_lynkr` et `express_translation`
+def apply_case(shape: str, lynkr: str) -> str:
+    """Fonction pour appliquer à une traduction en Lynkr la casse d'un mot source.
+
+    :param shape: La forme du mot source (`Token.shape_`), ou le mot lui-même, dont la casse est identique.
+    :param lynkr: La traduction en Lynkr à formater.
+    :return: La traduction en Lynkr avec la casse appropriée.
+    """
+    if shape.islower():
+        return lynkr.lower()
+    elif shape.istitle():
+        return lynkr.title()
+    elif shape.isupper():
+        return lynkr.upper()
+    else:
+        return lynkr.capitalize()
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def translation_commun_to_lynkr_synonym(token: Token, synonym: str) -> str:
+    """Fonction pour obtenir la traduction en Lynkr formatée d'un token Spacy, à partir d'un synonyme spécifié.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr formatée doit être obtenue.
+    :param synonym: Le synonyme à utiliser pour la traduction en Lynkr.
+    :return: La traduction en Lynkr formatée du token.
+    """
+    return apply_case_to_lynkr(token, token._.get_lynkr_translation(synonym))
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def translation_commun_to_lynkr_none(token: Token) -> str:
+    """Fonction pour obtenir la traduction en Lynkr formatée d'un token Spacy, s'il n'est pas traduisible.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr formatée doit être obtenue.
+    :return: La traduction en Lynkr formatée du token.
+    """
+    return f"`{token.text}`"
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def translation_commun_to_lynkr_empty() -> str:
+    """Fonction pour obtenir la traduction en Lynkr formatée d'un token Spacy, si elle est vide.
+
+    :return: La traduction en Lynkr formatée du token.
+    """
+    return ""
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def translation_commun_to_lynkr_peut_etre(token: Token) -> str:
+    """Fonction pour obtenir la traduction en Lynkr formatée de l'expression "peut-être".
+
+    :param token: Le token Spacy source.
+    :return: La traduction en Lynkr formatée de l'expression "peut-être".
+    """
+    return apply_case_to_lynkr(token.nbor(-2), "pyeséa")
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def translation_commun_to_lynkr_au_revoir(token: Token) -> Tuple[str, str]:
+    """Fonction pour obtenir la traduction en Lynkr formatée de l'expression "au revoir".
+
+    :param token: Le token Spacy source.
+    :return: La traduction en Lynkr formatée de l'expression "au revoir".
+    """
+    return apply_case_to_lynkr(token.nbor(-1), "paers"), apply_case_to_lynkr(token, "esperita")  # Ajouter
+    # la réponse variante "paers amars"
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def translation_commun_to_lynkr_default(token: Token) -> str:
+    """Fonction pour obtenir la traduction en Lynkr formatée d'un token Spacy, avec sa traduction par défaut.
+
+    :param token: Le token Spacy pour lequel la traduction en Lynkr formatée doit être obtenue.
+    :return: La traduction en Lynkr formatée du token.
+    """
+    return apply_case_to_lynkr(token, token._.get_lynkr_translation())
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def translation_to_text(translation: List[str]) -> str:
+    """Fonction pour récupérer la traduction complète en Lynkr sous forme de texte.
+
+    :param translation: La traduction complète en Lynkr à convertir en texte.
+    :return: Le texte correspondant à la traduction complète en Lynkr.
+    """
+    # Ignorer les mots sans traduction (particules de négation, suites de nombres), qui n'ont pas d'espace à recevoir
+    translation = [word for word in translation if word != ""]
+    if len(translation) == 0:
+        return ""
+    text = [translation[0]]
+
+    # Parcourir chaque mot dans la traduction :
+    if len(translation) > 1:
+        for word in translation[1:]:
+
+            # Ajouter un espace, s'il n'y a pas de caractère spécial ouvrant avant
+            if (word not in ('"', ")", ",", "-", ".", "]", "}")) and (text[-1] not in ('"', "(", "-", "]", "}")):
+                text.append(" ")
+
+            # Ajouter un espace, si c'est un guillemet ouvrant
+            elif word == '"' and text.count('"') % 2 == 0:
+                text.append(" ")
+
+            # Ajouter un espace, s'il y a un guillemet fermant avant
+            elif (word not in (")", ",", "-", ".", "]", "}")) and (text[-1] == '"') and (text.count('"') % 2 == 0):
+                text.append(" ")
+
+            # Ajouter le mot
+            text.append(word)
+
+    return "".join(text)
+
+
+def pretranslation_commun_to_lynkr(text: str) -> Tuple[Doc, Tuple[int, ...] | Tuple]:
+    """Fonction pour préparer le texte à la traduction en Lynkr en identifiant les tokens nécessitant un synonyme.
+
+    :param text: Le texte source à traduire en Lynkr.
+    :return: Un tuple contenant le doc Spacy du texte et les indices des tokens nécessitant un synonyme.
+    """
+    doc = parse(text)
+    synonymable = []
+
+    # Parcourir chaque token dans le document Spacy :
+    for i, token in enumerate(doc):
+        # Si le token n'a pas de traduction en Lynkr mais a des synonymes compatibles avec Lynkr, récupérer son indice
+        if token._.lynkr_lemma_translation is None and len(token._.lynkr_compatible_synonyms) > 0:
+            synonymable.append(i)
+
+    return doc, tuple(synonymable)
+
+
+class TranslatedToken(NamedTuple):
+    """Traduction en Lynkr d'un token, détachée du doc Spacy qui l'a produite.
+
+    Le statut vaut "translated" (traduit), "synonym" (traduit par un synonyme), "untranslated" (non traduit, recopié
+    tel quel), "empty" (sans traduction, comme les particules) ou "expression" (partie d'une expression traduite d'un
+    bloc, comme "peut-être" ou "au revoir").
+    """
+    text: str
+    lemma: str
+    pos: str
+    shape: str
+    morph: str
+    lynkr: str
+    status: str
+    synonym: Optional[str] = None
+    confidence: Optional[float] = None
+    synonyms: Tuple[str, ...] = ()
+    correction: Optional[Correction] = None
+
+
+# Résultat d'une traduction : traduction complète en Lynkr, enregistrements des tokens non traduits, triplets (mot,
+# synonyme, confiance) utilisés et triplets (mot, lemme corrigé, confiance) des fautes de frappe corrigées
+TranslationResult = Tuple[str, Tuple[TranslatedToken, ...], Tuple[Tuple[str, str, Optional[float]], ...],
+                          Tuple[Tuple[str, str, float], ...]]
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def translated_token(token: Token, lynkr: str, status: str, synonyms: Tuple[str, ...] = ()) -> TranslatedToken:
+    """Fonction pour construire l'enregistrement de la traduction d'un token.
+
+    :param token: Le token Spacy traduit.
+    :param lynkr: La traduction en Lynkr formatée du token.
+    :param status: Le statut de la traduction.
+    :param synonyms: Les synonymes traduisibles proposés pour le token, conservés pour les tokens non traduits.
+    :return: L'enregistrement de la traduction du token.
+    """
+    synonym = token._.lynkr_applied_synonym if status == "synonym" else None
+    confidence = token._.lynkr_synonym_confidence if status == "synonym" else None
+    return TranslatedToken(token.text, token.lemma_, token.pos_, token.shape_, str(token.morph), lynkr, status,
+                           synonym, confidence, synonyms, token._.lynkr_correction)
+
+
+# Sous-fonction de la fonction `iter_lynkr_translation`
+def closes_expression(token: Token, synonyms: Dict[int, str]) -> bool:
+    """Fonction pour vérifier que le dernier token d'une expression ("être" de "peut-être", "revoir" de "au revoir")
+    aurait reçu sa traduction par défaut, l'expression n'étant traduite d'un bloc que dans ce cas.
+
+    Un token au synonyme choisi, sans traduction ou à la traduction vide est traduit seul, comme les tokens qui le
+    précèdent.
+
+    :param token: Le dernier token de l'expression.
+    :param synonyms: Les synonymes choisis, par indice de token.
+    :return: Si l'expression peut être traduite d'un bloc.
+    """
+    return token.i not in synonyms and token._.lynkr_lemma_translation not in (None, "")
+
+
+def iter_lynkr_translation(doc: Doc, synonyms: Optional[Dict[int, Optional[str]]] = None,
+                           auto: bool = False) -> Iterator[TranslatedToken]:
+    """Générateur traduisant en Lynkr les tokens d'un doc Spacy, un à un.
+
+    Les expressions de plusieurs tokens ("peut-être", "au revoir") sont reconnues en regardant les tokens suivants,
+    sans revenir sur les traductions déjà produites, et ne sont traduites d'un bloc que si leur dernier token aurait
+    reçu sa traduction par défaut.
+
+    :param doc: Le doc Spacy du texte source.
+    :param synonyms: Un dictionnaire contenant les indices des tokens nécessitant un synonyme et leur synonyme choisi,
+        ou `None` pour ne pas les traduire.
+    :param auto: Si les tokens sans traduction ni synonyme choisi sont traduits par leur meilleur synonyme contextuel.
+        Un synonyme choisi qui n'est pas traduisible est ignoré au profit du meilleur synonyme.
+    :return: Les enregistrements des traductions des tokens, dans l'ordre du doc.
+    """
+    synonyms = {i: synonym for i, synonym in (synonyms or {}).items() if synonym is not None}
+    i = 0
+    while i < len(doc):
+        token = doc[i]
+
+        # Si l'expression est "peut-être", la traduire d'un bloc
+        if i + 2 < len(doc) and token.lower_ == "peut" and doc[i + 1].text == "-" and doc[i + 2].lower_ == "être" \
+                and closes_expression(doc[i + 2], synonyms):
+            yield translated_token(token, translation_commun_to_lynkr_peut_etre(doc[i + 2]), "expression")
+            yield translated_token(doc[i + 1], translation_commun_to_lynkr_empty(), "expression")
+            yield translated_token(doc[i + 2], translation_commun_to_lynkr_empty(), "expression")
+            i += 3
+            continue
+
+        # Si l'expression est "au revoir", la traduire d'un bloc
+        if i + 1 < len(doc) and token.lower_ == "au" and doc[i + 1].lower_ == "revoir" \
+                and closes_expression(doc[i + 1], synonyms):
+            au, revoir = translation_commun_to_lynkr_au_revoir(doc[i + 1])
+            yield translated_token(token, au, "expression")
+            yield translated_token(doc[i + 1], revoir, "expression")
+            i += 2
+            continue
+
+        # Si le token a un synonyme choisi parmi ses synonymes traduisibles, le traduire par ce synonyme
+        if i in synonyms and synonyms[i] in token._.lynkr_compatible_synonyms:
+            yield translated_token(token, translation_commun_to_lynkr_synonym(token, synonyms[i]), "synonym")
+
+        # Si le token n'a pas de traduction en Lynkr mais a des synonymes traduisibles, le traduire par le meilleur,
+        # y compris lorsque le synonyme choisi n'en fait plus partie (voisin vectoriel proposé faute de temps, puis
+        # écarté par les synonymes du CNRTL arrivés entre-temps en cache)
+        elif (auto or i in synonyms) and token._.lynkr_lemma_translation is None \
+                and len(token._.lynkr_compatible_synonyms) > 0:
+            yield translated_token(token, translation_commun_to_lynkr_default(token), "synonym")
+
+        # Si le token n'a pas de traduction en Lynkr, le recopier tel quel
+        elif token._.lynkr_lemma_translation is None:
+            yield translated_token(token, translation_commun_to_lynkr_none(token), "untranslated",
+                                   () if auto else tuple(token._.lynkr_compatible_synonyms))
+
+        # Si le lemme du token a une traduction vide en Lynkr, récupérer la traduction vide
+        elif token._.lynkr_lemma_translation == "":
+            yield translated_token(token, translation_commun_to_lynkr_empty(), "empty")
+
+        # Sinon, utiliser la traduction par défaut
+        else:
+            yield translated_token(token, translation_commun_to_lynkr_default(token), "translated")
+
+        i += 1
+
+
+def collect_lynkr_translation(records: Iterable[TranslatedToken]) -> \
+        TranslationResult:
+    """Fonction pour rassembler les traductions des tokens en une traduction complète.
+
+    :param records: Les enregistrements des traductions des tokens, produits par `iter_lynkr_translation`.
+    :return: Un tuple contenant la traduction complète en Lynkr, les enregistrements des tokens non traduits, les
+        triplets (mot, synonyme, confiance) utilisés, la confiance n'étant définie que pour les voisins vectoriels, et
+        les triplets (mot, lemme corrigé, confiance) des fautes de frappe corrigées.
+    """
+    translation, untranslated, synonymed, corrected = [], [], [], []
+    for record in records:
+        translation.append(record.lynkr)
+        if record.status == "untranslated":
+            untranslated.append(record)
+        elif record.status == "synonym":
+            synonymed.append((record.lemma, record.synonym, record.confidence))
+        if record.correction is not None and record.status == "translated":
+            corrected.append((record.text, record.correction.lemma, record.correction.confidence))
+    return translation_to_text(translation), tuple(untranslated), tuple(synonymed), tuple(corrected)
+
+
+def complete_translation_commun_to_lynkr(doc: Doc, synonyms: Optional[Dict[int, Optional[str]]] = None) ->\
+        TranslationResult:
+    """Fonction pour achever la traduction en Lynkr du texte en utilisant les synonymes spécifiés.
+
+    :param doc: Le doc Spacy du texte source.
+    :param synonyms: Un dictionnaire contenant les indices des tokens nécessitant un synonyme et leur synonyme associé,
+        ou `None` si aucun synonyme n'a été choisi.
+    :return: Un tuple contenant la traduction complète en Lynkr, les enregistrements des tokens non traduits, les
+        triplets (mot, synonyme, confiance) utilisés, la confiance n'étant définie que pour les voisins vectoriels, et
+        les triplets (mot, lemme corrigé, confiance) des fautes de frappe corrigées.
+    """
+    return collect_lynkr_translation(iter_lynkr_translation(doc, synonyms))
+
+
+def fast_translation_doc(doc: Doc) -> \
+        TranslationResult:
+    """Fonction pour traduire un doc Spacy déjà analysé en Lynkr, en utilisant les meilleurs synonymes contextuels.
+
+    :param doc: Le doc Spacy du texte source, dont les tokens sans synonyme ont reçu leurs voisins vectoriels.
+    :return: Un tuple contenant la traduction complète en Lynkr, les enregistrements des tokens non traduits, les
+        triplets (mot, synonyme, confiance) utilisés, la confiance n'étant définie que pour les voisins vectoriels, et
+        les triplets (mot, lemme corrigé, confiance) des fautes de frappe corrigées.
+    """
+    return collect_lynkr_translation(iter_lynkr_translation(doc, auto=True))
+
+
+def express_translation(text: str, forms: Optional[Dict[str, SurfaceForm]] = None) -> \
+        Optional[TranslationResult]:
+    """Fonction pour traduire sans Spacy un texte dont tous les mots sont traduits directement par le lexique.
+
+    Le texte est découpé et analysé à l'aide de la table des formes de surface, puis traduit comme le ferait le chemin
+    complet, dont il reprend l'accord, la conjugaison, la négation, la casse et les expressions.
+
+    :param text: Le texte source à traduire en Lynkr.
+    :param forms: La table des formes de surface à utiliser, par défaut celle chargée par `get_surface_forms`.
+    :return: Un tuple contenant la traduction complète en Lynkr et trois tuples vides (aucun token non traduit, aucun
+        synonyme, aucune correction), ou `None` si un mot est inconnu, ambigu ou sans traduction directe.
+    """
+    if not EXPRESS:
+        return None
+    analysis = express_analysis(text, get_surface_forms() if forms is None else forms)
+    if analysis is None:
+        return None
+    lexicons = get_lexicons()
+
+    translation = []
+    for i, (word, form) in enumerate(analysis):
+        # Si l'expression est "au revoir", la traduire d'un bloc
+        if word.lower() == "au" and i + 1 < len(analysis) and analysis[i + 1][0].lower() == "revoir":
+            translation.append(apply_case(word, "paers"))
+        elif word.lower() == "revoir" and i > 0 and analysis[i - 1][0].lower() == "au":
+            translation.append(apply_case(word, "esperita"))
+
+        # Les ponctuations sont recopiées, les particules de négation n'ont pas de traduction
+        elif form.tag == "PUNCT":
+            translation.append(apply_case(word, word))
+        elif form.tag == "PART":
+            translation.append("")
+
+        # Sinon, traduire le lemme par le lexique, puis l'accorder ou le conjuguer
+        else:
+            series = lexicons[form.tag]
+            if form.lemma not in series:
+                return None
+            lynkr = series[form.lemma]
+            if lynkr == "":
+                translation.append("")
+            elif form.tag == "GRAMNUM":
+                translation.append(apply_case(word, inflect_number(lynkr, form.feature)))
+            elif form.tag == "GRAMCONJ":
+                polarity = "fran-" if any(previous.lemma == "ne" for _, previous in analysis[max(i - 2, 0):i]) else ""
+                tense = form.feature if form.lemma not in UNINFLECTED_VERBS else ""
+                translation.append(apply_case(word, inflect_tense(lynkr, tense, polarity)))
+            else:
+                translation.append(apply_case(word, lynkr))
+
+    return translation_to_text(translation), (), (), ()
+
+
+def fast_translation_commun_to_lynkr(text: str) -> \
+        TranslationResult:
+    """Fonction pour traduire le texte en Lynkr directement, en utilisant les meilleurs synonymes contextuels.
+
+    Les textes entièrement couverts par le lexique sont traduits par le chemin express, sans Spacy.
+
+    :param text: Le texte source à traduire en Lynkr.
+    :return: Un tuple contenant la traduction complète en Lynkr, les enregistrements des tokens non traduits, les
+        triplets (mot, synonyme, confiance) utilisés, la confiance n'étant définie que pour les voisins vectoriels, et
+        les triplets (mot, lemme corrigé, confiance) des fautes de frappe corrigées.
+    """
+    express = express_translation(text)
+    if express is not None:
+        return express
+    return fast_translation_doc(parse(text))
+
+
+# Sous-fonction de la fonction `batch_fast_translation_commun_to_lynkr`
+def sentence_key(sentence: str, generation: int) -> str:
+    """Fonction pour calculer l'empreinte d'une phrase dans le cache des traductions de phrases.
+
+    La génération de la mémoire des choix fait partie de l'empreinte : un nouveau choix de synonyme, qui peut changer
+    le synonyme préféré ou consensuel d'un mot, rend les traductions déjà en cache inaccessibles, et elles finissent
+    évincées.
+
+    :param sentence: La phrase source.
+    :param generation: La génération de la mémoire des choix avec laquelle la phrase est traduite.
+    :return: L'empreinte de la phrase.
+    """
+    return f"{generation}:{hashlib.sha1(sentence.encode('utf-8')).hexdigest()}"
+
+
+def batch_fast_translation_commun_to_lynkr(texts: List[str]) -> \
+        List[TranslationResult]:
+    """Fonction pour traduire rapidement un lot de textes en Lynkr, phrase par phrase.
+
+    Chaque texte est découpé en phrases, dont seules celles absentes du cache sont traduites : par le chemin express
+    si possible, sinon analysées ensemble par `get_nlp().pipe`. Un message modifié ne coûte que la traduction des
+    phrases qui ont changé. Les phrases dont la traduction est approximative, faute de temps, ne sont pas mises en
+    cache, et tout nouveau choix de synonyme enregistré rend le cache caduc.
+
+    :param texts: Les textes sources à traduire en Lynkr.
+    :return: Pour chaque texte, un tuple contenant la traduction complète en Lynkr, les enregistrements des tokens non
+        traduits des phrases nouvellement traduites, les triplets (mot, synonyme, confiance) utilisés et les triplets
+        (mot, lemme corrigé, confiance) des fautes de frappe corrigées.
+    """
+    # Découper les textes en phrases et leurs séparateurs, conservés tels quels dans la traduction
+    parts = [SENTENCE_SEPARATOR.split(text) for text in texts]
+    generation = CHOICES.generation
+
+    # Rechercher les phrases déjà traduites
+    translated, untranslated, missing = {}, defaultdict(list), {}
+    with SENTENCE_CACHE_LOCK:
+        for sentences in parts:
+            for sentence in sentences[::2]:
+                key = sentence_key(sentence, generation)
+                if key in SENTENCE_CACHE:
+                    SENTENCE_CACHE.move_to_end(key)
+                    translated[key] = SENTENCE_CACHE[key]
+                elif sentence.strip() != "":
+                    missing[key] = sentence
+
+    # Traduire sans Spacy les phrases manquantes couvertes par le lexique
+    parsed = {}
+    for key, sentence in missing.items():
+        express = express_translation(sentence)
+        if express is None:
+            parsed[key] = sentence
+        else:
+            translated[key] = (express[0], express[2], express[3])
+
+    # Analyser ensemble les autres, puis mettre en cache celles dont la traduction est complète
+    approximate = set()
+    for key, doc in zip(parsed, get_nlp().pipe(parsed.values()) if len(parsed) > 0 else ()):
+        assign_corrections(doc)
+        assign_vector_synonyms(doc)
+        translation, tokens, synonymed, corrected = fast_translation_doc(doc)
+        translated[key] = (translation, synonymed, corrected)
+        untranslated[key] = tokens
+        if len(approximated_lemmas(tokens, synonymed)) > 0:
+            approximate.add(key)
+    with SENTENCE_CACHE_LOCK:
+        for key in missing:
+            if key not in approximate:
+                SENTENCE_CACHE[key] = translated[key]
+        while len(SENTENCE_CACHE) > SENTENCE_CACHE_SIZE:
+            SENTENCE_CACHE.popitem(last=False)
+
+    # Réassembler les traductions des phrases de chaque texte
+    results = []
+    for sentences in parts:
+        translation, tokens, synonymed, corrected = [], [], [], []
+        for i, part in enumerate(sentences):
+            # Les séparateurs et les phrases vides sont recopiés tels quels
+            key = sentence_key(part, generation) if i % 2 == 0 else None
+            if key not in translated:
+                translation.append(part)
+                continue
+            translation.append(translated[key][0])
+            synonymed.extend(translated[key][1])
+            corrected.extend(translated[key][2])
+            # Ne sauvegarder qu'une fois les tokens non traduits d'une phrase
+            tokens.extend(untranslated.pop(key, ()))
+        results.append(("".join(translation), tuple(tokens), tuple(synonymed), tuple(corrected)))
+    return results
+
+
+def save_untranslated(untranslated: Iterable[TranslatedToken]) -> None:
+    """Fonction pour sauvegarder les tokens non traduits dans le csv mémoire.
+
+    :param untranslated: Les enregistrements des tokens non traduits à sauvegarder.
+    """
+    # Décomposer les tokens intraduisibles selon les colonnes du csv mémoire
+    rows = []
+    for record in untranslated:
+        morph = dict(feature.split("=", 1) for feature in record.morph.split("|") if "=" in feature)
+        rows.append((record.text, record.lemma, record.pos, record.shape, morph.get("Number", ""),
+                     morph.get("Tense", ""), morph.get("Polarity", ""), "|".join(record.synonyms)))
+    if len(rows) == 0:
+        return
+
+    # Les sauvegarder dans le csv mémoire, partagé par toutes les requêtes du service
+    with MEMORY_LOCK:
+        with open(MEMORY_PATH, mode="a", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerows(rows)
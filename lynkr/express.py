@@ -0,0 +1,314 @@
+import re
+import gzip
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+from collections import defaultdict
+from typing import Collection, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from lynkr.lexicon import UNINFLECTED_VERBS
+
+# Chemin vers le dossier principal du projet
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Chemin vers la table des formes de surface construite hors ligne
+SURFACE_FORMS_PATH = MAIN_FOLDER / "assets/build/lynkr/surface-forms.json.gz"
+# Version du format de la table des formes de surface
+SURFACE_FORMS_VERSION = 1
+# Corpus de validation par défaut, dont les phrases doivent être traduites à l'identique par les deux chemins
+VALIDATION_CORPUS_PATH = MAIN_FOLDER / "assets/texts/txt/lynkr-warmup.txt"
+
+# Tokens reconnus par le chemin express : espace simple, mot (élidé ou non) ou suite de ponctuations
+EXPRESS_TOKEN = re.compile(r"(?P<space> )|(?P<word>[^\W\d_]+['’]?)|(?P<punct>[.,!?;:…]+)")
+
+# Pronoms sujets des formes conjuguées générées, par personne
+SUBJECT_PRONOUNS = ("je", "tu", "il", "nous", "vous", "ils")
+# Terminaisons des verbes du premier groupe, par temps et par personne
+FIRST_GROUP_ENDINGS = {"present": ("e", "es", "e", "ons", "ez", "ent"),
+                       "imperfect": ("ais", "ais", "ait", "ions", "iez", "aient"),
+                       "future": ("erai", "eras", "era", "erons", "erez", "eront")}
+
+# Configuration du logger de la table des formes de surface
+logger = logging.getLogger("lynkr.express")
+
+
+class SurfaceForm(NamedTuple):
+    """Analyse d'une forme de surface, indépendante de son contexte : lemme, tag Lynkr et trait morphologique utile
+    à la traduction (nombre pour `GRAMNUM`, temps pour `GRAMCONJ`, vide sinon)."""
+    lemma: str
+    tag: str
+    feature: str
+
+
+def tokenize(text: str) -> Optional[List[str]]:
+    """Fonction pour découper un texte en tokens sans Spacy, si son découpage ne fait aucun doute.
+
+    Seuls les mots séparés par une espace simple ou une élision et les ponctuations finales sont reconnus ; les
+    chiffres, traits d'union, guillemets, parenthèses et espaces multiples renvoient au chemin complet.
+
+    :param text: Le texte à découper.
+    :return: Les tokens du texte, ou `None` si son découpage est incertain.
+    """
+    tokens, position, previous = [], 0, None
+    for match in EXPRESS_TOKEN.finditer(text):
+        # Un caractère non reconnu interrompt le découpage
+        if match.start() != position:
+            return None
+        position = match.end()
+        kind = match.lastgroup
+        if kind == "space":
+            # Pas d'espace en début de texte ni d'espaces consécutives
+            if previous in (None, "space"):
+                return None
+        elif kind == "word":
+            # Un mot suit le début du texte, une espace ou un mot élidé
+            if previous not in (None, "space") and not (previous == "word" and tokens[-1][-1] in "'’"):
+                return None
+            tokens.append(match.group())
+        else:
+            # Une ponctuation suit un mot ou une espace
+            if previous is None:
+                return None
+            tokens.append(match.group())
+        previous = kind
+    if position != len(text) or previous in (None, "space"):
+        return None
+    return tokens
+
+
+def express_analysis(text: str, forms: Dict[str, SurfaceForm]) -> Optional[List[Tuple[str, SurfaceForm]]]:
+    """Fonction pour analyser un texte sans Spacy, à l'aide de la table des formes de surface.
+
+    :param text: Le texte à analyser.
+    :param forms: La table des formes de surface, en minuscules.
+    :return: Les paires (token, analyse) du texte, ou `None` si un token est inconnu ou ambigu.
+    """
+    tokens = tokenize(text)
+    if tokens is None:
+        return None
+    analysis = []
+    for token in tokens:
+        form = forms.get(token.lower())
+        if form is None:
+            return None
+        analysis.append((token, form))
+    return analysis
+
+
+def load_surface_forms(path: Path = SURFACE_FORMS_PATH) -> Dict[str, SurfaceForm]:
+    """Fonction pour charger la table des formes de surface, si elle a été construite.
+
+    :param path: Le chemin de la table des formes de surface.
+    :return: L'analyse de chaque forme de surface, vide si la table n'a pas été construite ou n'est pas à la bonne
+        version.
+    """
+    if not path.is_file():
+        return {}
+    with gzip.open(path, mode="rt", encoding="utf-8") as file:
+        data = json.load(file)
+    if data.get("version") != SURFACE_FORMS_VERSION:
+        logger.warning("Table des formes de surface ignorée : version %r au lieu de %r", data.get("version"),
+                       SURFACE_FORMS_VERSION)
+        return {}
+    return {form: SurfaceForm(*analysis) for form, analysis in data["forms"].items()}
+
+
+def save_surface_forms(forms: Dict[str, SurfaceForm], model: str, path: Path = SURFACE_FORMS_PATH) -> None:
+    """Fonction pour enregistrer la table des formes de surface sous forme de JSON compressé.
+
+    :param forms: L'analyse de chaque forme de surface.
+    :param model: Le nom et la version du modèle Spacy ayant produit les analyses.
+    :param path: Le chemin du fichier à écrire.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, mode="wt", encoding="utf-8") as file:
+        json.dump({"version": SURFACE_FORMS_VERSION, "model": model,
+                   "forms": {form: list(analysis) for form, analysis in sorted(forms.items())}}, file,
+                  ensure_ascii=False, separators=(",", ":"))
+
+
+# Sous-fonction de la fonction `carrier_sentences`
+def plural_form(lemma: str) -> str:
+    """Fonction pour former le pluriel régulier d'un nom ou d'un adjectif.
+
+    :param lemma: Le lemme au singulier.
+    :return: Le pluriel du lemme.
+    """
+    if lemma[-1] in "sxz":
+        return lemma
+    elif lemma.endswith("al"):
+        return f"{lemma[:-2]}aux"
+    elif lemma.endswith(("au", "eu")):
+        return f"{lemma}x"
+    return f"{lemma}s"
+
+
+# Sous-fonction de la fonction `carrier_sentences`
+def subject_clause(pronoun: str, form: str, negative: bool = False) -> str:
+    """Fonction pour placer une forme conjuguée après son pronom sujet, en élidant "je" et "ne" devant une voyelle.
+
+    :param pronoun: Le pronom sujet.
+    :param form: La forme conjuguée.
+    :param negative: Si la proposition est à la forme négative.
+    :return: La proposition.
+    """
+    vowel = form[0] in "aâeéèêiîoôuûh"
+    if negative:
+        negation = "n'" if vowel else "ne "
+        return f"{pronoun} {negation}{form} pas"
+    return f"j'{form}" if pronoun == "je" and vowel else f"{pronoun} {form}"
+
+
+def carrier_sentences(tag: str, lemma: str) -> List[str]:
+    """Fonction pour générer les phrases porteuses des formes fléchies d'un lemme du lexique, à analyser par Spacy.
+
+    Les noms et adjectifs sont placés au singulier et au pluriel, les verbes du premier groupe sont conjugués au
+    présent, à l'imparfait et au futur, à la forme affirmative et négative ; chaque forme apparaît dans plusieurs
+    contextes, afin que les formes analysées différemment selon le contexte soient écartées.
+
+    :param tag: Le tag Lynkr du lemme.
+    :param lemma: Le lemme du lexique.
+    :return: Les phrases porteuses.
+    """
+    if " " in lemma:
+        return []
+    if tag == "GRAMNUM":
+        plural = plural_form(lemma)
+        return [lemma, f"Le {lemma} est là.", f"Il est {lemma}.", f"Les {plural} sont là.", f"Ils sont {plural}."]
+    if tag == "GRAMCONJ":
+        sentences = [f"Je vais {lemma}.", f"Il faut {lemma}."]
+        if lemma.endswith("er") and len(lemma) > 3:
+            stem = lemma[:-2]
+            sentences.extend([f"Il a {stem}é.", f"Ils ont {stem}é."])
+            for endings in FIRST_GROUP_ENDINGS.values():
+                for pronoun, ending in zip(SUBJECT_PRONOUNS, endings):
+                    form = f"{stem}{ending}"
+                    sentences.append(f"{subject_clause(pronoun, form).capitalize()}.")
+                    sentences.append(f"{subject_clause(pronoun, form, negative=True).capitalize()}.")
+        return sentences
+    return [lemma, f"{lemma.capitalize()} !"]
+
+
+def build_surface_forms(nlp, lexicons: Dict[str, Collection[str]], corpus: Iterable[str],
+                        batch_size: int = 256) -> Dict[str, SurfaceForm]:
+    """Fonction pour construire la table des formes de surface à partir du lexique et d'un corpus, avec Spacy.
+
+    Chaque token des phrases porteuses générées depuis le lexique et des phrases du corpus est analysé par le
+    pipeline du moteur ; une forme n'est retenue que si toutes ses occurrences, quelle que soit leur casse, ont la
+    même analyse, et si le chemin complet la traduirait directement depuis le lexique.
+
+    :param nlp: Le pipeline Spacy du moteur de traduction.
+    :param lexicons: Le lexique de chaque tag Lynkr.
+    :param corpus: Des phrases courantes, analysées dans leur contexte réel.
+    :param batch_size: Le nombre de phrases analysées ensemble.
+    :return: L'analyse de chaque forme de surface retenue, en minuscules.
+    """
+    sentences = [sentence for tag, lemmas in lexicons.items() for lemma in lemmas
+                 for sentence in carrier_sentences(tag, lemma)]
+    sentences.extend(corpus)
+
+    # Recenser les analyses de chaque forme de surface
+    analyses: Dict[str, Set[SurfaceForm]] = defaultdict(set)
+    for doc in nlp.pipe(sentences, batch_size=batch_size):
+        for token in doc:
+            # Ne retenir que les tokens que le chemin express découpe de la même façon
+            match = EXPRESS_TOKEN.fullmatch(token.text)
+            if match is None or match.lastgroup == "space":
+                continue
+            tag = token._.lynkr_tag
+            feature = {"GRAMNUM": "Number", "GRAMCONJ": "Tense"}.get(tag)
+            morph = token.morph.to_dict()
+            analyses[token.lower_].add(SurfaceForm(token.lemma_, tag, morph.get(feature, "") if feature else ""))
+
+    # Ne retenir que les formes non ambiguës que le chemin complet traduit directement
+    forms = {}
+    for text, candidates in analyses.items():
+        if len(candidates) != 1:
+            continue
+        form = next(iter(candidates))
+        if form.tag in ("PUNCT", "PART"):
+            forms[text] = form
+        elif form.tag in lexicons and form.lemma in lexicons[form.tag] \
+                and (form.feature != "" or form.tag == "X" or form.lemma in UNINFLECTED_VERBS):
+            forms[text] = form
+    return forms
+
+
+def validate_surface_forms(forms: Dict[str, SurfaceForm], corpus: Iterable[str]) -> List[Tuple[str, str, str]]:
+    """Fonction pour comparer les traductions du chemin express et du chemin complet sur un corpus de validation.
+
+    :param forms: La table des formes de surface à valider.
+    :param corpus: Les phrases du corpus de validation.
+    :return: Les triplets (phrase, traduction express, traduction complète) des phrases traduites différemment.
+    """
+    from lynkr import engine
+
+    mismatches = []
+    for sentence in corpus:
+        express = engine.express_translation(sentence, forms)
+        if express is None:
+            continue
+        try:
+            complete = engine.fast_translation_doc(engine.parse(sentence))[0]
+        except KeyError as error:
+            complete = f"<{error!r}>"
+        if express[0] != complete:
+            mismatches.append((sentence, express[0], complete))
+    return mismatches
+
+
+def read_sentences(paths: Iterable[Path]) -> List[str]:
+    """Fonction pour lire des corpus de phrases, une phrase par ligne.
+
+    :param paths: Les chemins des corpus.
+    :return: Les phrases des corpus.
+    """
+    sentences = []
+    for path in paths:
+        with open(path, mode="r", encoding="utf-8") as file:
+            sentences.extend(line.strip() for line in file if line.strip())
+    return sentences
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Construit et valide la table des formes de surface du chemin "
+                                                 "express.")
+    parser.add_argument("--corpus", type=Path, nargs="*", default=[VALIDATION_CORPUS_PATH],
+                        help="corpus de phrases courantes, analysées et utilisées pour la validation")
+    parser.add_argument("--output", type=Path, default=SURFACE_FORMS_PATH, help="chemin de la table à écrire")
+    parser.add_argument("--check", action="store_true", help="valider la table existante sans la reconstruire")
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    from lynkr import engine
+
+    # La validation ne doit pas interroger le CNRTL pour les phrases que le chemin complet analyse autrement
+    engine.CNRTL_FALLBACK = False
+    validation = read_sentences(arguments.corpus)
+
+    if arguments.check:
+        surface_forms = load_surface_forms(arguments.output)
+    else:
+        started = time.perf_counter()
+        nlp = engine.get_nlp()
+        surface_forms = build_surface_forms(nlp, engine.get_lexicons(), validation)
+        logger.info("%d formes de surface retenues en %.0f s", len(surface_forms), time.perf_counter() - started)
+
+        # Écarter les formes des phrases que les deux chemins traduisent différemment, qui reviennent alors au chemin
+        # complet
+        for sentence, _, _ in validate_surface_forms(surface_forms, validation):
+            for token in tokenize(sentence):
+                surface_forms.pop(token.lower(), None)
+        save_surface_forms(surface_forms, f"{nlp.meta['lang']}_{nlp.meta['name']}-{nlp.meta['version']}",
+                           arguments.output)
+
+    found = validate_surface_forms(surface_forms, validation)
+    covered = sum(express_analysis(sentence, surface_forms) is not None for sentence in validation)
+    for sentence, express_result, complete_result in found:
+        logger.error("%r : express %r, complet %r", sentence, express_result, complete_result)
+    logger.info("%d/%d phrases du corpus de validation couvertes par le chemin express, %d désaccords", covered,
+                len(validation), len(found))
+    if len(found) > 0:
+        raise SystemExit(1)
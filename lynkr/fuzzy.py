@@ -0,0 +1,130 @@
+import unicodedata
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# Distance d'édition maximale d'une correction
+MAX_EDIT_DISTANCE = 2
+# Longueur du préfixe des mots dont les suppressions sont indexées, bornant la taille de l'index
+PREFIX_LENGTH = 7
+# Confiance d'une correction ne portant que sur les accents
+ACCENT_CONFIDENCE = 0.95
+
+
+class Correction(NamedTuple):
+    """Correction proposée pour un mot absent du lexique : forme la plus proche, son lemme et la confiance."""
+    form: str
+    lemma: str
+    confidence: float
+
+
+def fold_accents(text: str) -> str:
+    """Fonction pour retirer les accents et la casse d'un mot.
+
+    :param text: Le mot.
+    :return: Le mot en minuscules, sans accents ni cédilles.
+    """
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    return "".join(character for character in decomposed if not unicodedata.combining(character))
+
+
+def edit_distance(a: str, b: str, limit: int = MAX_EDIT_DISTANCE) -> int:
+    """Fonction pour calculer la distance d'édition entre deux mots, les transpositions de lettres voisines comptant
+    pour une seule opération.
+
+    :param a: Le premier mot.
+    :param b: Le second mot.
+    :param limit: La distance au-delà de laquelle le calcul s'arrête.
+    :return: La distance d'édition, ou `limit + 1` si elle dépasse la limite.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous, current = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+    return current[-1]
+
+
+# Sous-fonction de la classe `FuzzyIndex`
+def deletes(word: str, distance: int = MAX_EDIT_DISTANCE) -> Set[str]:
+    """Fonction pour obtenir les variantes d'un préfixe de mot privé d'au plus `distance` lettres.
+
+    :param word: Le mot, sans accents.
+    :param distance: Le nombre maximal de lettres supprimées.
+    :return: Les variantes du préfixe du mot, le préfixe lui-même compris.
+    """
+    prefix = word[:PREFIX_LENGTH]
+    variants = set()
+    for n in range(min(distance, len(prefix)) + 1):
+        for removed in combinations(range(len(prefix)), n):
+            variants.add("".join(character for i, character in enumerate(prefix) if i not in removed))
+    return variants
+
+
+class FuzzyIndex:
+    """Index de suppressions (à la SymSpell) des formes des lemmes du lexique, sans accents, par tag Lynkr.
+
+    Chaque forme indexe les variantes de son préfixe privé d'au plus `MAX_EDIT_DISTANCE` lettres ; un mot mal
+    orthographié partage alors une variante avec les formes proches, dont seule la distance d'édition reste à
+    vérifier.
+
+    :param forms: Les triplets (forme, lemme, tag Lynkr) à indexer.
+    :type forms: Iterable[Tuple[str, str, str]]
+    """
+
+    def __init__(self, forms: Iterable[Tuple[str, str, str]]) -> None:
+        """Initialise l'index.
+
+        :param forms: Les triplets (forme, lemme, tag Lynkr) à indexer.
+        """
+        self.forms: List[Tuple[str, str, str, str]] = []
+        self.variants: Dict[str, List[int]] = defaultdict(list)
+        for form, lemma, tag in sorted(set(forms)):
+            folded = fold_accents(form)
+            for variant in deletes(folded):
+                self.variants[variant].append(len(self.forms))
+            self.forms.append((form, folded, lemma, tag))
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    def correct(self, word: str, tag: str) -> Optional[Correction]:
+        """Méthode pour proposer la forme du lexique la plus proche d'un mot, parmi celles d'un tag Lynkr.
+
+        La confiance vaut 1 pour une forme identique, `ACCENT_CONFIDENCE` si seuls les accents diffèrent, sinon la
+        part des lettres du mot conservées par la correction ; aucune correction n'est proposée si plusieurs lemmes
+        sont aussi proches.
+
+        :param word: Le mot à corriger.
+        :param tag: Le tag Lynkr du mot.
+        :return: La correction, ou `None` si aucune forme n'est assez proche ou si plusieurs lemmes le sont autant.
+        """
+        folded = fold_accents(word)
+        best, candidates = MAX_EDIT_DISTANCE, {}
+        for i in {i for variant in deletes(folded) for i in self.variants.get(variant, ())}:
+            form, form_folded, lemma, form_tag = self.forms[i]
+            if form_tag != tag:
+                continue
+            # Les formes plus éloignées que la meilleure trouvée, ou que `MAX_EDIT_DISTANCE`, sont écartées
+            distance = edit_distance(folded, form_folded, best)
+            if distance > best:
+                continue
+            if distance < best:
+                best, candidates = distance, {}
+            candidates.setdefault(lemma, form)
+
+        if len(candidates) != 1:
+            return None
+        lemma, form = next(iter(candidates.items()))
+        if best == 0:
+            confidence = 1.0 if form.lower() == word.lower() else ACCENT_CONFIDENCE
+        else:
+            confidence = 1 - best / max(len(folded), 1)
+        return Correction(form, lemma, confidence)
@@ -0,0 +1,121 @@
+import gc
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+from typing import Iterable, Tuple
+
+from lynkr.lexicon import LEXICON_PATHS, Lexicon
+
+# Chemin vers le dossier principal du projet
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Chemin vers le modèle de langage aux vecteurs élagués, utilisé en mode économe en mémoire
+LEAN_MODEL_PATH = MAIN_FOLDER / "assets/build/lynkr/fr_core_news_lean"
+# Nombre de vecteurs les plus fréquents conservés par défaut, en plus de ceux des lemmes du lexique
+LEAN_VECTOR_ROWS = 20000
+
+# Configuration du logger du mode économe en mémoire
+logger = logging.getLogger("lynkr.lean")
+
+
+def current_rss() -> int:
+    """Fonction pour obtenir la mémoire résidente (RSS) du processus courant.
+
+    :return: La mémoire résidente du processus, en octets, ou 0 si la plateforme ne permet pas de la mesurer.
+    """
+    # Le module `resource` n'existe que sur les systèmes Unix
+    try:
+        import resource
+    except ImportError:
+        return 0
+    try:
+        with open("/proc/self/statm", mode="r") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # Hors de Linux, à défaut de la mémoire résidente courante, renvoyer son maximum, en kilo-octets sauf sous macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def model_rss(model: str) -> int:
+    """Fonction pour mesurer la mémoire résidente d'un processus neuf après le chargement d'un modèle Spacy.
+
+    :param model: Le nom ou le chemin du modèle Spacy.
+    :return: La mémoire résidente du processus, en octets.
+    """
+    import subprocess
+
+    code = f"import spacy; from lynkr.lean import current_rss; spacy.load({str(model)!r}); print(current_rss())"
+    return int(subprocess.run([sys.executable, "-c", code], cwd=MAIN_FOLDER, capture_output=True, text=True,
+                              check=True).stdout)
+
+
+def prune_vectors(nlp, rows: int, protected: Iterable[str], batch_size: int = 4096) -> Tuple[int, int]:
+    """Fonction pour élaguer la table de vecteurs d'un modèle Spacy à un vocabulaire borné.
+
+    Les vecteurs conservés sont ceux des mots les plus fréquents, d'après leur rang dans le vocabulaire, et ceux des
+    mots protégés ; les autres mots sont redirigés vers le plus proche vecteur conservé.
+
+    :param nlp: Le modèle de langage Spacy dont les vecteurs doivent être élagués.
+    :param rows: Le nombre de vecteurs les plus fréquents à conserver.
+    :param protected: Les mots dont le vecteur doit être conservé, comme les lemmes du lexique.
+    :param batch_size: Le nombre de vecteurs redirigés par calcul matriciel.
+    :return: Le nombre de vecteurs avant et après l'élagage.
+    """
+    from spacy.util import OOV_RANK
+    from spacy.vectors import Vectors
+
+    vectors = nlp.vocab.vectors
+    key2row = dict(vectors.key2row)
+
+    # Conserver les lignes des mots de plus petit rang, c'est-à-dire les plus fréquents ; les mots sans rang passent
+    # après les autres, dans l'ordre des lignes de la table
+    frequent_rows = set()
+    for _, row in sorted(key2row.items(), key=lambda item: (min(nlp.vocab[item[0]].rank, OOV_RANK), item[1])):
+        if len(frequent_rows) >= rows:
+            break
+        frequent_rows.add(row)
+    protected_keys = {nlp.vocab.strings.add(word) for word in protected} & key2row.keys()
+    kept_rows = sorted(frequent_rows | {key2row[key] for key in protected_keys})
+    new_rows = {row: i for i, row in enumerate(kept_rows)}
+
+    # Recopier les vecteurs conservés, puis rediriger chaque autre mot vers le plus proche d'entre eux
+    pruned = Vectors(strings=nlp.vocab.strings, data=vectors.data[kept_rows], name=vectors.name)
+    for key, row in key2row.items():
+        if row in new_rows:
+            pruned.add(key, row=new_rows[row])
+    tossed_rows = sorted(set(key2row.values()) - new_rows.keys())
+    if len(tossed_rows) > 0:
+        _, best_rows, _ = pruned.most_similar(vectors.data[tossed_rows], batch_size=batch_size)
+        nearest = {row: int(best[0]) for row, best in zip(tossed_rows, best_rows)}
+        for key, row in key2row.items():
+            if row in nearest:
+                pruned.add(key, row=nearest[row])
+
+    nlp.vocab.vectors = pruned
+    return vectors.shape[0], pruned.shape[0]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Construit le modèle de langage économe en mémoire.")
+    parser.add_argument("--rows", type=int, default=LEAN_VECTOR_ROWS, help="vecteurs fréquents conservés")
+    parser.add_argument("--output", type=Path, default=LEAN_MODEL_PATH, help="dossier du modèle à écrire")
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    import spacy
+
+    started = time.perf_counter()
+    model = spacy.load("fr_core_news_lg")
+    lexicon_lemmas = [lemma for path in LEXICON_PATHS.values() for lemma in Lexicon.from_csv(path)]
+    before, after = prune_vectors(model, arguments.rows, lexicon_lemmas)
+    model.to_disk(arguments.output)
+    del model
+    gc.collect()
+    logger.info("%d vecteurs élagués à %d en %.0f s, modèle enregistré dans %s", before, after,
+                time.perf_counter() - started, arguments.output)
+
+    # Comparer la mémoire résidente de processus neufs chargeant chacun des deux modèles
+    logger.info("RSS avec fr_core_news_lg : %.0f Mo", model_rss("fr_core_news_lg") / 2 ** 20)
+    logger.info("RSS avec le modèle économe : %.0f Mo", model_rss(arguments.output) / 2 ** 20)
@@ -0,0 +1,369 @@
+import csv
+import sys
+import json
+import mmap
+import bisect
+import struct
+import hashlib
+import logging
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Chemin vers le dossier principal du projet
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Chemins vers les csv du lexique Commun -> Lynkr, par tag Lynkr
+LEXICON_PATHS = {"GRAMNUM": MAIN_FOLDER / "assets/texts/csv/lynkr/adj-noun-propn.csv",
+                 "GRAMCONJ": MAIN_FOLDER / "assets/texts/csv/lynkr/verb-aux.csv",
+                 "X": MAIN_FOLDER / "assets/texts/csv/lynkr/others.csv"}
+# Colonnes obligatoires des csv du lexique
+LEXICON_COLUMNS = ("lemma", "lynkr")
+
+# Chemin vers le lexique compilé, projeté en mémoire et partagé en lecture seule par tous les processus
+LEXICON_ARTIFACT_PATH = MAIN_FOLDER / "assets/build/lynkr/lexicon.bin"
+# Signature et version du format du lexique compilé, à incrémenter à chaque changement de format
+LEXICON_MAGIC = b"LYNKRLEX"
+LEXICON_VERSION = 2
+# En-tête binaire du lexique compilé : signature, version et longueur de l'en-tête JSON qui le suit
+LEXICON_HEADER = struct.Struct("<8sII")
+
+# Verbes dont la traduction n'est pas conjuguée par `complete_lynkr_translation_gramconj`
+UNINFLECTED_VERBS = frozenset(("mourir", "vivre"))
+# Terminaison de l'infinitif des verbes en Lynkr, retirée ou remplacée selon le temps
+LYNKR_INFINITIVE_ENDING = "s"
+
+# Configuration du logger du lexique
+logger = logging.getLogger("lynkr.lexicon")
+
+
+class MappedStrings(Sequence[str]):
+    """Séquence de chaînes stockées en UTF-8 dans un tampon projeté en mémoire, décodées à la demande.
+
+    :param data: Le tampon des chaînes, mises bout à bout.
+    :type data: memoryview
+    :param offsets: Les positions de début des chaînes dans le tampon, suivies de la position de fin de la dernière.
+    :type offsets: memoryview
+    """
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, data: memoryview, offsets: memoryview) -> None:
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return str(self.data[self.offsets[i]:self.offsets[i + 1]], "utf-8")
+
+
+class Lexicon:
+    """Lexique compact d'un tag Lynkr : lemmes triés et traductions dans deux séquences, cherchés par dichotomie.
+
+    Il offre l'interface d'un dictionnaire en lecture seule (`lemma in lexicon`, `lexicon[lemma]`, `lexicon.index`),
+    que ses séquences soient des tuples construits depuis les csv ou des vues sur le lexique compilé.
+
+    :param lemmas: Les lemmes du lexique, triés.
+    :type lemmas: Sequence[str]
+    :param translations: Les traductions en Lynkr des lemmes, dans le même ordre.
+    :type translations: Sequence[str]
+    """
+    __slots__ = ("lemmas", "translations")
+
+    def __init__(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Initialise le lexique.
+
+        :param pairs: Les paires (lemme, traduction en Lynkr) du lexique.
+        """
+        pairs = sorted(dict(pairs).items())
+        self.lemmas: Sequence[str] = tuple(lemma for lemma, _ in pairs)
+        self.translations: Sequence[str] = tuple(translation for _, translation in pairs)
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "Lexicon":
+        """Charge un lexique depuis un csv aux colonnes `lemma` et `lynkr`.
+
+        :param path: Le chemin du csv.
+        :return: Le lexique.
+        """
+        with open(path, mode="r", encoding="utf-8", newline="") as file:
+            return cls((row["lemma"], row["lynkr"]) for row in csv.DictReader(file))
+
+    @classmethod
+    def from_sequences(cls, lemmas: Sequence[str], translations: Sequence[str]) -> "Lexicon":
+        """Construit un lexique sur des séquences déjà triées, sans les copier.
+
+        :param lemmas: Les lemmes du lexique, triés.
+        :param translations: Les traductions en Lynkr des lemmes, dans le même ordre.
+        :return: Le lexique.
+        """
+        lexicon = cls.__new__(cls)
+        lexicon.lemmas = lemmas
+        lexicon.translations = translations
+        return lexicon
+
+    def _position(self, lemma: str) -> int:
+        """Renvoie la position d'un lemme dans le lexique, ou -1 s'il en est absent."""
+        i = bisect.bisect_left(self.lemmas, lemma)
+        return i if i < len(self.lemmas) and self.lemmas[i] == lemma else -1
+
+    def __contains__(self, lemma: str) -> bool:
+        return self._position(lemma) >= 0
+
+    def __getitem__(self, lemma: str) -> str:
+        i = self._position(lemma)
+        if i < 0:
+            raise KeyError(lemma)
+        return self.translations[i]
+
+    def __len__(self) -> int:
+        return len(self.lemmas)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.lemmas)
+
+    @property
+    def index(self) -> Sequence[str]:
+        """Les lemmes du lexique, triés."""
+        return self.lemmas
+
+
+def read_lexicon_rows(path: Path) -> Tuple[Tuple[str, ...], List[Dict[str, str]]]:
+    """Fonction pour lire les lignes d'un csv du lexique.
+
+    :param path: Le chemin du csv.
+    :return: Les colonnes du csv et ses lignes.
+    """
+    with open(path, mode="r", encoding="utf-8", newline="") as file:
+        reader = csv.DictReader(file)
+        return tuple(reader.fieldnames or ()), list(reader)
+
+
+def validate_lexicon(tag: str, path: Path) -> Tuple[List[str], List[str]]:
+    """Fonction pour valider un csv du lexique avant sa compilation.
+
+    Sont des erreurs les colonnes manquantes, les lemmes vides et les lemmes en double ; sont des avertissements les
+    verbes dont la traduction ne se termine pas par la terminaison de l'infinitif en Lynkr, que la conjugaison ne peut
+    donc pas fléchir, et les traductions vides. Une traduction vide reste compilée, le mot étant alors omis de la
+    traduction, mais elle est signalée pour ne pas confondre une ligne inachevée avec un mot volontairement omis.
+
+    :param tag: Le tag Lynkr du csv.
+    :param path: Le chemin du csv.
+    :return: Les erreurs et les avertissements trouvés.
+    """
+    if not path.is_file():
+        return [f"{path.name} : fichier introuvable"], []
+    columns, rows = read_lexicon_rows(path)
+    missing = [column for column in LEXICON_COLUMNS if column not in columns]
+    if len(missing) > 0:
+        return [f"{path.name} : colonnes manquantes {', '.join(missing)}"], []
+
+    errors, warnings, seen = [], [], {}
+    # La ligne 1 est l'en-tête du csv
+    for line, row in enumerate(rows, start=2):
+        lemma, lynkr = (row["lemma"] or "").strip(), (row["lynkr"] or "").strip()
+        if lemma == "":
+            errors.append(f"{path.name}:{line} : lemme vide")
+            continue
+        if lemma in seen:
+            errors.append(f"{path.name}:{line} : \"{lemma}\" déjà défini ligne {seen[lemma]}")
+        seen.setdefault(lemma, line)
+
+        if lynkr == "":
+            warnings.append(f"{path.name}:{line} : \"{lemma}\" a une traduction vide et sera omis des traductions")
+
+        # La conjugaison remplace la dernière lettre de la traduction d'un verbe par la marque du temps
+        if tag == "GRAMCONJ" and lemma not in UNINFLECTED_VERBS and lynkr != "" \
+                and (len(lynkr) < 2 or not lynkr.endswith(LYNKR_INFINITIVE_ENDING)):
+            warnings.append(f"{path.name}:{line} : \"{lemma}\" → \"{lynkr}\" ne peut pas être conjugué")
+
+    return errors, warnings
+
+
+def lexicon_sources_stats(paths: Dict[str, Path]) -> Dict[str, List[int]]:
+    """Fonction pour obtenir la taille et la date de modification des csv du lexique, comparées avant leur empreinte.
+
+    :param paths: Les chemins des csv du lexique, par tag Lynkr.
+    :return: La taille et la date de modification (en nanosecondes) de chaque csv, par tag Lynkr.
+    """
+    return {tag: [path.stat().st_size, path.stat().st_mtime_ns] for tag, path in paths.items()}
+
+
+def lexicon_sources_hash(paths: Dict[str, Path]) -> str:
+    """Fonction pour calculer l'empreinte des csv du lexique, afin de détecter un lexique compilé périmé.
+
+    :param paths: Les chemins des csv du lexique, par tag Lynkr.
+    :return: L'empreinte SHA-256 des csv.
+    """
+    digest = hashlib.sha256()
+    for tag, path in sorted(paths.items()):
+        digest.update(tag.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def lexicon_lemmas_hash(lexicons: Dict[str, Lexicon]) -> str:
+    """Fonction pour calculer l'empreinte des lemmes du lexique, enregistrée dans les artefacts construits à partir
+    du lexique (thésaurus inversé, index vectoriels) afin de détecter ceux qui sont périmés.
+
+    :param lexicons: Le lexique de chaque tag Lynkr.
+    :return: L'empreinte SHA-256 des lemmes du lexique.
+    """
+    digest = hashlib.sha256()
+    for tag, lexicon in sorted(lexicons.items()):
+        digest.update(tag.encode("utf-8"))
+        for lemma in lexicon.lemmas:
+            digest.update(b"\0" + lemma.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+# Sous-fonction de la fonction `compile_lexicon`
+def pack_strings(strings: Sequence[str], start: int) -> Tuple[bytes, bytes, Dict[str, int]]:
+    """Fonction pour sérialiser une séquence de chaînes en un tableau de positions et un tampon UTF-8.
+
+    :param strings: Les chaînes à sérialiser.
+    :param start: La position, dans les données du lexique compilé, à laquelle le tableau de positions sera écrit.
+    :return: Le tableau de positions, le tampon et leur emplacement dans les données du lexique compilé.
+    """
+    encoded = [string.encode("utf-8") for string in strings]
+    positions = [0]
+    for string in encoded:
+        positions.append(positions[-1] + len(string))
+    offsets = struct.pack(f"<{len(positions)}I", *positions)
+    data = b"".join(encoded)
+    return offsets, data, {"offsets": start, "data": start + len(offsets), "count": len(strings)}
+
+
+def compile_lexicon(paths: Dict[str, Path], output: Path) -> Dict[str, int]:
+    """Fonction pour compiler les csv du lexique en un seul fichier binaire versionné, projetable en mémoire.
+
+    Pour chaque tag Lynkr, les lemmes triés et leurs traductions sont stockés comme deux tableaux de positions
+    suivis de leurs chaînes UTF-8, alignés sur 8 octets ; un en-tête JSON indique leur emplacement.
+
+    :param paths: Les chemins des csv du lexique, par tag Lynkr.
+    :param output: Le chemin du lexique compilé.
+    :return: Le nombre de lemmes compilés par tag Lynkr.
+    """
+    lexicons = {tag: Lexicon.from_csv(path) for tag, path in paths.items()}
+
+    # Les positions des sections sont relatives au début des données, aligné sur 8 octets après l'en-tête
+    sections, layout = [], {}
+    position = 0
+    for tag, lexicon in lexicons.items():
+        layout[tag] = {}
+        for name, strings in (("lemmas", lexicon.lemmas), ("translations", lexicon.translations)):
+            offsets, data, location = pack_strings(strings, position)
+            padding = -(len(offsets) + len(data)) % 8
+            sections.append(offsets + data + b"\0" * padding)
+            layout[tag][name] = location
+            position += len(sections[-1])
+
+    header = json.dumps({"sources": lexicon_sources_hash(paths), "stats": lexicon_sources_stats(paths),
+                         "tags": layout}).encode("utf-8")
+    header += b" " * (-(LEXICON_HEADER.size + len(header)) % 8)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temporary = output.with_suffix(".tmp")
+    with open(temporary, mode="wb") as file:
+        file.write(LEXICON_HEADER.pack(LEXICON_MAGIC, LEXICON_VERSION, len(header)))
+        file.write(header)
+        for section in sections:
+            file.write(section)
+    # Remplacer atomiquement le lexique compilé, les processus l'ayant déjà projeté gardant l'ancienne version
+    temporary.replace(output)
+    return {tag: len(lexicon) for tag, lexicon in lexicons.items()}
+
+
+def map_lexicon(path: Path, paths: Dict[str, Path]) -> Dict[str, Lexicon]:
+    """Fonction pour projeter en mémoire le lexique compilé, sans en copier le contenu.
+
+    Les pages du fichier ne sont lues qu'à la première consultation et sont partagées en lecture seule par tous les
+    processus qui le projettent.
+
+    :param path: Le chemin du lexique compilé.
+    :param paths: Les chemins des csv du lexique, par tag Lynkr, pour vérifier que le lexique compilé est à jour : les
+        csv ne sont relus et leur empreinte recalculée que si leur taille ou leur date de modification a changé.
+    :return: Le lexique de chaque tag Lynkr.
+    """
+    if sys.byteorder != "little":
+        raise ValueError("Compiled lexicon is little-endian only")
+    with open(path, mode="rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapping)
+
+    magic, version, header_size = LEXICON_HEADER.unpack_from(buffer)
+    if magic != LEXICON_MAGIC or version != LEXICON_VERSION:
+        raise ValueError(f"Unsupported compiled lexicon format (version {version})")
+    header = json.loads(bytes(buffer[LEXICON_HEADER.size:LEXICON_HEADER.size + header_size]))
+    buffer = buffer[LEXICON_HEADER.size + header_size:]
+    if header["tags"].keys() != paths.keys() or (header["stats"] != lexicon_sources_stats(paths)
+                                                 and header["sources"] != lexicon_sources_hash(paths)):
+        raise ValueError("Compiled lexicon is out of date")
+
+    def strings(location: Dict[str, int]) -> MappedStrings:
+        count = location["count"]
+        offsets = buffer[location["offsets"]:location["offsets"] + 4 * (count + 1)].cast("I")
+        return MappedStrings(buffer[location["data"]:location["data"] + offsets[count]], offsets)
+
+    return {tag: Lexicon.from_sequences(strings(sections["lemmas"]), strings(sections["translations"]))
+            for tag, sections in header["tags"].items()}
+
+
+def load_lexicons(paths: Dict[str, Path] = LEXICON_PATHS,
+                  artifact: Path = LEXICON_ARTIFACT_PATH) -> Dict[str, Lexicon]:
+    """Fonction pour charger le lexique de chaque tag Lynkr, compilé si possible.
+
+    À défaut d'un lexique compilé à jour (`python -m lynkr.lexicon`), les csv sont lus directement.
+
+    :param paths: Les chemins des csv du lexique, par tag Lynkr.
+    :param artifact: Le chemin du lexique compilé.
+    :return: Le lexique de chaque tag Lynkr.
+    """
+    if artifact.is_file():
+        try:
+            return map_lexicon(artifact, paths)
+        except (OSError, ValueError, KeyError) as error:
+            logger.warning("Lexique compilé ignoré (%s), lecture des csv", error)
+    return {tag: Lexicon.from_csv(path) for tag, path in paths.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Valide les csv du lexique et les compile en un fichier binaire.")
+    parser.add_argument("--output", type=Path, default=LEXICON_ARTIFACT_PATH, help="lexique compilé à écrire")
+    parser.add_argument("--check", action="store_true", help="valider les csv sans les compiler")
+    parser.add_argument("--strict", action="store_true", help="refuser aussi les avertissements")
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    all_errors, all_warnings = [], []
+    for lynkr_tag, csv_path in LEXICON_PATHS.items():
+        tag_errors, tag_warnings = validate_lexicon(lynkr_tag, csv_path)
+        all_errors.extend(tag_errors)
+        all_warnings.extend(tag_warnings)
+    for message in all_warnings:
+        logger.warning(message)
+    for message in all_errors:
+        logger.error(message)
+    if len(all_errors) > 0 or (arguments.strict and len(all_warnings) > 0):
+        sys.exit(1)
+
+    if not arguments.check:
+        counts = compile_lexicon(LEXICON_PATHS, arguments.output)
+        logger.info("Lexique compilé dans %s : %s", arguments.output,
+                    ", ".join(f"{count} {lynkr_tag}" for lynkr_tag, count in counts.items()))
+        # Relire le lexique compilé pour vérifier qu'il restitue les csv
+        mapped = map_lexicon(arguments.output, LEXICON_PATHS)
+        for lynkr_tag, csv_path in LEXICON_PATHS.items():
+            expected = Lexicon.from_csv(csv_path)
+            if list(mapped[lynkr_tag].lemmas) != list(expected.lemmas) \
+                    or list(mapped[lynkr_tag].translations) != list(expected.translations):
+                logger.error("%s : le lexique compilé ne restitue pas %s", lynkr_tag, csv_path.name)
+                sys.exit(1)
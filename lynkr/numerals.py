@@ -0,0 +1,159 @@
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Grammaire des nombres écrits en toutes lettres en français, compilée une fois pour toutes
+UNITS = ("zéro", "un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf", "dix", "onze", "douze",
+         "treize", "quatorze", "quinze", "seize")
+TENS = {"dix": 10, "vingt": 20, "trente": 30, "quarante": 40, "cinquante": 50, "soixante": 60}
+SCALES = {"mille": 10 ** 3, "million": 10 ** 6, "milliard": 10 ** 9}
+NUMERAL_WORDS: Dict[str, int] = {**{unit: value for value, unit in enumerate(UNITS)}, "une": 1, **TENS,
+                                 "vingts": 20, "cent": 100, "cents": 100, **SCALES, "mil": 1000,
+                                 "millions": 10 ** 6, "milliards": 10 ** 9}
+# Mots pouvant relier deux parties d'un même nombre
+NUMERAL_LINKS = frozenset(("et", "-"))
+# Séparateurs des mots d'un nombre, à l'intérieur d'un token ("trente-quatre")
+NUMERAL_SEPARATOR = re.compile(r"[\s-]+")
+
+
+def numeral_words(text: str) -> Optional[List[str]]:
+    """Fonction pour découper un nombre écrit en toutes lettres en mots de la grammaire des nombres.
+
+    :param text: Le texte du nombre.
+    :return: La liste des mots du nombre, sans les mots de liaison, ou `None` si un mot n'appartient pas à la
+        grammaire des nombres.
+    """
+    words = [word for word in NUMERAL_SEPARATOR.split(text.lower()) if word and word != "et"]
+    if len(words) == 0 or any(word not in NUMERAL_WORDS for word in words):
+        return None
+    return words
+
+
+def words_to_number(words: Sequence[str]) -> int:
+    """Fonction pour convertir en une seule passe les mots d'un nombre écrit en toutes lettres.
+
+    :param words: Les mots du nombre, appartenant tous à la grammaire des nombres.
+    :return: La valeur du nombre.
+    """
+    total, group, previous = 0, 0, None
+    for word in words:
+        value = NUMERAL_WORDS[word]
+
+        # "quatre-vingt" : le quatre déjà compté multiplie le vingt
+        if value == 20 and previous == "quatre":
+            group += 76
+        # "cent" multiplie le groupe en cours
+        elif value == 100:
+            group = (group or 1) * 100
+        # "mille", "million" et "milliard" ferment le groupe en cours
+        elif value >= 1000:
+            total += (group or 1) * value
+            group = 0
+        else:
+            group += value
+        previous = word
+
+    return total + group
+
+
+def number_to_words(number: int, final: bool = True) -> str:
+    """Fonction pour écrire un nombre entier positif en toutes lettres, selon l'orthographe traditionnelle.
+
+    :param number: Le nombre à écrire.
+    :param final: Si le nombre termine l'expression, "cent" et "vingt" prenant alors la marque du pluriel.
+    :return: Le nombre écrit en toutes lettres.
+    """
+    if number < 17:
+        return UNITS[number]
+    elif number < 20:
+        return f"dix-{UNITS[number - 10]}"
+    elif number < 100:
+        tens, units = divmod(number, 10)
+        # Soixante-dix et quatre-vingt-dix se construisent sur soixante et quatre-vingt
+        if tens in (7, 9):
+            tens, units = tens - 1, units + 10
+        if tens == 8:
+            prefix = "quatre-vingt"
+            if units == 0:
+                return f"{prefix}s" if final else prefix
+            return f"{prefix}-{number_to_words(units)}"
+        prefix = next(word for word, value in TENS.items() if value == tens * 10)
+        if units == 0:
+            return prefix
+        if units in (1, 11):
+            return f"{prefix} et {number_to_words(units)}"
+        return f"{prefix}-{number_to_words(units)}"
+    elif number < 1000:
+        hundreds, rest = divmod(number, 100)
+        prefix = "cent" if hundreds == 1 else f"{UNITS[hundreds]} cent"
+        if rest == 0:
+            return f"{prefix}s" if final and hundreds > 1 else prefix
+        return f"{prefix} {number_to_words(rest, final)}"
+    elif number < 10 ** 6:
+        thousands, rest = divmod(number, 1000)
+        prefix = "mille" if thousands == 1 else f"{number_to_words(thousands, False)} mille"
+    elif number < 10 ** 9:
+        millions, rest = divmod(number, 10 ** 6)
+        prefix = f"{number_to_words(millions)} million{'s' if millions > 1 else ''}"
+    else:
+        milliards, rest = divmod(number, 10 ** 9)
+        prefix = f"{number_to_words(milliards)} milliard{'s' if milliards > 1 else ''}"
+    return prefix if rest == 0 else f"{prefix} {number_to_words(rest, final)}"
+
+
+def canonical_words(words: Sequence[str]) -> Tuple[str, ...]:
+    """Fonction pour normaliser les mots d'un nombre, en ignorant les variantes d'accord et d'orthographe.
+
+    :param words: Les mots du nombre.
+    :return: Les mots du nombre normalisés.
+    """
+    return tuple({"une": "un", "vingts": "vingt", "cents": "cent", "mil": "mille", "millions": "million",
+                  "milliards": "milliard"}.get(word, word) for word in words)
+
+
+def numeral_spans(texts: Sequence[str], is_num: Sequence[bool]) -> List[Tuple[int, int, int]]:
+    """Fonction pour regrouper les tokens consécutifs formant un même nombre et les convertir en une seule passe.
+
+    Un nombre commence par un token numéral, se poursuit tant que les tokens suivants appartiennent à la grammaire des
+    nombres (éventuellement reliés par "et" ou un trait d'union), et n'est retenu que s'il s'écrit bien ainsi en
+    toutes lettres ; à défaut, il est raccourci par la fin.
+
+    :param texts: Les textes des tokens.
+    :param is_num: Pour chaque token, s'il a été étiqueté comme numéral.
+    :return: La liste des triplets (début, fin, valeur) des nombres trouvés.
+    """
+    spans, i = [], 0
+    while i < len(texts):
+        # Un nombre écrit en chiffres est un nombre à lui seul ; les exposants et chiffres cerclés ("²", "①"), que
+        # `int` ne sait pas convertir, n'en sont pas
+        if is_num[i] and texts[i].isdecimal():
+            spans.append((i, i + 1, int(texts[i])))
+            i += 1
+            continue
+        if not is_num[i] or numeral_words(texts[i]) is None:
+            i += 1
+            continue
+
+        # Étendre le nombre aussi loin que possible
+        end, ends = i + 1, [i + 1]
+        while end < len(texts):
+            if texts[end].lower() in NUMERAL_LINKS and end + 1 < len(texts) \
+                    and numeral_words(texts[end + 1]) is not None:
+                end += 2
+            elif numeral_words(texts[end]) is not None:
+                end += 1
+            else:
+                break
+            ends.append(end)
+
+        # Retenir la plus longue écriture valide, le cas courant ne demandant qu'une seule conversion
+        for end in reversed(ends):
+            words = [word for text in texts[i:end] for word in (numeral_words(text) or ())]
+            value = words_to_number(words)
+            if canonical_words(words) == canonical_words(numeral_words(number_to_words(value))):
+                spans.append((i, end, value))
+                i = end
+                break
+        else:
+            i += 1
+
+    return spans
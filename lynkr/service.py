@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import os
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional, Callable, Set, Tuple
+
+from aiohttp import web
+from dotenv import load_dotenv
+
+from lynkr import engine
+from lynkr.choices import ChoiceMemory
+from lynkr.lean import current_rss
+from lynkr.warmup import warm_up
+
+# Spacy n'est importé que par le moteur, à la première traduction
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
+# Configuration du logger du service
+logger = logging.getLogger("lynkr.service")
+
+
+def pretranslate(text: str) -> dict:
+    """Fonction pour identifier les tokens d'un texte nécessitant un synonyme et leurs synonymes traduisibles.
+
+    :param text: Le texte source à traduire en Lynkr.
+    :return: La réponse du service, contenant les tokens nécessitant un synonyme et les lemmes dont les synonymes
+        n'ont pas pu être récupérés à temps.
+    """
+    # Un texte traduit par le chemin express n'a aucun token nécessitant un synonyme
+    if engine.express_translation(text) is not None:
+        return {"approximate": [], "tokens": []}
+    doc, synonymable = engine.pretranslation_commun_to_lynkr(text)
+    approximations = engine.APPROXIMATIONS.get()
+    lookups = approximations.lookups if approximations is not None else ()
+    return {"approximate": sorted({lemma for lemma, _ in lookups}),
+            "tokens": [{"index": i,
+                        "text": doc[i].text,
+                        "lemma": doc[i].lemma_,
+                        "synonyms": list(doc[i]._.lynkr_compatible_synonyms),
+                        "confidence": doc[i]._.lynkr_vector_synonyms or {},
+                        "preferred": doc[i]._.lynkr_preferred_synonym,
+                        "consensus": doc[i]._.lynkr_consensus_synonym is not None} for i in synonymable]}
+
+
+# Sous-fonction de la fonction `translate`
+def known_choices(doc: Doc, synonyms: Dict[int, Optional[str]]) -> Dict[int, Optional[str]]:
+    """Fonction pour ne garder que les choix de synonymes portant sur un token du texte et un synonyme proposé.
+
+    :param doc: Le doc Spacy du texte source.
+    :param synonyms: Les synonymes choisis par indice de token, `None` pour ne pas traduire le token.
+    :return: Les choix dont l'indice désigne un token du texte et dont le synonyme est traduisible pour ce token.
+    """
+    choices = {i: synonym for i, synonym in synonyms.items()
+               if 0 <= i < len(doc) and (synonym is None or synonym in doc[i]._.lynkr_compatible_synonyms)}
+    if len(choices) < len(synonyms):
+        logger.info("Choix de synonymes inconnus ignorés : %r",
+                    {i: synonym for i, synonym in synonyms.items() if i not in choices})
+    return choices
+
+
+def translate(text: str, synonyms: Optional[Dict[int, Optional[str]]] = None,
+              learn: Collection[int] = ()) -> dict:
+    """Fonction pour traduire un texte en Lynkr avec les synonymes choisis par l'utilisateur.
+
+    :param text: Le texte source à traduire en Lynkr.
+    :param synonyms: Un dictionnaire contenant les indices des tokens nécessitant un synonyme et leur synonyme choisi.
+    :param learn: Les indices des tokens dont le synonyme a été choisi par l'utilisateur, à enregistrer dans la
+        mémoire des choix. Seuls les synonymes proposés pour le token sont enregistrés.
+    :return: La réponse du service, contenant la traduction, les paires (mot, synonyme) utilisées, les lemmes dont
+        la traduction est approximative et les fautes de frappe corrigées.
+    """
+    # Sans synonyme choisi, un texte couvert par le lexique est traduit par le chemin express
+    express = engine.express_translation(text) if not synonyms else None
+    if express is not None:
+        return {"translation": express[0], "synonymed": [], "approximate": [], "corrected": []}
+    doc = engine.parse(text)
+    engine.CHOICES.record((doc[i].lemma_, doc[i].pos_, synonym)
+                          for i, synonym in known_choices(doc, synonyms or {}).items() if i in learn)
+    translation, untranslated, synonymed, corrected = engine.complete_translation_commun_to_lynkr(doc, synonyms)
+    engine.save_untranslated(untranslated)
+    return {"translation": translation, "synonymed": [list(triple) for triple in synonymed],
+            "approximate": list(engine.approximated_lemmas(untranslated, synonymed)),
+            "corrected": [list(triple) for triple in corrected]}
+
+
+def fast_translate(text: str) -> dict:
+    """Fonction pour traduire un texte en Lynkr avec les meilleurs synonymes contextuels.
+
+    :param text: Le texte source à traduire en Lynkr.
+    :return: La réponse du service, contenant la traduction, les paires (mot, synonyme) utilisées, les lemmes dont
+        la traduction est approximative et les fautes de frappe corrigées.
+    """
+    translation, untranslated, synonymed, corrected = engine.fast_translation_commun_to_lynkr(text)
+    engine.save_untranslated(untranslated)
+    return {"translation": translation, "synonymed": [list(triple) for triple in synonymed],
+            "approximate": list(engine.approximated_lemmas(untranslated, synonymed)),
+            "corrected": [list(triple) for triple in corrected]}
+
+
+def batch_translate(texts: List[str]) -> dict:
+    """Fonction pour traduire rapidement un lot de textes en Lynkr, seules les phrases nouvelles étant analysées.
+
+    :param texts: Les textes sources à traduire en Lynkr.
+    :return: La réponse du service, contenant pour chaque texte la traduction, les paires (mot, synonyme) utilisées,
+        les lemmes dont la traduction est approximative et les fautes de frappe corrigées.
+    """
+    translations = []
+    for translation, untranslated, synonymed, corrected in engine.batch_fast_translation_commun_to_lynkr(texts):
+        engine.save_untranslated(untranslated)
+        translations.append({"translation": translation, "synonymed": [list(triple) for triple in synonymed],
+                             "approximate": list(engine.approximated_lemmas(untranslated, synonymed)),
+                             "corrected": [list(triple) for triple in corrected]})
+    return {"translations": translations}
+
+
+# Sous-fonction de la fonction `run_in_executor`
+def run_within_budget(function: Callable[..., dict], seconds: Optional[float], *args) -> \
+        Tuple[dict, engine.Approximations]:
+    """Fonction pour exécuter une traduction en limitant la durée de ses recherches de synonymes.
+
+    :param function: La fonction de traduction à exécuter.
+    :param seconds: La durée allouée à la traduction, en secondes, ou `None` pour ne pas la limiter.
+    :return: Le résultat de la traduction et les approximations faites faute de temps.
+    """
+    with engine.request_budget(seconds) as approximations:
+        return function(*args), approximations
+
+
+async def run_in_executor(request: web.Request, function: Callable[..., dict], *args) -> web.Response:
+    """Fonction pour exécuter une traduction bloquante dans le pool de threads du service, dans le budget de temps
+    d'une requête.
+
+    Les recherches de synonymes abandonnées faute de temps sont achevées en arrière-plan, hors du pool de threads des
+    traductions, pour que les requêtes suivantes les trouvent en cache.
+
+    :param request: La requête HTTP reçue.
+    :param function: La fonction de traduction à exécuter.
+    :return: La réponse HTTP contenant le résultat de la traduction.
+    """
+    loop = asyncio.get_running_loop()
+    result, approximations = await loop.run_in_executor(request.app["executor"],
+                                                        partial(run_within_budget, function, request.app["budget"],
+                                                                *args))
+    if len(approximations.lookups) > 0:
+        loop.run_in_executor(request.app["completion"], partial(engine.complete_lookups, approximations.lookups))
+    return web.json_response(result)
+
+
+async def read_text(request: web.Request) -> dict:
+    """Fonction pour lire et valider le corps JSON d'une requête de traduction.
+
+    :param request: La requête HTTP reçue.
+    :return: Le corps JSON de la requête.
+    """
+    try:
+        data = await request.json()
+    except ValueError:
+        raise web.HTTPBadRequest(text="Invalid JSON body")
+    if not isinstance(data, dict) or not isinstance(data.get("text"), str):
+        raise web.HTTPBadRequest(text="Missing `text` field")
+    return data
+
+
+# Sous-fonction de la fonction `translate_handler`
+def read_choices(data: dict) -> Tuple[Dict[int, Optional[str]], Set[int]]:
+    """Fonction pour lire et valider les synonymes choisis et les indices à enregistrer d'une requête de traduction.
+
+    :param data: Le corps JSON de la requête.
+    :return: Les synonymes choisis par indice de token et les indices des tokens à enregistrer.
+    """
+    synonyms, learn = data.get("synonyms") or {}, data.get("learn") or []
+    if not isinstance(synonyms, dict) or not isinstance(learn, list):
+        raise web.HTTPBadRequest(text="Invalid `synonyms` or `learn` field")
+    try:
+        choices = {int(i): synonym for i, synonym in synonyms.items()}
+        indices = {int(i) for i in learn}
+    except (TypeError, ValueError):
+        raise web.HTTPBadRequest(text="Token indices must be integers")
+    if not all(synonym is None or isinstance(synonym, str) for synonym in choices.values()):
+        raise web.HTTPBadRequest(text="Synonyms must be strings or null")
+    return choices, indices
+
+
+async def pretranslate_handler(request: web.Request) -> web.Response:
+    """Route `POST /pretranslate` : tokens nécessitant un synonyme."""
+    data = await read_text(request)
+    return await run_in_executor(request, pretranslate, data["text"])
+
+
+async def translate_handler(request: web.Request) -> web.Response:
+    """Route `POST /translate` : traduction avec les synonymes choisis."""
+    data = await read_text(request)
+    synonyms, learn = read_choices(data)
+    return await run_in_executor(request, translate, data["text"], synonyms, learn)
+
+
+async def fast_translate_handler(request: web.Request) -> web.Response:
+    """Route `POST /fast` : traduction avec les meilleurs synonymes contextuels."""
+    data = await read_text(request)
+    return await run_in_executor(request, fast_translate, data["text"])
+
+
+async def batch_translate_handler(request: web.Request) -> web.Response:
+    """Route `POST /batch` : traduction rapide d'un lot de textes, phrase par phrase."""
+    try:
+        data = await request.json()
+    except ValueError:
+        raise web.HTTPBadRequest(text="Invalid JSON body")
+    if not isinstance(data, dict) or not isinstance(data.get("texts"), list) \
+            or not all(isinstance(text, str) for text in data["texts"]):
+        raise web.HTTPBadRequest(text="Missing `texts` field")
+    return await run_in_executor(request, batch_translate, data["texts"])
+
+
+async def health_handler(request: web.Request) -> web.Response:
+    """Route `GET /health` : disponibilité du service."""
+    return web.json_response({"status": "ok"})
+
+
+async def close_executor(app: web.Application) -> None:
+    """Ferme les pools de threads du service à l'arrêt de l'application."""
+    app["executor"].shutdown(wait=False)
+    app["completion"].shutdown(wait=False, cancel_futures=True)
+
+
+async def start_warm_up(app: web.Application) -> None:
+    """Lance le préchauffage des caches en arrière-plan, hors du pool de threads des traductions."""
+    loop = asyncio.get_running_loop()
+    app["warmup_task"] = loop.run_in_executor(None, partial(warm_up, **app["warmup"], stop=app["warmup_stop"]))
+
+
+async def stop_warm_up(app: web.Application) -> None:
+    """Interrompt le préchauffage des caches à l'arrêt de l'application."""
+    app["warmup_stop"].set()
+
+
+def create_app(workers: int = 4, warmup: Optional[dict] = None, budget: Optional[float] = 2.0) -> web.Application:
+    """Fonction pour créer l'application web du service de traduction.
+
+    :param workers: Le nombre de traductions traitées en parallèle.
+    :param warmup: Les budgets du préchauffage des caches au démarrage (arguments de `warm_up`), ou `None` pour ne
+        pas préchauffer.
+    :param budget: La durée allouée aux recherches de synonymes de chaque requête, en secondes, ou `None` pour ne
+        pas la limiter.
+    :return: L'application web du service.
+    """
+    app = web.Application()
+    app["executor"] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lynkr")
+    app["completion"] = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lynkr-completion")
+    app["budget"] = budget
+    app.on_cleanup.append(close_executor)
+    if warmup is not None:
+        app["warmup"] = warmup
+        app["warmup_stop"] = threading.Event()
+        app.on_startup.append(start_warm_up)
+        app.on_shutdown.append(stop_warm_up)
+    app.add_routes([web.post("/pretranslate", pretranslate_handler),
+                    web.post("/translate", translate_handler),
+                    web.post("/fast", fast_translate_handler),
+                    web.post("/batch", batch_translate_handler),
+                    web.get("/health", health_handler)])
+    return app
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+    # Le service écoute sur un socket Unix s'il est défini, sinon sur une adresse TCP locale
+    SERVICE_SOCKET = os.getenv("LYNKR_SERVICE_SOCKET")
+    SERVICE_HOST = os.getenv("LYNKR_SERVICE_HOST", "127.0.0.1")
+    SERVICE_PORT = int(os.getenv("LYNKR_SERVICE_PORT", "8765"))
+    SERVICE_WORKERS = int(os.getenv("LYNKR_SERVICE_WORKERS", "4"))
+
+    # Configuration du moteur de traduction
+    engine.MEMORY_LEAN = os.getenv("LYNKR_MEMORY_LEAN", "0") == "1"
+    engine.CNRTL_URL = os.getenv("LYNKR_CNRTL_URL", engine.CNRTL_URL)
+    engine.CNRTL_FALLBACK = os.getenv("LYNKR_CNRTL_FALLBACK", "0") == "1"
+    engine.EXPRESS = os.getenv("LYNKR_EXPRESS", "1") == "1"
+    engine.CNRTL_TIMEOUT = float(os.getenv("LYNKR_CNRTL_TIMEOUT", str(engine.CNRTL_TIMEOUT)))
+    engine.NUMERAL_OUTPUT = os.getenv("LYNKR_NUMERAL_OUTPUT", engine.NUMERAL_OUTPUT)
+    engine.VECTOR_THRESHOLD = float(os.getenv("LYNKR_VECTOR_THRESHOLD", str(engine.VECTOR_THRESHOLD)))
+    engine.CORRECTION_THRESHOLD = float(os.getenv("LYNKR_CORRECTION_THRESHOLD", str(engine.CORRECTION_THRESHOLD)))
+    engine.CHOICES = ChoiceMemory(Path(os.getenv("LYNKR_CHOICES_PATH", str(engine.CHOICES.path))),
+                                  min_count=int(os.getenv("LYNKR_CONSENSUS_COUNT", str(engine.CHOICES.min_count))),
+                                  share=float(os.getenv("LYNKR_CONSENSUS_SHARE", str(engine.CHOICES.share))))
+
+    # Charger les ressources du moteur avant d'accepter les requêtes, le moteur ne les chargeant sinon qu'à la
+    # première traduction
+    engine.load()
+    logger.info("Moteur de traduction chargé (mode économe en mémoire : %s), RSS : %.0f Mo", engine.MEMORY_LEAN,
+                current_rss() / 2 ** 20)
+
+    # Préchauffage des caches au démarrage, désactivé par une durée nulle
+    WARMUP_SECONDS = float(os.getenv("LYNKR_WARMUP_SECONDS", "60"))
+    warmup_budget = {"seconds": WARMUP_SECONDS,
+                     "requests": int(os.getenv("LYNKR_WARMUP_REQUESTS", "100")),
+                     "lemmas": int(os.getenv("LYNKR_WARMUP_LEMMAS", "500"))} if WARMUP_SECONDS > 0 else None
+
+    # Durée allouée aux recherches de synonymes de chaque requête, illimitée si nulle
+    REQUEST_BUDGET = float(os.getenv("LYNKR_REQUEST_BUDGET", "2"))
+
+    application = create_app(SERVICE_WORKERS, warmup_budget, REQUEST_BUDGET if REQUEST_BUDGET > 0 else None)
+    if SERVICE_SOCKET:
+        web.run_app(application, path=SERVICE_SOCKET)
+    else:
+        web.run_app(application, host=SERVICE_HOST, port=SERVICE_PORT)
@@ -0,0 +1,114 @@
+import gzip
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# Chemin vers le dossier principal du projet
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Chemin vers le thésaurus inversé construit hors ligne
+THESAURUS_PATH = MAIN_FOLDER / "assets/build/lynkr/thesaurus.json.gz"
+# Version du format du thésaurus inversé
+THESAURUS_VERSION = 2
+
+# Répertoires du CNRTL interrogés pour les lemmes de chaque tag Lynkr
+TAG_DIRECTORIES = {"GRAMNUM": ("adjectif", "substantif"),
+                   "GRAMCONJ": ("verbe",),
+                   "X": ("adverbe", "interjection", "")}
+
+# Configuration du logger du thésaurus
+logger = logging.getLogger("lynkr.thesaurus")
+
+
+def build_thesaurus(lexicon: Dict[str, Iterable[str]], fetch: Callable[[str, str], Tuple[str, ...]],
+                    delay: float = 0.0) -> Dict[str, Dict[str, list]]:
+    """Fonction pour construire le thésaurus inversé des lemmes traduisibles en Lynkr.
+
+    Pour chaque lemme du lexique, ses synonymes sont récupérés une fois pour toutes, puis chaque synonyme est associé
+    aux lemmes du lexique dont il est synonyme.
+
+    :param lexicon: Un dictionnaire associant chaque tag Lynkr aux lemmes traduisibles correspondants.
+    :param fetch: La fonction récupérant les synonymes d'un lemme dans un répertoire du CNRTL.
+    :param delay: Le délai entre deux requêtes au CNRTL, en secondes.
+    :return: Un dictionnaire associant chaque répertoire du CNRTL à un dictionnaire synonyme -> lemmes traduisibles.
+    """
+    inverted = defaultdict(lambda: defaultdict(set))
+    for tag, lemmas in lexicon.items():
+        for lemma in lemmas:
+            for directory in TAG_DIRECTORIES[tag]:
+                try:
+                    synonyms = fetch(lemma, directory)
+                except Exception as error:
+                    logger.warning("Synonymes de %r (%r) indisponibles : %r", lemma, directory, error)
+                    continue
+                for synonym in synonyms:
+                    if synonym != lemma:
+                        inverted[directory][synonym].add(lemma)
+                time.sleep(delay)
+            logger.info("%s : %s", tag, lemma)
+
+    return {directory: {synonym: sorted(lemmas) for synonym, lemmas in sorted(synonyms.items())}
+            for directory, synonyms in inverted.items()}
+
+
+def save_thesaurus(thesaurus: Dict[str, Dict[str, list]], lexicon_hash: str, path: Path = THESAURUS_PATH) -> None:
+    """Fonction pour enregistrer le thésaurus inversé sous forme de JSON compressé.
+
+    :param thesaurus: Le thésaurus inversé à enregistrer.
+    :param lexicon_hash: L'empreinte des lemmes du lexique à partir duquel le thésaurus a été construit.
+    :param path: Le chemin du fichier à écrire.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, mode="wt", encoding="utf-8") as file:
+        json.dump({"version": THESAURUS_VERSION, "lexicon": lexicon_hash, "synonyms": thesaurus}, file,
+                  ensure_ascii=False, separators=(",", ":"))
+
+
+def load_thesaurus(path: Path = THESAURUS_PATH,
+                   lexicon_hash: Optional[str] = None) -> Dict[Tuple[str, str], Tuple[str, ...]]:
+    """Fonction pour charger le thésaurus inversé, s'il a été construit.
+
+    :param path: Le chemin du thésaurus inversé.
+    :param lexicon_hash: L'empreinte des lemmes du lexique actuel, ou `None` pour ne pas vérifier que le thésaurus
+        est à jour.
+    :return: Un dictionnaire associant chaque paire (lemme, répertoire du CNRTL) aux lemmes traduisibles en Lynkr dont
+        il est synonyme, vide si le thésaurus n'a pas été construit, n'est pas à la bonne version ou a été construit
+        à partir d'un autre lexique.
+    """
+    if not path.is_file():
+        return {}
+    with gzip.open(path, mode="rt", encoding="utf-8") as file:
+        data = json.load(file)
+    if data.get("version") != THESAURUS_VERSION:
+        logger.warning("Thésaurus inversé ignoré : version %r au lieu de %r", data.get("version"),
+                       THESAURUS_VERSION)
+        return {}
+    if lexicon_hash is not None and data.get("lexicon") != lexicon_hash:
+        logger.warning("Thésaurus inversé ignoré : construit à partir d'un autre lexique, à reconstruire avec "
+                       "`python -m lynkr.thesaurus`")
+        return {}
+    return {(synonym, directory): tuple(lemmas)
+            for directory, synonyms in data["synonyms"].items() for synonym, lemmas in synonyms.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Construit le thésaurus inversé des lemmes traduisibles en Lynkr.")
+    parser.add_argument("--delay", type=float, default=0.5, help="délai entre deux requêtes au CNRTL, en secondes")
+    parser.add_argument("--output", type=Path, default=THESAURUS_PATH, help="chemin du thésaurus à écrire")
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    from lynkr import engine
+    from lynkr.lexicon import lexicon_lemmas_hash
+
+    started = time.perf_counter()
+    lexicons = engine.get_lexicons()
+    result = build_thesaurus({tag: series.index for tag, series in lexicons.items()}, engine.cnrtl_synonyms,
+                             arguments.delay)
+    save_thesaurus(result, lexicon_lemmas_hash(lexicons), arguments.output)
+    logger.info("%d synonymes indexés en %.0f s dans %s", sum(len(synonyms) for synonyms in result.values()),
+                time.perf_counter() - started, arguments.output)
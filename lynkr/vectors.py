@@ -0,0 +1,132 @@
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Chemin vers le dossier principal du projet
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Dossier contenant les index vectoriels du lexique, un par tag Lynkr
+VECTORS_FOLDER = MAIN_FOLDER / "assets/build/lynkr/vectors"
+
+# Configuration du logger des index vectoriels
+logger = logging.getLogger("lynkr.vectors")
+
+
+class VectorIndex:
+    """Index des vecteurs normalisés des lemmes traduisibles en Lynkr d'un même tag Lynkr.
+
+    :param lemmas: Les lemmes indexés, dans l'ordre des lignes de la matrice.
+    :type lemmas: Tuple[str, ...]
+    :param matrix: La matrice des vecteurs normalisés des lemmes, éventuellement projetée en mémoire depuis le disque.
+    :type matrix: np.ndarray
+    """
+
+    def __init__(self, lemmas: Tuple[str, ...], matrix: np.ndarray) -> None:
+        """Initialise l'index vectoriel.
+
+        :param lemmas: Les lemmes indexés, dans l'ordre des lignes de la matrice.
+        :param matrix: La matrice des vecteurs normalisés des lemmes.
+        """
+        self.lemmas = lemmas
+        self.matrix = matrix
+
+    def nearest(self, queries: np.ndarray, k: int = 3, threshold: float = 0.0) -> List[List[Tuple[str, float]]]:
+        """Méthode pour obtenir, en un seul calcul matriciel, les lemmes les plus proches de plusieurs vecteurs.
+
+        :param queries: La matrice des vecteurs recherchés, une ligne par vecteur.
+        :param k: Le nombre maximal de lemmes renvoyés par vecteur.
+        :param threshold: La similarité cosinus minimale des lemmes renvoyés.
+        :return: Pour chaque vecteur, la liste des paires (lemme, similarité) par similarité décroissante.
+        """
+        if len(self.lemmas) == 0 or len(queries) == 0:
+            return [[] for _ in range(len(queries))]
+
+        # Normalisation des vecteurs recherchés, les vecteurs nuls n'ayant aucun voisin
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = np.divide(queries, norms, out=np.zeros_like(queries, dtype=np.float32), where=norms > 0)
+
+        # Similarités cosinus de tous les vecteurs avec tous les lemmes, puis sélection des k meilleures
+        scores = queries @ self.matrix.T
+        k = min(k, len(self.lemmas))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top, top_scores = np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+        return [[(self.lemmas[i], float(score)) for i, score in zip(row, row_scores) if score >= threshold]
+                for row, row_scores in zip(top, top_scores)]
+
+
+def build_vector_index(lemmas: Iterable[str], vocab) -> VectorIndex:
+    """Fonction pour construire l'index vectoriel de lemmes à partir des vecteurs d'un vocabulaire Spacy.
+
+    :param lemmas: Les lemmes à indexer.
+    :param vocab: Le vocabulaire Spacy contenant les vecteurs de mots.
+    :return: L'index vectoriel des lemmes ayant un vecteur.
+    """
+    kept, vectors = [], []
+    for lemma in lemmas:
+        lexeme = vocab[lemma]
+        if lexeme.has_vector and lexeme.vector_norm > 0:
+            kept.append(lemma)
+            vectors.append(lexeme.vector / lexeme.vector_norm)
+    matrix = np.vstack(vectors).astype(np.float32) if vectors else np.zeros((0, vocab.vectors_length), np.float32)
+    return VectorIndex(tuple(kept), matrix)
+
+
+def save_vector_index(tag: str, index: VectorIndex, lexicon_hash: str, folder: Path = VECTORS_FOLDER) -> None:
+    """Fonction pour enregistrer l'index vectoriel d'un tag Lynkr.
+
+    :param tag: Le tag Lynkr de l'index.
+    :param index: L'index vectoriel à enregistrer.
+    :param lexicon_hash: L'empreinte des lemmes du lexique à partir duquel l'index a été construit.
+    :param folder: Le dossier dans lequel enregistrer l'index.
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    np.save(folder / f"{tag}.npy", index.matrix)
+    (folder / f"{tag}.json").write_text(json.dumps({"lexicon": lexicon_hash, "lemmas": index.lemmas},
+                                                   ensure_ascii=False), encoding="utf-8")
+
+
+def load_vector_indexes(folder: Path = VECTORS_FOLDER, lexicon_hash: Optional[str] = None) -> Dict[str, VectorIndex]:
+    """Fonction pour charger les index vectoriels du lexique, projetés en mémoire sans copie.
+
+    :param folder: Le dossier contenant les index vectoriels.
+    :param lexicon_hash: L'empreinte des lemmes du lexique actuel, ou `None` pour ne pas vérifier que les index sont
+        à jour.
+    :return: Un dictionnaire associant chaque tag Lynkr à son index vectoriel, sans les index construits à partir
+        d'un autre lexique, vide si les index n'ont pas été construits.
+    """
+    indexes = {}
+    for path in sorted(folder.glob("*.npy")):
+        metadata = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        if lexicon_hash is not None and (not isinstance(metadata, dict) or metadata.get("lexicon") != lexicon_hash):
+            logger.warning("Index vectoriel %s ignoré : construit à partir d'un autre lexique, à reconstruire avec "
+                           "`python -m lynkr.vectors`", path.stem)
+            continue
+        lemmas = tuple(metadata["lemmas"] if isinstance(metadata, dict) else metadata)
+        indexes[path.stem] = VectorIndex(lemmas, np.load(path, mmap_mode="r"))
+    return indexes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Construit les index vectoriels des lemmes traduisibles en Lynkr.")
+    parser.add_argument("--output", type=Path, default=VECTORS_FOLDER, help="dossier des index à écrire")
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    from lynkr import engine
+    from lynkr.lexicon import lexicon_lemmas_hash
+
+    lexicons = engine.get_lexicons()
+    for lynkr_tag, series in lexicons.items():
+        started = time.perf_counter()
+        vector_index = build_vector_index(series.index, engine.get_nlp().vocab)
+        save_vector_index(lynkr_tag, vector_index, lexicon_lemmas_hash(lexicons), arguments.output)
+        logger.info("%s : %d/%d lemmes indexés en %.2f s", lynkr_tag, len(vector_index.lemmas), len(series),
+                    time.perf_counter() - started)
@@ -0,0 +1,142 @@
+import csv
+import time
+import logging
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from lynkr import engine
+
+# Chemin vers le dossier principal du projet
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Chemin vers le corpus de phrases courantes traduites au démarrage du service
+WARMUP_CORPUS_PATH = MAIN_FOLDER / "assets/texts/txt/lynkr-warmup.txt"
+# Durée maximale du préchauffage, en secondes
+WARMUP_SECONDS = 60.0
+# Nombre maximal de requêtes au CNRTL pendant le préchauffage
+WARMUP_REQUESTS = 100
+# Nombre maximal de lemmes les plus fréquents de la mémoire rejoués pendant le préchauffage
+WARMUP_LEMMAS = 500
+# Nombre de phrases du corpus analysées ensemble
+WARMUP_BATCH_SIZE = 8
+
+# Configuration du logger du préchauffage
+logger = logging.getLogger("lynkr.warmup")
+
+
+def frequent_lemmas(path: Path, limit: int) -> List[Tuple[str, str]]:
+    """Fonction pour obtenir les lemmes non traduits les plus fréquents du csv mémoire.
+
+    :param path: Le chemin du csv mémoire.
+    :param limit: Le nombre maximal de lemmes à renvoyer.
+    :return: Les paires (lemme, catégorie grammaticale), de la plus à la moins fréquente.
+    """
+    if not path.is_file():
+        return []
+    with open(path, mode="r", encoding="utf-8", newline="") as file:
+        rows = csv.reader(file)
+        next(rows, None)
+        counts = Counter((row[1], row[2]) for row in rows if len(row) >= 3 and row[1])
+    return [pair for pair, _ in counts.most_common(limit)]
+
+
+def read_corpus(path: Path) -> List[str]:
+    """Fonction pour lire le corpus de phrases courantes, une phrase par ligne.
+
+    :param path: Le chemin du corpus.
+    :return: Les phrases du corpus.
+    """
+    if not path.is_file():
+        return []
+    with open(path, mode="r", encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip()]
+
+
+def warm_up(seconds: float = WARMUP_SECONDS, requests: int = WARMUP_REQUESTS, lemmas: int = WARMUP_LEMMAS,
+            stop: Optional[threading.Event] = None) -> Tuple[int, int, int]:
+    """Fonction pour préchauffer les caches du moteur de traduction avant l'arrivée des premiers utilisateurs.
+
+    Les lemmes les plus fréquents de la mémoire passent par le pipeline de traduction, par lots : analyse par le
+    modèle, correction des fautes de frappe, recherche de leurs synonymes (thésaurus inversé, mémoire des choix, CNRTL
+    si son recours est autorisé, voisins vectoriels) et consultation du lexique. Les phrases du corpus sont ensuite
+    traduites, ce qui remplit le cache des traductions de phrases. Le budget de requêtes ne compte que les recherches
+    du CNRTL lancées pour les lemmes de la mémoire, réussies ou non, et est vérifié avant chaque lemme et entre deux
+    lots de phrases ; les autres recherches faites pendant l'analyse d'un lot ne sont bornées que par le temps
+    restant, comme le budget d'une requête du service. Les tokens non traduits ne sont pas sauvegardés dans la
+    mémoire.
+
+    :param seconds: La durée maximale du préchauffage, en secondes.
+    :param requests: Le nombre maximal de requêtes au CNRTL.
+    :param lemmas: Le nombre maximal de lemmes de la mémoire à rejouer.
+    :param stop: Un évènement interrompant le préchauffage, à l'arrêt du service.
+    :return: Le nombre de lemmes rejoués, de phrases traduites et de requêtes au CNRTL du rejeu des lemmes.
+    """
+    started = time.perf_counter()
+    # Recherches du CNRTL lancées par le préchauffage lui-même, indépendamment des requêtes du service concurrentes
+    spent = 0
+
+    def exhausted() -> bool:
+        return time.perf_counter() - started >= seconds or (stop is not None and stop.is_set())
+
+    def remaining() -> float:
+        return max(0.0, seconds - (time.perf_counter() - started))
+
+    # Rejouer par lots les lemmes les plus fréquents de la mémoire
+    replayed = 0
+    pairs = frequent_lemmas(engine.MEMORY_PATH, lemmas)
+    for i in range(0, len(pairs), WARMUP_BATCH_SIZE):
+        if exhausted():
+            break
+        batch = pairs[i:i + WARMUP_BATCH_SIZE]
+
+        # Rechercher sur le site du CNRTL, dans la limite du budget de requêtes, les synonymes des lemmes absents du
+        # thésaurus inversé, avec la catégorie grammaticale sous laquelle ils ont été rencontrés
+        capped = False
+        for lemma, pos in batch:
+            directory = engine.cnrtl_directory(pos)
+            if directory is None or not engine.CNRTL_FALLBACK or (lemma, directory) in engine.get_thesaurus() \
+                    or engine.CHOICES.consensus(lemma, pos) is not None:
+                continue
+            if spent >= requests:
+                capped = True
+                continue
+            spent += 1
+            try:
+                engine.cnrtl_synonyms(lemma, directory)
+            except Exception as error:
+                logger.warning("Préchauffage de \"%s\" impossible : %r", lemma, error)
+
+        # Faire passer les lemmes par le pipeline de traduction, comme les tokens d'un texte à traduire ; une fois le
+        # budget de requêtes épuisé, sans laisser de temps au CNRTL, pour ne pas rechercher les lemmes écartés
+        try:
+            with engine.request_budget(0.0 if capped else remaining()):
+                for doc in engine.get_nlp().pipe([lemma for lemma, _ in batch]):
+                    engine.assign_corrections(doc)
+                    engine.assign_vector_synonyms(doc)
+                    for token in doc:
+                        _ = token._.lynkr_lemma_translation, token._.lynkr_compatible_synonyms
+        except Exception as error:
+            logger.warning("Préchauffage des lemmes interrompu : %r", error)
+            break
+        replayed += len(batch)
+
+    # Traduire le corpus par lots, tant que les budgets le permettent
+    translated = 0
+    corpus = read_corpus(WARMUP_CORPUS_PATH)
+    for i in range(0, len(corpus), WARMUP_BATCH_SIZE):
+        if exhausted() or spent >= requests:
+            break
+        batch = corpus[i:i + WARMUP_BATCH_SIZE]
+        try:
+            with engine.request_budget(remaining()):
+                engine.batch_fast_translation_commun_to_lynkr(batch)
+        except Exception as error:
+            logger.warning("Préchauffage du corpus interrompu : %r", error)
+            break
+        translated += len(batch)
+
+    logger.info("Préchauffage terminé en %.1f s : %d lemmes rejoués, %d phrases traduites, %d requêtes au CNRTL",
+                time.perf_counter() - started, replayed, translated, spent)
+    return replayed, translated, spent
@@ -1,20 +1,91 @@
 import os
+import json
+import hashlib
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import timedelta, datetime, time, timezone
 
 import discord
+from discord import app_commands
 from discord.ext import commands, tasks
 from discord.utils import get
 
 
 MAIN_FOLDER = Path(__file__).parent.resolve()
 
+# Local record of the application command tree fingerprint of the last successful sync
+TREE_HASH_PATH = MAIN_FOLDER / "assets/cache/tree-hash.txt"
+
 INTENTS = discord.Intents.default()
 INTENTS.members = True
 INTENTS.message_content = True
 
 
+def app_command_schema(command: app_commands.Command | app_commands.Group | app_commands.ContextMenu) -> dict:
+    """Describes an application command with the data Discord stores about it.
+
+    :param command: Application command, group or context menu
+    :return: JSON-serializable description of the command
+    """
+    schema = {"name": command.name,
+              "guild_only": command.guild_only,
+              "nsfw": command.nsfw,
+              "default_permissions": getattr(command.default_permissions, "value", None)}
+
+    # Context menus only have a name and a type
+    if isinstance(command, app_commands.ContextMenu):
+        schema["type"] = command.type.name
+        return schema
+
+    schema["description"] = command.description
+
+    # Groups are described by their subcommands
+    if isinstance(command, app_commands.Group):
+        schema["type"] = "group"
+        schema["commands"] = [app_command_schema(subcommand)
+                              for subcommand in sorted(command.commands, key=lambda x: x.name)]
+    else:
+        schema["type"] = "command"
+        schema["parameters"] = [{"name": parameter.name,
+                                 "description": parameter.description,
+                                 "type": parameter.type.name,
+                                 "required": parameter.required,
+                                 "choices": [[choice.name, choice.value] for choice in parameter.choices],
+                                 "min_value": parameter.min_value,
+                                 "max_value": parameter.max_value,
+                                 "autocomplete": parameter.autocomplete}
+                                for parameter in command.parameters]
+    return schema
+
+
+def app_command_tree_fingerprint(tree: app_commands.CommandTree, application_id: int | None) -> str:
+    """Computes a stable hash of the application commands registered in a command tree, for a given application.
+
+    The application ID is part of the hash, so that running the same checkout with another application (development
+    and production bots) syncs the commands of each of them.
+
+    :param tree: Command tree of the bot
+    :param application_id: ID of the application the commands are synced to
+    :return: Hexadecimal SHA-256 digest of the command tree
+    """
+    commands_schema = [app_command_schema(command)
+                       for command in sorted(tree.get_commands(), key=lambda x: (x.name, type(x).__name__))]
+    payload = json.dumps({"application_id": application_id, "commands": commands_schema}, sort_keys=True,
+                         ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@commands.command(name="sync")
+@commands.is_owner()
+async def sync_command(ctx: commands.Context) -> None:
+    """Forces the synchronisation of the application commands with Discord.
+
+    :param ctx: Context of the owner's message
+    """
+    await ctx.bot.sync_tree(force=True)
+    await ctx.send("Application commands synced.")
+
+
 class Firjtyehm(commands.Bot):
     """Discord bot for the Lotus Library on Herobrine.fr.
     """
@@ -23,6 +94,7 @@ class Firjtyehm(commands.Bot):
         """Constructor method
         """
         super().__init__(command_prefix="!", intents=INTENTS)
+        self.add_command(sync_command)
 
     async def setup_hook(self) -> None:
         """...
@@ -32,9 +104,28 @@ class Firjtyehm(commands.Bot):
             if filename.endswith(".py"):
                 await self.load_extension(f"cogs.{filename[:-3]}")
 
-        # Syncing commands
+        # Syncing commands, only if they changed since the last sync
+        await self.sync_tree()
+
+    async def sync_tree(self, force: bool = False) -> bool:
+        """Syncs the application commands with Discord when their fingerprint differs from the stored one.
+
+        :param force: Whether to sync even if the fingerprint did not change
+        :return: Whether the command tree was synced
+        """
+        fingerprint = app_command_tree_fingerprint(self.tree, self.application_id)
+        if not force and TREE_HASH_PATH.is_file() and TREE_HASH_PATH.read_text(encoding="utf-8") == fingerprint:
+            print("Application commands unchanged, skipping sync")
+            return False
+
         await self.tree.sync()
 
+        # Storing the fingerprint only once Discord accepted the new command tree
+        TREE_HASH_PATH.parent.mkdir(parents=True, exist_ok=True)
+        TREE_HASH_PATH.write_text(fingerprint, encoding="utf-8")
+        print("Application commands synced")
+        return True
+
     async def on_ready(self) -> None:
         """Sends status data to bot owner when bot get online.
         """
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from lynkr import admission
+from lynkr.admission import AdmissionQueue, JobCancelled, QueueFull, RateLimited, TokenBucket
+
+
+class Clock:
+    """Horloge `time.monotonic` simulée, avancée à la main."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(admission.time, "monotonic", clock)
+    return clock
+
+
+def test_token_bucket_refills_over_time(clock):
+    bucket = TokenBucket(2, 0.5)
+    bucket.take()
+    bucket.take()
+    assert bucket.retry_after() == pytest.approx(2.0)
+    clock.now += 1
+    assert bucket.retry_after() == pytest.approx(1.0)
+    clock.now += 10
+    assert bucket.retry_after() == 0.0
+    assert bucket.tokens == 2
+
+
+def test_submit_applies_user_and_guild_limits(clock):
+    async def scenario():
+        queue = AdmissionQueue(maxsize=10, workers=0, user_burst=2, user_rate=0.1, guild_burst=3, guild_rate=0.1)
+        await queue.start()
+        run = asyncio.sleep
+        queue.submit(1, 1, 0, run, lambda: True)
+        queue.submit(1, 1, 0, run, lambda: True)
+        with pytest.raises(RateLimited) as user_limited:
+            queue.submit(1, 1, 0, run, lambda: True)
+        assert user_limited.value.retry_after == pytest.approx(10.0)
+        queue.submit(2, 1, 0, run, lambda: True)
+        with pytest.raises(RateLimited):
+            queue.submit(3, 1, 0, run, lambda: True)
+        # Un autre serveur n'est pas concerné par les limites du premier
+        queue.submit(3, 2, 0, run, lambda: True)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_submit_rejects_when_full(clock):
+    async def scenario():
+        queue = AdmissionQueue(maxsize=1, workers=0)
+        await queue.start()
+        queue.submit(1, 1, 0, asyncio.sleep, lambda: True)
+        with pytest.raises(QueueFull):
+            queue.submit(2, 2, 0, asyncio.sleep, lambda: True)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_jobs_run_by_priority_then_arrival(clock):
+    async def scenario():
+        queue, order = AdmissionQueue(workers=0), []
+        await queue.start()
+
+        def job(name):
+            async def run():
+                order.append(name)
+                return name
+            return run
+
+        futures = []
+        for user_id, (priority, name) in enumerate([(1, "long"), (0, "fast"), (0, "court"), (1, "long 2")]):
+            future, position = queue.submit(user_id, user_id, priority, job(name), lambda: True)
+            futures.append(future)
+        assert position == 3
+        queue.workers = 1
+        await queue.start()
+        assert await asyncio.gather(*futures) == ["long", "fast", "court", "long 2"]
+        assert order == ["fast", "court", "long", "long 2"]
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_expired_jobs_are_cancelled_without_running(clock):
+    async def scenario():
+        queue, ran = AdmissionQueue(workers=1), []
+        await queue.start()
+
+        async def run():
+            ran.append(True)
+
+        future, _ = queue.submit(1, 1, 0, run, lambda: False)
+        with pytest.raises(JobCancelled):
+            await future
+        assert ran == []
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_take_spends_tokens_outside_the_queue(clock):
+    queue = AdmissionQueue(user_burst=1, user_rate=0.1, guild_burst=5, guild_rate=0.1)
+    queue.take(1, 1)
+    with pytest.raises(RateLimited):
+        queue.take(1, 1)
+    queue.take(2, 1)
+    assert queue.pending == set()
+
+
+def test_admitted_jobs_skip_limits_and_size(clock):
+    async def scenario():
+        queue, order = AdmissionQueue(maxsize=1, workers=0, user_burst=1, user_rate=0.1), []
+        await queue.start()
+
+        def job(name):
+            async def run():
+                order.append(name)
+            return run
+
+        first, _ = queue.submit(1, 1, 0, job("nouvelle"), lambda: True)
+        # La validation d'un menu déjà admis passe malgré la limite de débit épuisée et la file pleine
+        future, position = queue.submit(1, 1, -1, job("validation"), lambda: True, admitted=True)
+        assert position == 0
+        queue.workers = 1
+        await queue.start()
+        await asyncio.gather(first, future)
+        assert order == ["validation", "nouvelle"]
+        await queue.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,46 @@
+from lynkr.choices import NO_SYNONYM, ChoiceMemory
+
+
+def memory(tmp_path, **kwargs) -> ChoiceMemory:
+    return ChoiceMemory(tmp_path / "choices.sqlite3", **kwargs)
+
+
+def test_rank_orders_by_choices_and_keeps_unchosen_order(tmp_path):
+    choices = memory(tmp_path)
+    choices.record([("bâtisse", "NOUN", "maison"), ("bâtisse", "NOUN", "maison"), ("bâtisse", "NOUN", "tour")])
+    assert choices.counts("bâtisse", "NOUN") == {"maison": 2, "tour": 1}
+    assert choices.rank("bâtisse", "NOUN", ["château", "tour", "demeure", "maison"]) == \
+        ("maison", "tour", "château", "demeure")
+    # Les choix sont propres à chaque catégorie grammaticale
+    assert choices.counts("bâtisse", "VERB") == {}
+
+
+def test_consensus_needs_count_and_share(tmp_path):
+    choices = memory(tmp_path, min_count=5, share=0.8)
+    choices.record([("logis", "NOUN", "maison")] * 4)
+    assert choices.consensus("logis", "NOUN") is None
+    choices.record([("logis", "NOUN", "maison")])
+    assert choices.consensus("logis", "NOUN") == "maison"
+    choices.record([("logis", "NOUN", "tour")] * 2)
+    # 5 choix sur 7 : la part du synonyme le plus choisi passe sous 80 %
+    assert choices.consensus("logis", "NOUN") is None
+
+
+def test_no_synonym_is_never_a_consensus(tmp_path):
+    choices = memory(tmp_path, min_count=2, share=0.5)
+    choices.record([("truc", "NOUN", None)] * 3)
+    assert choices.counts("truc", "NOUN") == {NO_SYNONYM: 3}
+    assert choices.consensus("truc", "NOUN") is None
+
+
+def test_choices_persist_across_instances(tmp_path):
+    memory(tmp_path).record([("logis", "NOUN", "maison")])
+    assert memory(tmp_path).counts("logis", "NOUN") == {"maison": 1}
+
+
+def test_generation_counts_recordings(tmp_path):
+    choices = memory(tmp_path)
+    choices.record([])
+    assert choices.generation == 0
+    choices.record([("logis", "NOUN", "maison"), ("bâtisse", "NOUN", "tour")])
+    assert choices.generation == 1
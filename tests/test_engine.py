@@ -0,0 +1,199 @@
+from functools import partial
+
+import pytest
+
+from lynkr import engine
+from lynkr.choices import ChoiceMemory
+
+LEXICONS = {"GRAMNUM": {"maison": "tyeh", "château": "kastel", "tour": "tur"},
+            "GRAMCONJ": {"être": "esta", "revoir": "viden", "voir": "vidar"},
+            "X": {"au": "a", "peut": "pod"}}
+
+
+class Morph(dict):
+    """Traits morphologiques d'un faux token, comme `Token.morph`."""
+
+    def to_dict(self) -> dict:
+        return dict(self)
+
+    def __str__(self) -> str:
+        return "|".join(f"{key}={value}" for key, value in self.items())
+
+
+class Underscore:
+    """Propriétés personnalisées d'un faux token, comme `Token._` une fois les extensions du moteur appliquées."""
+    GETTERS = {"lynkr_tag": engine.lynkr_tag_getter,
+               "lynkr_compatible_synonyms": engine.lynkr_compatible_synonyms_getter,
+               "lynkr_preferred_synonym": engine.lynkr_preferred_synonym_getter,
+               "lynkr_consensus_synonym": engine.lynkr_consensus_synonym_getter,
+               "lynkr_synonym_confidence": engine.lynkr_synonym_confidence_getter,
+               "lynkr_lemma_translation": engine.lynkr_lemma_translation_getter}
+
+    def __init__(self, token: "FakeToken") -> None:
+        self.token = token
+        self.lynkr_numeral = None
+        self.lynkr_applied_synonym = None
+        self.lynkr_vector_synonyms = None
+        self.lynkr_correction = None
+        self.get_lynkr_translation = partial(engine.lynkr_translation_method, token)
+
+    def __getattr__(self, name: str):
+        if name in self.GETTERS:
+            return self.GETTERS[name](self.token)
+        raise AttributeError(name)
+
+
+class FakeToken:
+    """Token Spacy réduit aux attributs lus par le moteur."""
+
+    def __init__(self, doc: "FakeDoc", i: int, text: str, lemma: str, pos: str, morph: dict) -> None:
+        self.doc, self.i, self.text, self.lemma_, self.pos_ = doc, i, text, lemma, pos
+        self.lower_ = text.lower()
+        self.shape_ = "".join("d" if c.isdigit() else "X" if c.isupper() else "x" if c.isalpha() else c for c in text)
+        self.morph = Morph(morph)
+        self._ = Underscore(self)
+
+    def nbor(self, i: int = 1) -> "FakeToken":
+        if not 0 <= self.i + i < len(self.doc):
+            raise IndexError(i)
+        return self.doc[self.i + i]
+
+
+class FakeDoc(list):
+    """Doc Spacy réduit à la liste de ses tokens."""
+
+    def __init__(self, *words: tuple) -> None:
+        super().__init__()
+        for text, lemma, pos, *morph in words:
+            self.append(FakeToken(self, len(self), text, lemma, pos, morph[0] if morph else {}))
+
+
+@pytest.fixture
+def resources(tmp_path, monkeypatch):
+    """Lexique, thésaurus et mémoire des choix du moteur remplacés par des ressources de test, sans CNRTL."""
+    monkeypatch.setattr(engine, "LYNKR_SERIES", {tag: dict(series) for tag, series in LEXICONS.items()})
+    monkeypatch.setattr(engine, "THESAURUS", {})
+    monkeypatch.setattr(engine, "CHOICES", ChoiceMemory(tmp_path / "choices.sqlite3"))
+    monkeypatch.setattr(engine, "CNRTL_FALLBACK", True)
+    lookups = []
+
+    def cnrtl_synonyms(lemma, directory):
+        lookups.append((lemma, directory))
+        return {("bâtisse", "substantif"): ("demeure", "château")}.get((lemma, directory), ())
+
+    monkeypatch.setattr(engine, "cnrtl_synonyms", cnrtl_synonyms)
+    return lookups
+
+
+def test_incompatible_synonym_falls_back_to_the_best_synonym(resources):
+    # Le voisin vectoriel "tour", proposé quand le CNRTL n'avait pas répondu à temps, ne fait plus partie des
+    # synonymes traduisibles une fois ceux du CNRTL en cache : le meilleur synonyme est utilisé à sa place
+    doc = FakeDoc(("Bâtisse", "bâtisse", "NOUN", {"Number": "Sing"}))
+    doc[0]._.lynkr_vector_synonyms = {"maison": 0.8, "tour": 0.6}
+    assert doc[0]._.lynkr_compatible_synonyms == ("château",)
+    translation, untranslated, synonymed, _ = engine.complete_translation_commun_to_lynkr(doc, {0: "tour"})
+    assert translation == "Tyeh"
+    assert untranslated == ()
+    assert synonymed == (("bâtisse", "maison", 0.8),)
+
+
+def test_incompatible_synonym_without_synonyms_is_left_untranslated(resources):
+    doc = FakeDoc(("logis", "logis", "NOUN", {"Number": "Sing"}))
+    translation, untranslated, synonymed, _ = engine.complete_translation_commun_to_lynkr(doc, {0: "tour"})
+    assert translation == "`logis`"
+    assert [record.status for record in untranslated] == ["untranslated"]
+    assert synonymed == ()
+
+
+@pytest.mark.parametrize("output, numeral", [("digits", "007"), ("words", "sept")])
+def test_numerals_keep_their_digits(resources, monkeypatch, output, numeral):
+    monkeypatch.setattr(engine, "NUMERAL_OUTPUT", output)
+    doc = engine.lynkr_numerals_component(FakeDoc(("007", "007", "NUM"), ("m", "mètre", "NOUN"), ("²", "²", "NUM")))
+    assert [token._.lynkr_numeral for token in doc] == [numeral, None, None]
+
+
+def translate(doc: FakeDoc, synonyms: dict = None) -> tuple:
+    records = list(engine.iter_lynkr_translation(doc, synonyms))
+    # Le générateur produit un enregistrement par token, dans l'ordre du doc
+    assert [record.text for record in records] == [token.text for token in doc]
+    return engine.translation_to_text([record.lynkr for record in records]), [record.status for record in records]
+
+
+def test_expressions_are_translated_as_a_block(resources):
+    assert translate(FakeDoc(("Peut", "pouvoir", "VERB"), ("-", "-", "PUNCT"), ("être", "être", "AUX"))) == \
+        ("Pyeséa", ["expression"] * 3)
+    assert translate(FakeDoc(("Au", "au", "ADP"), ("revoir", "revoir", "VERB"))) == \
+        ("Paers esperita", ["expression"] * 2)
+
+
+def test_expression_overlapping_a_synonymable_token_is_translated_word_by_word(resources, monkeypatch):
+    # Sans traduction, "revoir" nécessite un synonyme : l'expression n'est pas reconnue et "au" est traduit seul
+    del engine.LYNKR_SERIES["GRAMCONJ"]["revoir"]
+    monkeypatch.setattr(engine, "THESAURUS", {("revoir", "verbe"): ("voir",)})
+    doc = FakeDoc(("au", "au", "ADP"), ("revoir", "revoir", "VERB", {"Tense": "Pres"}))
+    assert translate(doc, {1: "voir"}) == ("a vida", ["translated", "synonym"])
+    assert translate(doc) == ("a `revoir`", ["translated", "untranslated"])
+
+
+def test_numeral_spans_are_translated_once(resources):
+    doc = engine.lynkr_numerals_component(FakeDoc(("vingt", "vingt", "NUM"), ("et", "et", "CCONJ"),
+                                                  ("un", "un", "NUM"), ("tours", "tour", "NOUN", {"Number": "Plur"})))
+    assert translate(doc) == ("21 turs", ["translated", "empty", "empty", "translated"])
+
+
+def test_request_budget_sets_the_deadline_of_the_request():
+    assert engine.remaining_time() is None and engine.APPROXIMATIONS.get() is None
+    with engine.request_budget(10) as approximations:
+        assert 0 < engine.remaining_time() <= 10
+        assert engine.APPROXIMATIONS.get() is approximations
+        with engine.request_budget(None):
+            assert engine.remaining_time() is None
+        assert engine.remaining_time() is not None
+    assert engine.remaining_time() is None and engine.APPROXIMATIONS.get() is None
+
+
+@pytest.mark.parametrize("error", [engine.DeadlineExceeded("CNRTL trop lent"), TimeoutError("CNRTL injoignable")])
+def test_cnrtl_lookup_out_of_budget_is_abandoned_once(monkeypatch, error):
+    calls = []
+
+    def cnrtl_synonyms(lemma, directory):
+        calls.append(lemma)
+        raise error
+
+    monkeypatch.setattr(engine, "cnrtl_synonyms", cnrtl_synonyms)
+    # Hors d'une requête du service, l'échec est remonté tel quel
+    with pytest.raises(type(error)):
+        engine.cnrtl_synonyms_within_budget("logis", "substantif")
+    with engine.request_budget(1) as approximations:
+        assert engine.cnrtl_synonyms_within_budget("logis", "substantif") == ()
+        assert engine.cnrtl_synonyms_within_budget("logis", "substantif") == ()
+    assert approximations.lookups == {("logis", "substantif")}
+    assert calls == ["logis", "logis"]
+
+
+def test_expired_deadline_falls_back_to_vector_neighbours(resources, monkeypatch):
+    def cnrtl_synonyms(lemma, directory):
+        raise engine.DeadlineExceeded(lemma)
+
+    monkeypatch.setattr(engine, "cnrtl_synonyms", cnrtl_synonyms)
+    doc = FakeDoc(("logis", "logis", "NOUN", {"Number": "Sing"}))
+    doc[0]._.lynkr_vector_synonyms = {"maison": 0.8}
+    with engine.request_budget(0):
+        translation, untranslated, synonymed, _ = engine.fast_translation_doc(doc)
+        assert engine.approximated_lemmas(untranslated, synonymed) == ("logis",)
+    assert (translation, synonymed) == ("tyeh", (("logis", "maison", 0.8),))
+
+
+def test_expired_deadline_ranks_by_choices_instead_of_context(resources, monkeypatch):
+    def get_nlp():
+        raise AssertionError("Le classement contextuel n'a plus le temps de charger le modèle")
+
+    monkeypatch.setattr(engine, "get_nlp", get_nlp)
+    monkeypatch.setattr(engine, "THESAURUS", {("logis", "substantif"): ("tour", "château")})
+    engine.CHOICES.record([("logis", "NOUN", "château")] * 2)
+    doc = FakeDoc(("logis", "logis", "NOUN", {"Number": "Sing"}), ("bâtisse", "bâtisse", "NOUN", {"Number": "Sing"}))
+    with engine.request_budget(0):
+        translation, untranslated, synonymed, _ = engine.fast_translation_doc(doc)
+        # Le synonyme préféré des utilisateurs est sûr ; le premier synonyme d'un mot jamais choisi est approximatif
+        assert engine.approximated_lemmas(untranslated, synonymed) == ("bâtisse",)
+    assert translation == "kastel kastel"
@@ -0,0 +1,45 @@
+import pytest
+
+from lynkr.express import SurfaceForm, express_analysis, load_surface_forms, plural_form, save_surface_forms, tokenize
+
+FORMS = {"je": SurfaceForm("je", "X", ""), "n'": SurfaceForm("ne", "PART", ""),
+         "abandonne": SurfaceForm("abandonner", "GRAMCONJ", "Pres"), "pas": SurfaceForm("pas", "PART", ""),
+         ".": SurfaceForm(".", "PUNCT", "")}
+
+
+@pytest.mark.parametrize("text, tokens", [
+    ("Au revoir et à bientôt.", ["Au", "revoir", "et", "à", "bientôt", "."]),
+    ("Je n'abandonne pas.", ["Je", "n'", "abandonne", "pas", "."]),
+    ("J’arrive !", ["J’", "arrive", "!"]),
+    ("Quoi ?!", ["Quoi", "?!"]),
+    ("Bonjour", ["Bonjour"]),
+])
+def test_tokenize(text, tokens):
+    assert tokenize(text) == tokens
+
+
+@pytest.mark.parametrize("text", [
+    "", " Bonjour", "Bonjour ", "Au  revoir", "peut-être", "J'ai 3 chats", "\"Bonjour\"", "(oui)", ".", "Bonjour\n",
+])
+def test_tokenize_rejects_uncertain_texts(text):
+    assert tokenize(text) is None
+
+
+def test_express_analysis_needs_every_token():
+    assert express_analysis("Je n'abandonne pas.", FORMS) == [("Je", FORMS["je"]), ("n'", FORMS["n'"]),
+                                                               ("abandonne", FORMS["abandonne"]),
+                                                               ("pas", FORMS["pas"]), (".", FORMS["."])]
+    assert express_analysis("Je n'abandonne jamais.", FORMS) is None
+
+
+@pytest.mark.parametrize("lemma, plural", [("chat", "chats"), ("nez", "nez"), ("cheval", "chevaux"),
+                                           ("château", "châteaux"), ("feu", "feux")])
+def test_plural_form(lemma, plural):
+    assert plural_form(lemma) == plural
+
+
+def test_surface_forms_round_trip(tmp_path):
+    path = tmp_path / "surface-forms.json.gz"
+    save_surface_forms(FORMS, "fr_core_news_lg-3.7.0", path)
+    assert load_surface_forms(path) == FORMS
+    assert load_surface_forms(tmp_path / "missing.json.gz") == {}
@@ -0,0 +1,59 @@
+import pytest
+
+from lynkr.fuzzy import ACCENT_CONFIDENCE, MAX_EDIT_DISTANCE, PREFIX_LENGTH, FuzzyIndex, deletes, edit_distance, \
+    fold_accents
+
+INDEX = FuzzyIndex([("abbaye", "abbaye", "GRAMNUM"), ("abandonner", "abandonner", "GRAMCONJ"),
+                    ("bientôt", "bientôt", "X"), ("chats", "chat", "GRAMNUM"), ("chat", "chat", "GRAMNUM"),
+                    ("constitution", "constitution", "GRAMNUM"), ("mare", "mare", "GRAMNUM"),
+                    ("mère", "mère", "GRAMNUM")])
+
+
+def test_fold_accents():
+    assert fold_accents("Bientôt Noël, garçon") == "bientot noel, garcon"
+
+
+@pytest.mark.parametrize("a, b, distance", [
+    ("chat", "chat", 0), ("chat", "chats", 1), ("chat", "chant", 1), ("chat", "caht", 1), ("abaye", "abbaye", 1),
+    ("abandoner", "abandonner", 1), ("chat", "chien", 3), ("", "ab", 2),
+])
+def test_edit_distance(a, b, distance):
+    assert edit_distance(a, b, limit=5) == distance
+
+
+def test_edit_distance_stops_past_limit():
+    assert edit_distance("constitutionnel", "constitution") == MAX_EDIT_DISTANCE + 1
+    assert edit_distance("chat", "chien", limit=1) == 2
+
+
+def test_deletes():
+    assert deletes("abc", 1) == {"abc", "bc", "ac", "ab"}
+    assert deletes("abc", 2) == {"abc", "bc", "ac", "ab", "a", "b", "c"}
+    # Seul le préfixe des mots longs est indexé
+    assert all(len(variant) <= PREFIX_LENGTH for variant in deletes("constitutionnel"))
+
+
+def test_correct_typos():
+    assert INDEX.correct("abaye", "GRAMNUM") == ("abbaye", "abbaye", pytest.approx(0.8))
+    assert INDEX.correct("abandoner", "GRAMCONJ") == ("abandonner", "abandonner", pytest.approx(8 / 9))
+    # Une forme fléchie est corrigée vers son lemme
+    assert INDEX.correct("chts", "GRAMNUM").lemma == "chat"
+
+
+def test_correct_accents_only():
+    assert INDEX.correct("bientot", "X") == ("bientôt", "bientôt", ACCENT_CONFIDENCE)
+    assert INDEX.correct("Bientôt", "X") == ("bientôt", "bientôt", 1.0)
+
+
+def test_correct_respects_tag():
+    assert INDEX.correct("abaye", "X") is None
+
+
+def test_correct_refuses_ties():
+    # "mre" est à une suppression de "mare" comme de "mère" (sans accents)
+    assert INDEX.correct("mre", "GRAMNUM") is None
+
+
+def test_correct_refuses_words_beyond_max_distance():
+    assert INDEX.correct("constitutionnel", "GRAMNUM") is None
+    assert INDEX.correct("constitutio", "GRAMNUM").lemma == "constitution"
@@ -0,0 +1,89 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+from lynkr import lexicon
+from lynkr.lexicon import MAIN_FOLDER, Lexicon, compile_lexicon, load_lexicons, map_lexicon, validate_lexicon
+
+
+def write_csv(path, rows, columns="lemma,lynkr"):
+    path.write_text("\n".join([columns, *rows]) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return {"GRAMNUM": write_csv(tmp_path / "gramnum.csv", ["maison,hus", "chat,kat", "été,sumar"]),
+            "X": write_csv(tmp_path / "x.csv", ["bientôt,myetjha", "le,"])}
+
+
+def test_lexicon_lookup():
+    series = Lexicon([("maison", "hus"), ("chat", "kat")])
+    assert list(series) == ["chat", "maison"]
+    assert "chat" in series and "chien" not in series
+    assert series["maison"] == "hus"
+    with pytest.raises(KeyError):
+        series["chien"]
+
+
+def test_compiled_lexicon_matches_csv(paths, tmp_path):
+    artifact = tmp_path / "lexicon.bin"
+    assert compile_lexicon(paths, artifact) == {"GRAMNUM": 3, "X": 2}
+    mapped = map_lexicon(artifact, paths)
+    for tag, path in paths.items():
+        expected = Lexicon.from_csv(path)
+        assert list(mapped[tag].lemmas) == list(expected.lemmas)
+        assert list(mapped[tag].translations) == list(expected.translations)
+    assert mapped["GRAMNUM"]["été"] == "sumar"
+    assert mapped["X"]["le"] == ""
+
+
+def test_compiled_lexicon_skips_hash_when_sources_unchanged(paths, tmp_path, monkeypatch):
+    artifact = tmp_path / "lexicon.bin"
+    compile_lexicon(paths, artifact)
+
+    def fail(_):
+        raise AssertionError("sources hashed although unchanged")
+
+    monkeypatch.setattr(lexicon, "lexicon_sources_hash", fail)
+    assert map_lexicon(artifact, paths)["GRAMNUM"]["chat"] == "kat"
+
+
+def test_touched_but_unchanged_sources_are_accepted(paths, tmp_path):
+    artifact = tmp_path / "lexicon.bin"
+    compile_lexicon(paths, artifact)
+    stat = paths["X"].stat()
+    os.utime(paths["X"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert map_lexicon(artifact, paths)["X"]["bientôt"] == "myetjha"
+
+
+def test_stale_compiled_lexicon_falls_back_to_csv(paths, tmp_path):
+    artifact = tmp_path / "lexicon.bin"
+    compile_lexicon(paths, artifact)
+    write_csv(paths["X"], ["bientôt,myetjha", "le,", "hier,yhar"])
+    with pytest.raises(ValueError):
+        map_lexicon(artifact, paths)
+    assert load_lexicons(paths, artifact)["X"]["hier"] == "yhar"
+
+
+def test_validate_lexicon(tmp_path):
+    path = write_csv(tmp_path / "verbs.csv", ["aimer,amars", "aimer,amars", ",vide", "être,", "voir,vid"])
+    errors, warnings = validate_lexicon("GRAMCONJ", path)
+    assert errors == ['verbs.csv:3 : "aimer" déjà défini ligne 2', "verbs.csv:4 : lemme vide"]
+    assert warnings == ['verbs.csv:5 : "être" a une traduction vide et sera omis des traductions',
+                        'verbs.csv:6 : "voir" → "vid" ne peut pas être conjugué']
+
+
+def test_validate_lexicon_reports_missing_columns(tmp_path):
+    path = write_csv(tmp_path / "broken.csv", ["maison"], columns="lemma")
+    assert validate_lexicon("GRAMNUM", path) == (["broken.csv : colonnes manquantes lynkr"], [])
+
+
+def test_check_validates_repository_lexicon_without_compiling(tmp_path):
+    output = tmp_path / "lexicon.bin"
+    result = subprocess.run([sys.executable, "-m", "lynkr.lexicon", "--check", "--output", str(output)],
+                            cwd=MAIN_FOLDER, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert not output.exists()
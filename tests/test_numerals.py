@@ -0,0 +1,43 @@
+import pytest
+
+from lynkr.numerals import number_to_words, numeral_spans, numeral_words, words_to_number
+
+
+@pytest.mark.parametrize("number, words", [
+    (0, "zéro"), (16, "seize"), (17, "dix-sept"), (21, "vingt et un"), (71, "soixante et onze"),
+    (72, "soixante-douze"), (80, "quatre-vingts"), (81, "quatre-vingt-un"), (99, "quatre-vingt-dix-neuf"),
+    (100, "cent"), (200, "deux cents"), (201, "deux cent un"), (1000, "mille"), (80000, "quatre-vingt mille"),
+    (2000000, "deux millions"), (1000000001, "un milliard un"),
+])
+def test_number_to_words(number, words):
+    assert number_to_words(number) == words
+
+
+@pytest.mark.parametrize("number", [0, 1, 17, 21, 70, 71, 80, 91, 100, 180, 200, 999, 1001, 21000, 1234567])
+def test_words_to_number_inverts_number_to_words(number):
+    assert words_to_number(numeral_words(number_to_words(number))) == number
+
+
+def test_numeral_words_rejects_other_words():
+    assert numeral_words("trente-quatre") == ["trente", "quatre"]
+    assert numeral_words("trente-chats") is None
+
+
+def test_numeral_spans_groups_consecutive_tokens():
+    texts = ["J'", "ai", "vingt", "et", "un", "chats", "et", "42", "chiens"]
+    is_num = [False, False, True, False, True, False, False, True, False]
+    assert numeral_spans(texts, is_num) == [(2, 5, 21), (7, 8, 42)]
+
+
+def test_numeral_spans_shortens_invalid_numbers():
+    # "deux trois" ne s'écrit pas ainsi : seul "deux" est retenu, puis "trois" forme son propre nombre
+    assert numeral_spans(["deux", "trois"], [True, True]) == [(0, 1, 2), (1, 2, 3)]
+
+
+def test_numeral_spans_ignores_untagged_tokens():
+    assert numeral_spans(["un", "chat"], [False, False]) == []
+
+
+def test_numeral_spans_needs_decimal_digits():
+    # Les exposants et chiffres cerclés vérifient `str.isdigit`, mais `int` ne sait pas les convertir
+    assert numeral_spans(["m", "²", "①", "007"], [False, True, True, True]) == [(3, 4, 7)]
@@ -0,0 +1,32 @@
+from lynkr.lexicon import Lexicon, lexicon_lemmas_hash
+from lynkr.thesaurus import build_thesaurus, load_thesaurus, save_thesaurus
+
+LEXICONS = {"GRAMNUM": Lexicon([("maison", "hus"), ("chat", "kat")]),
+            "X": Lexicon([("bientôt", "myetjha")])}
+
+
+def fetch(lemma, directory):
+    return {("maison", "substantif"): ("demeure", "logis", "maison"),
+            ("bientôt", "adverbe"): ("prochainement",)}.get((lemma, directory), ())
+
+
+def test_build_thesaurus_inverts_synonyms():
+    thesaurus = build_thesaurus({tag: lexicon.index for tag, lexicon in LEXICONS.items()}, fetch)
+    assert thesaurus["substantif"] == {"demeure": ["maison"], "logis": ["maison"]}
+    assert thesaurus["adverbe"] == {"prochainement": ["bientôt"]}
+
+
+def test_load_thesaurus_checks_lexicon_hash(tmp_path):
+    path = tmp_path / "thesaurus.json.gz"
+    thesaurus = build_thesaurus({tag: lexicon.index for tag, lexicon in LEXICONS.items()}, fetch)
+    save_thesaurus(thesaurus, lexicon_lemmas_hash(LEXICONS), path)
+
+    assert load_thesaurus(path, lexicon_lemmas_hash(LEXICONS))[("logis", "substantif")] == ("maison",)
+    changed = dict(LEXICONS, X=Lexicon([("bientôt", "myetjha"), ("hier", "yhar")]))
+    assert load_thesaurus(path, lexicon_lemmas_hash(changed)) == {}
+    assert load_thesaurus(tmp_path / "missing.json.gz") == {}
+
+
+def test_lexicon_lemmas_hash_ignores_translations():
+    retranslated = dict(LEXICONS, GRAMNUM=Lexicon([("maison", "huss"), ("chat", "kat")]))
+    assert lexicon_lemmas_hash(retranslated) == lexicon_lemmas_hash(LEXICONS)
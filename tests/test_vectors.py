@@ -0,0 +1,21 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from lynkr.vectors import VectorIndex, load_vector_indexes, save_vector_index  # noqa: E402
+
+
+def index() -> VectorIndex:
+    return VectorIndex(("chat", "maison"), np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32))
+
+
+def test_nearest_orders_by_similarity_and_applies_threshold():
+    neighbours = index().nearest(np.array([[0.9, 0.1], [0.0, 0.0]], dtype=np.float32), k=2, threshold=0.5)
+    assert [lemma for lemma, _ in neighbours[0]] == ["chat"]
+    assert neighbours[1] == []
+
+
+def test_load_vector_indexes_checks_lexicon_hash(tmp_path):
+    save_vector_index("GRAMNUM", index(), "abc", tmp_path)
+    assert load_vector_indexes(tmp_path, "abc")["GRAMNUM"].lemmas == ("chat", "maison")
+    assert load_vector_indexes(tmp_path, "def") == {}
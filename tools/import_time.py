@@ -0,0 +1,67 @@
+import re
+import sys
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import List
+
+# Chemin vers le dossier principal du projet, d'où les modules sont importés
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+
+# Ligne de `-X importtime` : durée propre, durée cumulée (en microsecondes) et module importé
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def cold_import_time(module: str) -> int:
+    """Fonction pour mesurer la durée d'import d'un module dans un processus neuf, avec `-X importtime`.
+
+    :param module: Le nom du module à importer.
+    :return: La durée cumulée de l'import du module et de ses dépendances, en microsecondes.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=MAIN_FOLDER,
+                            capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is not None and match.group(3) == " " and match.group(4) == module:
+            return int(match.group(2))
+    raise ValueError(f"{module} does not appear in the import time report")
+
+
+def first_use_time() -> float:
+    """Fonction pour mesurer, dans un processus neuf, la durée du chargement des ressources du moteur de traduction.
+
+    :return: La durée de `engine.load()`, en secondes.
+    """
+    code = "import time; from lynkr import engine; t = time.perf_counter(); engine.load(); " \
+           "print(time.perf_counter() - t)"
+    return float(subprocess.run([sys.executable, "-c", code], cwd=MAIN_FOLDER, capture_output=True, text=True,
+                                check=True).stdout)
+
+
+def measure(modules: List[str], repeat: int) -> None:
+    """Fonction pour afficher la durée médiane d'import à froid de chaque module.
+
+    :param modules: Les noms des modules à importer.
+    :param repeat: Le nombre de processus neufs par module.
+    """
+    for module in modules:
+        try:
+            times = [cold_import_time(module) for _ in range(repeat)]
+        except (subprocess.CalledProcessError, ValueError) as error:
+            print(f"{module:<24} import impossible : {error}")
+            continue
+        print(f"{module:<24} {statistics.median(times) / 1000:8.1f} ms (médiane de {repeat})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mesure la durée d'import à froid des modules du bot.")
+    parser.add_argument("modules", nargs="*", default=["lynkr", "lynkr.engine", "lynkr.client", "cogs.lynkr"],
+                        help="modules à importer")
+    parser.add_argument("--repeat", type=int, default=5, help="nombre de processus neufs par module")
+    parser.add_argument("--first-use", action="store_true", help="mesurer aussi le chargement des ressources")
+    arguments = parser.parse_args()
+
+    measure(arguments.modules, arguments.repeat)
+    if arguments.first_use:
+        print(f"{'engine.load()':<24} {first_use_time() * 1000:8.1f} ms")
@@ -0,0 +1,401 @@
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+from pathlib import Path
+from datetime import datetime, timezone
+from collections import Counter, defaultdict
+from typing import List, Optional
+
+from aiohttp import web
+
+# Chemin vers le dossier principal du projet, pour importer les cogs et le moteur de traduction
+MAIN_FOLDER = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(MAIN_FOLDER))
+
+from cogs.commun import Commun  # noqa: E402
+from cogs.institution import Institution  # noqa: E402
+from cogs.lynkr import Lynkr  # noqa: E402
+from lynkr.admission import AdmissionQueue  # noqa: E402
+from lynkr.client import LynkrClient  # noqa: E402
+
+# Textes envoyés par les utilisateurs simulés
+TEXTS = ("Bonjour, je suis heureux de te revoir.",
+         "Peut-être que nous irons à la bibliothèque demain.",
+         "Les anciens gardaient deux cent trente-quatre livres dans la tour.",
+         "Il ne faut pas oublier le mantra du codex.",
+         "Au revoir, et merci pour ton aide précieuse !",
+         "Le voyageur regardait la mer sombre pendant des heures.")
+
+# Mantras envoyés à la commande `/codex`, dont un seul est correct
+MANTRAS = ("codegam minada", "Codegam  Minada", "lynkr", "mantra")
+
+# Réponses refusant une commande sans la traiter, reconnues à un extrait de leur texte, et leur colonne dans le rapport
+REJECTIONS = (("Il te faut le rôle", "rôle"), ("Tu as demandé trop de traductions", "débit"),
+              ("traductions sont déjà en attente", "file"))
+
+
+class FakeRole:
+    """Rôle Discord simulé."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.members = []
+        self.mention = f"@{name}"
+
+
+class FakeGuild:
+    """Serveur Discord simulé."""
+
+    def __init__(self, guild_id: int, roles: List[FakeRole]) -> None:
+        self.id = guild_id
+        self.name = f"guild-{guild_id}"
+        self.roles = roles
+        self.members = []
+
+    def get_member(self, member_id: int) -> Optional["FakeMember"]:
+        return next((member for member in self.members if member.id == member_id), None)
+
+
+class FakeMember:
+    """Membre Discord simulé."""
+
+    def __init__(self, member_id: int, guild: FakeGuild) -> None:
+        self.id = member_id
+        self.name = f"user-{member_id}"
+        self.mention = f"@{self.name}"
+        self.guild = guild
+        guild.members.append(self)
+
+    async def add_roles(self, *roles: FakeRole) -> None:
+        for role in roles:
+            if self not in role.members:
+                role.members.append(self)
+
+
+class FakeResponse:
+    """Réponse d'interaction simulée, enregistrant l'instant de chaque accusé de réception."""
+
+    def __init__(self, interaction: "FakeInteraction") -> None:
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self) -> bool:
+        return self.done
+
+    async def defer(self, **kwargs) -> None:
+        self.done = True
+        self.interaction.record("defer")
+
+    async def send_message(self, content: Optional[str] = None, **kwargs) -> None:
+        self.done = True
+        self.interaction.record("send_message", content=content, **kwargs)
+
+    async def edit_message(self, **kwargs) -> None:
+        self.done = True
+        self.interaction.record("edit_message", **kwargs)
+
+
+class FakeFollowup:
+    """Webhook de suivi d'interaction simulé."""
+
+    def __init__(self, interaction: "FakeInteraction") -> None:
+        self.interaction = interaction
+
+    async def send(self, content: Optional[str] = None, **kwargs) -> None:
+        self.interaction.record("followup", content=content, **kwargs)
+
+
+class FakeInteraction:
+    """Interaction Discord simulée, horodatant les réponses que lui envoient les cogs.
+
+    :param user: Le membre à l'origine de l'interaction.
+    :type user: FakeMember
+    :param events: Les réponses envoyées, sous la forme (type, instant, arguments).
+    :type events: list
+    """
+
+    def __init__(self, user: FakeMember) -> None:
+        self.user = user
+        self.guild = user.guild
+        self.created_at = datetime.now(timezone.utc)
+        self.started = time.perf_counter()
+        self.events = []
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+
+    def record(self, kind: str, **kwargs) -> None:
+        self.events.append((kind, time.perf_counter(), kwargs))
+
+    async def edit_original_response(self, **kwargs) -> None:
+        self.record("edit_original_response", **kwargs)
+
+    def first(self, kind: str) -> Optional[float]:
+        return next((instant - self.started for event, instant, _ in self.events if event == kind), None)
+
+    def last(self) -> Optional[float]:
+        return self.events[-1][1] - self.started if self.events else None
+
+    def view(self):
+        return next((kwargs.get("view") for _, _, kwargs in self.events if kwargs.get("view") is not None), None)
+
+    def rejection(self) -> Optional[str]:
+        contents = [kwargs.get("content") or "" for _, _, kwargs in self.events]
+        return next((column for extract, column in REJECTIONS if any(extract in content for content in contents)),
+                    None)
+
+
+class Metrics:
+    """Mesures collectées pendant une simulation.
+
+    Les latences ne portent que sur les commandes servies : les refus immédiats (rôle manquant, limite de débit
+    atteinte, file pleine) sont comptés à part.
+    """
+
+    def __init__(self) -> None:
+        self.latencies = defaultdict(list)
+        self.defers = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.rejections = defaultdict(Counter)
+        self.loop_lags = []
+
+    def add(self, scenario: str, interaction: FakeInteraction) -> None:
+        if interaction.first("defer") is not None:
+            self.defers[scenario].append(interaction.first("defer"))
+        rejection = interaction.rejection()
+        if rejection is not None:
+            self.rejections[scenario][rejection] += 1
+        elif interaction.last() is not None:
+            self.latencies[scenario].append(interaction.last())
+
+    def report(self) -> str:
+        columns = [column for _, column in REJECTIONS]
+        lines = [f"{'scénario':<10} {'n':>5} {'err':>4} " + "".join(f"{column:>6} " for column in columns) +
+                 f"{'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} {'defer p50':>10} {'defer p99':>10}"]
+        for scenario in sorted(self.latencies.keys() | self.errors.keys() | self.rejections.keys()):
+            latencies, defers = self.latencies[scenario], self.defers[scenario]
+            lines.append(f"{scenario:<10} {len(latencies):>5} {self.errors[scenario]:>4} "
+                         + "".join(f"{self.rejections[scenario][column]:>6} " for column in columns) +
+                         f"{percentile(latencies, 50):>8.3f} {percentile(latencies, 90):>8.3f} "
+                         f"{percentile(latencies, 99):>8.3f} {percentile(latencies, 100):>8.3f} "
+                         f"{percentile(defers, 50):>10.4f} {percentile(defers, 99):>10.4f}")
+        lines.append(f"retard de la boucle d'événements : p50 {percentile(self.loop_lags, 50) * 1000:.1f} ms, "
+                     f"p99 {percentile(self.loop_lags, 99) * 1000:.1f} ms, "
+                     f"max {percentile(self.loop_lags, 100) * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Fonction pour obtenir un centile par la méthode du rang le plus proche.
+
+    :param values: Les valeurs mesurées.
+    :param q: Le centile souhaité, entre 0 et 100.
+    :return: Le centile des valeurs, ou `nan` s'il n'y a aucune valeur.
+    """
+    if len(values) == 0:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+async def monitor_loop_lag(metrics: Metrics, interval: float = 0.01) -> None:
+    """Mesure en continu le retard de réveil de la boucle d'événements.
+
+    :param metrics: Les mesures de la simulation.
+    :param interval: L'intervalle entre deux mesures, en secondes.
+    """
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        metrics.loop_lags.append(max(0.0, time.perf_counter() - started - interval))
+
+
+def create_cnrtl_app(synonyms: List[str], latency: float) -> web.Application:
+    """Crée un faux site du CNRTL, renvoyant quelques synonymes après une latence donnée.
+
+    :param synonyms: Les mots parmi lesquels les synonymes sont tirés.
+    :param latency: La latence de chaque page, en secondes.
+    :return: L'application web du faux CNRTL.
+    """
+    async def synonym_page(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        rng = random.Random(request.match_info["lemma"])
+        cells = "".join(f'<td class="syno_format"><a href="#">{word}</a></td>'
+                        for word in rng.sample(synonyms, min(4, len(synonyms))))
+        return web.Response(text=f"<html><body><table><tr>{cells}</tr></table></body></html>",
+                            content_type="text/html")
+
+    app = web.Application()
+    app.add_routes([web.get("/synonymie/{lemma}/{directory:.*}", synonym_page)])
+    return app
+
+
+async def start_site(app: web.Application) -> tuple:
+    """Démarre une application web sur un port local libre.
+
+    :param app: L'application web à démarrer.
+    :return: Le runner de l'application et son adresse.
+    """
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    host, port = runner.addresses[0][:2]
+    return runner, f"http://{host}:{port}"
+
+
+def choose_option(select, value: str) -> None:
+    """Sélectionne une option d'un menu déroulant, comme si l'utilisateur l'avait choisie.
+
+    discord.py ne remplit `Select.values` qu'à partir des données d'une vraie interaction et n'offre pas de moyen
+    public de le faire : c'est la seule écriture dans un attribut privé de discord.py du simulateur.
+
+    :param select: Le menu déroulant.
+    :param value: La valeur de l'option choisie.
+    """
+    select._values = [value]
+
+
+async def fastlynkr_user(cog: Lynkr, member: FakeMember, rng: random.Random, metrics: Metrics) -> None:
+    """Utilisateur envoyant une commande `/fastlynkr`."""
+    interaction = FakeInteraction(member)
+    await cog.fast_lynkr_slash.callback(cog, interaction, rng.choice(TEXTS))
+    metrics.add("fastlynkr", interaction)
+
+
+async def lynkr_user(cog: Lynkr, member: FakeMember, rng: random.Random, metrics: Metrics) -> None:
+    """Utilisateur envoyant une commande `/lynkr`, puis validant un synonyme à chaque étape du menu."""
+    interaction = FakeInteraction(member)
+    await cog.lynkr_slash.callback(cog, interaction, rng.choice(TEXTS))
+
+    # Cliquer sur le bouton de validation jusqu'à la fin du menu
+    view = interaction.view()
+    if view is not None:
+        select, button = view.children
+        while not button.disabled:
+            await asyncio.sleep(rng.uniform(0.0, 0.2))
+            choose_option(select, rng.choice(select.options).value)
+            await select.callback(FakeInteraction(member))
+            click = FakeInteraction(member)
+            click.started = interaction.started
+            await button.callback(click)
+            interaction.events.extend(click.events)
+    metrics.add("lynkr", interaction)
+
+
+async def commun_user(cog: Commun, member: FakeMember, rng: random.Random, metrics: Metrics) -> None:
+    """Utilisateur envoyant une commande `/commun`."""
+    interaction = FakeInteraction(member)
+    await cog.commun_slash.callback(cog, interaction, rng.choice(TEXTS))
+    metrics.add("commun", interaction)
+
+
+async def codex_user(cog: Institution, member: FakeMember, rng: random.Random, metrics: Metrics) -> None:
+    """Utilisateur envoyant une commande `/codex`."""
+    interaction = FakeInteraction(member)
+    await cog.slash_codex.callback(cog, interaction, rng.choice(MANTRAS))
+    metrics.add("codex", interaction)
+
+
+async def simulate(arguments: argparse.Namespace) -> Metrics:
+    """Simule des utilisateurs concurrents utilisant les commandes des cogs.
+
+    :param arguments: Les paramètres de la simulation.
+    :return: Les mesures de la simulation.
+    """
+    metrics, runners = Metrics(), []
+    rng = random.Random(arguments.seed)
+
+    # Démarrer le service de traduction dans ce processus, branché sur un faux CNRTL, sauf si un service est fourni
+    service_url = arguments.service_url
+    if service_url is None:
+        from lynkr import engine, service
+
+        # Charger le modèle avant la simulation, pour ne pas compter son chargement dans les premières latences
+        engine.load()
+        runner, cnrtl_url = await start_site(create_cnrtl_app(list(engine.get_lexicons()["GRAMNUM"].index[:200]),
+                                                              arguments.cnrtl_latency))
+        runners.append(runner)
+        engine.CNRTL_URL = f"{cnrtl_url}/synonymie"
+        # Le recours au CNRTL, désactivé par défaut, est activé pour charger aussi le faux CNRTL
+        engine.CNRTL_FALLBACK = True
+        runner, service_url = await start_site(service.create_app(arguments.workers,
+                                                                  budget=arguments.budget or None))
+        runners.append(runner)
+
+    # Construire les cogs et les serveurs simulés, entre lesquels les membres sont répartis ; seuls les scénarios
+    # comprenant `/codex` laissent la moitié des membres sans le rôle `Codex`, pour que la commande ait des rôles à
+    # donner
+    guilds = [FakeGuild(i, [FakeRole("Codex")]) for i in range(max(1, arguments.guilds))]
+    members = [FakeMember(i, guilds[i % len(guilds)]) for i in range(arguments.users)]
+    for member in members[::2] if arguments.scenario in ("codex", "mixed") else members:
+        member.guild.roles[0].members.append(member)
+    lynkr_cog, institution_cog, commun_cog = Lynkr(None), Institution(None), Commun(None)
+    lynkr_cog.client = LynkrClient(url=service_url, timeout=arguments.timeout)
+    lynkr_cog.queue = AdmissionQueue(maxsize=arguments.queue_size, workers=arguments.queue_workers,
+                                     user_burst=arguments.user_burst, user_rate=arguments.user_rate,
+                                     guild_burst=arguments.guild_burst, guild_rate=arguments.guild_rate)
+    await lynkr_cog.cog_load()
+
+    users = {"fastlynkr": lambda member: fastlynkr_user(lynkr_cog, member, rng, metrics),
+             "lynkr": lambda member: lynkr_user(lynkr_cog, member, rng, metrics),
+             "codex": lambda member: codex_user(institution_cog, member, rng, metrics),
+             "commun": lambda member: commun_user(commun_cog, member, rng, metrics)}
+    scenarios = list(users) if arguments.scenario == "mixed" else [arguments.scenario]
+
+    async def run_user(member: FakeMember) -> None:
+        # Les membres arrivent au hasard dans la fenêtre de montée en charge
+        await asyncio.sleep(rng.uniform(0, arguments.ramp_up))
+        for _ in range(arguments.requests):
+            scenario = rng.choice(scenarios)
+            try:
+                await users[scenario](member)
+            except Exception as error:
+                metrics.errors[scenario] += 1
+                print(f"{scenario} : {error!r}", file=sys.stderr)
+            await asyncio.sleep(rng.expovariate(1 / arguments.think_time) if arguments.think_time > 0 else 0)
+
+    monitor = asyncio.create_task(monitor_loop_lag(metrics))
+    try:
+        await asyncio.gather(*(run_user(member) for member in members))
+    finally:
+        monitor.cancel()
+        await lynkr_cog.cog_unload()
+        for runner in runners:
+            await runner.cleanup()
+    return metrics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simule des utilisateurs concurrents des cogs de Firjtyehm.")
+    parser.add_argument("--scenario", choices=("fastlynkr", "lynkr", "codex", "commun", "mixed"), default="mixed")
+    parser.add_argument("--users", type=int, default=50, help="nombre d'utilisateurs simultanés")
+    parser.add_argument("--guilds", type=int, default=5, help="nombre de serveurs entre lesquels ils sont répartis")
+    parser.add_argument("--requests", type=int, default=3, help="nombre de commandes par utilisateur")
+    parser.add_argument("--think-time", type=float, default=1.0, help="pause moyenne entre deux commandes (s)")
+    parser.add_argument("--ramp-up", type=float, default=2.0, help="fenêtre d'arrivée des utilisateurs (s)")
+    parser.add_argument("--cnrtl-latency", type=float, default=0.3, help="latence du faux CNRTL (s)")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("LYNKR_SERVICE_WORKERS", "4")),
+                        help="traductions traitées en parallèle par le service")
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="durée des recherches de synonymes par requête du service (s), illimitée si nulle")
+    parser.add_argument("--queue-size", type=int, default=int(os.getenv("LYNKR_QUEUE_SIZE", "100")),
+                        help="traductions en attente dans la file du bot")
+    parser.add_argument("--queue-workers", type=int, default=int(os.getenv("LYNKR_QUEUE_WORKERS", "4")),
+                        help="traductions de la file du bot exécutées en parallèle")
+    parser.add_argument("--user-burst", type=float, default=float(os.getenv("LYNKR_USER_BURST", "3")),
+                        help="traductions qu'un utilisateur peut enchaîner")
+    parser.add_argument("--user-rate", type=float, default=float(os.getenv("LYNKR_USER_RATE", "0.05")),
+                        help="traductions regagnées par seconde par un utilisateur")
+    parser.add_argument("--guild-burst", type=float, default=float(os.getenv("LYNKR_GUILD_BURST", "20")),
+                        help="traductions qu'un serveur peut enchaîner")
+    parser.add_argument("--guild-rate", type=float, default=float(os.getenv("LYNKR_GUILD_RATE", "0.5")),
+                        help="traductions regagnées par seconde par un serveur")
+    parser.add_argument("--service-url", default=None, help="service de traduction existant à utiliser")
+    parser.add_argument("--timeout", type=float, default=60.0, help="délai maximal d'une requête au service (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    started = time.perf_counter()
+    results = asyncio.run(simulate(parser.parse_args()))
+    print(results.report())
+    print(f"durée totale : {time.perf_counter() - started:.1f} s")